@@ -156,7 +156,7 @@ def _print_terminal_report(
                     ImpactLevel.MEDIUM: "yellow",
                     ImpactLevel.LOW: "green",
                 }.get(level, "dim")
-                impact_str = f"[{style}]{level.value}[/{style}]"
+                impact_str = f"[{style}]{level.label}[/{style}]"
 
             name = entry.name
             if entry.is_deprecated:
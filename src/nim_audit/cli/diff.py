@@ -86,8 +86,8 @@ def diff_cmd(
     entries = report.entries
     if category:
         try:
-            cat = ChangeCategory(category)
-            entries = [e for e in entries if e.category == cat]
+            cat = ChangeCategory.parse(category)
+            entries = tuple(e for e in entries if e.category == cat)
         except ValueError:
             console.print(f"[red]Error:[/red] Invalid category: {category}")
             raise typer.Exit(1)
@@ -168,15 +168,15 @@ def _print_terminal_report(report, entries, breaking_only: bool) -> None:
                 "added": "green",
                 "removed": "red",
                 "modified": "yellow",
-            }.get(entry.change_type.value, "white")
+            }.get(entry.change_type.label, "white")
 
             severity_marker = ""
-            if entry.severity == Severity.BREAKING:
+            if entry.severity is Severity.BREAKING:
                 severity_marker = " [bold red]![/bold red]"
 
             table.add_row(
-                entry.category.value,
-                f"[{type_style}]{entry.change_type.value}[/{type_style}]{severity_marker}",
+                entry.category.label,
+                f"[{type_style}]{entry.change_type.label}[/{type_style}]{severity_marker}",
                 entry.path,
                 entry.old_value or "-",
                 entry.new_value or "-",
@@ -242,7 +242,7 @@ def _generate_markdown(report) -> str:
         old = old.replace("|", "\\|")[:50]
         new = new.replace("|", "\\|")[:50]
         lines.append(
-            f"| {entry.category.value} | {entry.change_type.value} | "
+            f"| {entry.category.label} | {entry.change_type.label} | "
             f"`{entry.path}` | {old} | {new} |"
         )
 
@@ -145,9 +145,9 @@ def _print_lint_report(result, env_file: Path) -> None:
     table = Table(title="Summary", show_header=False)
     table.add_column("Metric", style="bold")
     table.add_column("Count")
-    table.add_row("Failures", f"[red]{result.counts.get('fail', 0)}[/red]")
-    table.add_row("Warnings", f"[yellow]{result.counts.get('warn', 0)}[/yellow]")
-    table.add_row("Info", f"[blue]{result.counts.get('info', 0)}[/blue]")
+    table.add_row("Failures", f"[red]{result.counts[Severity.FAIL]}[/red]")
+    table.add_row("Warnings", f"[yellow]{result.counts[Severity.WARN]}[/yellow]")
+    table.add_row("Info", f"[blue]{result.counts[Severity.INFO]}[/blue]")
     console.print(table)
 
     # Findings
@@ -251,7 +251,7 @@ def describe(
                 console.print()
                 console.print("[bold]Affects[/bold]")
                 for a in entry.affects:
-                    console.print(f"  - {a.metric.value}: {a.impact.value}")
+                    console.print(f"  - {a.metric.label}: {a.impact.value}")
 
             # Failure modes
             if entry.failure_modes:
@@ -372,14 +372,14 @@ def _print_diff_report(env_diff, old_env: Path, new_env: Path) -> None:
     if env_diff.added:
         console.print()
         console.print("[bold green]Added Variables[/bold green]")
-        for var in env_diff.added:
+        for var in sorted(env_diff.added):
             console.print(f"  [green]+[/green] {var}")
 
     # Removed
     if env_diff.removed:
         console.print()
         console.print("[bold red]Removed Variables[/bold red]")
-        for var in env_diff.removed:
+        for var in sorted(env_diff.removed):
             console.print(f"  [red]-[/red] {var}")
 
     # Changed
@@ -456,7 +456,7 @@ def registry_list(
         table.add_column("Affects")
 
         for entry in sorted(reg.entries.values(), key=lambda e: e.name):
-            affects_str = ", ".join(f"{a.metric.value}:{a.impact.value}" for a in entry.affects)
+            affects_str = ", ".join(f"{a.metric.label}:{a.impact.value}" for a in entry.affects)
             table.add_row(
                 entry.name,
                 entry.type or "-",
@@ -193,7 +193,7 @@ def _print_terminal_report(fingerprint) -> None:
             f"{resp.latency_ms:.1f}",
             str(resp.tokens_in),
             str(resp.tokens_out),
-            resp.response_hash or "-",
+            resp.response_hash.hex() if resp.response_hash else "-",
         )
 
     console.print(table)
@@ -84,12 +84,8 @@ def lint_cmd(
     violations = result.violations
     if severity:
         try:
-            min_severity = RuleSeverity(severity)
-            severity_order = [RuleSeverity.INFO, RuleSeverity.WARNING, RuleSeverity.ERROR]
-            min_index = severity_order.index(min_severity)
-            violations = [
-                v for v in violations if severity_order.index(v.severity) >= min_index
-            ]
+            min_severity = RuleSeverity.parse(severity)
+            violations = tuple(v for v in violations if v.severity >= min_severity)
         except ValueError:
             console.print(f"[red]Error:[/red] Invalid severity: {severity}")
             raise typer.Exit(1)
@@ -105,7 +101,7 @@ def lint_cmd(
                 {
                     "rule_id": v.rule.id,
                     "rule_name": v.rule.name,
-                    "severity": v.severity.value,
+                    "severity": v.severity.label,
                     "message": v.message,
                     "remediation": v.rule.remediation,
                 }
@@ -156,7 +152,7 @@ def _print_terminal_report(result, violations) -> None:
     table.add_row("Warnings", f"[yellow]{result.warning_count}[/yellow]")
     table.add_row(
         "Info",
-        str(sum(1 for v in result.violations if v.severity == RuleSeverity.INFO)),
+        str(sum(1 for v in result.violations if v.severity is RuleSeverity.INFO)),
     )
     console.print(table)
 
@@ -177,7 +173,7 @@ def _print_terminal_report(result, violations) -> None:
             }.get(v.severity, "white")
 
             table.add_row(
-                f"[{severity_style}]{v.severity.value.upper()}[/{severity_style}]",
+                f"[{severity_style}]{v.severity.label.upper()}[/{severity_style}]",
                 v.rule.name,
                 v.message,
                 v.rule.remediation or "-",
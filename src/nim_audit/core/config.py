@@ -82,9 +82,9 @@ class ConfigAnalyzer:
                 impact = None
                 if var_info.get("impact"):
                     impact = ConfigImpact(
-                        level=ImpactLevel(var_info["impact"].get("level", "low")),
+                        level=ImpactLevel.parse(var_info["impact"].get("level", "low")),
                         description=var_info["impact"].get("description", ""),
-                        affects=var_info["impact"].get("affects", []),
+                        affects=tuple(var_info["impact"].get("affects", ())),
                     )
 
                 entry = ConfigEntry(
@@ -220,13 +220,10 @@ class ConfigAnalyzer:
                             f"Must be one of: {', '.join(entry.valid_values)}"
                         )
 
-                if entry.value and entry.validation_pattern:
-                    import re
-
-                    if not re.match(entry.validation_pattern, entry.value):
-                        errors.append(
-                            f"{entry.name}: value '{entry.value}' does not match "
-                            f"pattern '{entry.validation_pattern}'"
-                        )
+                if entry.value and not entry.is_valid(entry.value):
+                    errors.append(
+                        f"{entry.name}: value '{entry.value}' does not match "
+                        f"pattern '{entry.validation_pattern}'"
+                    )
 
         return errors
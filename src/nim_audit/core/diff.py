@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import TYPE_CHECKING
 
 from nim_audit.models.common import AuditError
@@ -103,21 +102,11 @@ class DiffEngine:
                         )
                         entries.extend(extractor_entries)
 
-            # Calculate statistics
-            added = sum(1 for e in entries if e.change_type == ChangeType.ADDED)
-            removed = sum(1 for e in entries if e.change_type == ChangeType.REMOVED)
-            modified = sum(1 for e in entries if e.change_type == ChangeType.MODIFIED)
-
-            report = DiffReport(
-                source_image=source.metadata,
-                target_image=target.metadata,
-                generated_at=datetime.utcnow(),
-                entries=entries,
-                breaking_changes=breaking_changes,
-                total_changes=len(entries),
-                added_count=added,
-                removed_count=removed,
-                modified_count=modified,
+            report = DiffReport.build(
+                source.metadata,
+                target.metadata,
+                entries,
+                breaking_changes,
             )
 
             return DiffResult.ok(report)
@@ -175,7 +164,7 @@ class DiffEngine:
                     description=f"Model changed from {sm.model_name} to {tm.model_name}",
                     impact="Different model may produce different outputs",
                     migration="Verify model outputs match expectations",
-                    related_entries=["model_name"],
+                    related_entries=("model_name",),
                 )
             )
 
@@ -224,7 +213,7 @@ class DiffEngine:
                     description=f"Architecture changed from {sm.architecture} to {tm.architecture}",
                     impact="Container may not run on previous hardware",
                     migration="Ensure target system supports new architecture",
-                    related_entries=["architecture"],
+                    related_entries=("architecture",),
                 )
             )
 
@@ -374,8 +363,8 @@ class DiffEngine:
         entries: list[DiffEntry] = []
         breaking: list[BreakingChange] = []
 
-        source_layers = source.metadata.manifest.layers if source.metadata.manifest else []
-        target_layers = target.metadata.manifest.layers if target.metadata.manifest else []
+        source_layers = source.metadata.manifest.layers if source.metadata.manifest else ()
+        target_layers = target.metadata.manifest.layers if target.metadata.manifest else ()
 
         source_digests = {str(layer.digest) for layer in source_layers}
         target_digests = {str(layer.digest) for layer in target_layers}
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from nim_audit.models.env import EnvDiff, EnvSurface, Registry
+from nim_audit.models.env import EnvDiff, EnvSurface, ImpactMetric, Registry
 
 
 def env_surface(
@@ -42,14 +42,7 @@ def diff_surfaces(a: EnvSurface, b: EnvSurface) -> EnvDiff:
     Returns:
         EnvDiff with added, removed, and changed variables
     """
-    keys = set(a.vars.keys()) | set(b.vars.keys())
-    added = sorted([k for k in keys if k not in a.vars])
-    removed = sorted([k for k in keys if k not in b.vars])
-    changed: dict[str, list[Any]] = {}
-    for k in sorted(keys):
-        if a.vars.get(k) != b.vars.get(k):
-            changed[k] = [a.vars.get(k), b.vars.get(k)]
-    return EnvDiff(added=added, removed=removed, changed=changed, risky_changed=0)
+    return EnvDiff.between(a, b)
 
 
 def risk_delta(changed_keys: list[str], reg: Registry) -> int:
@@ -69,8 +62,8 @@ def risk_delta(changed_keys: list[str], reg: Registry) -> int:
         if not ent:
             continue
         for a in ent.affects:
-            if (a.metric.value == "determinism" and a.impact.value in ("-", "--")) or (
-                a.metric.value == "memory" and a.impact.value in ("+", "++")
+            if (a.metric is ImpactMetric.DETERMINISM and a.impact.value in ("-", "--")) or (
+                a.metric is ImpactMetric.MEMORY and a.impact.value in ("+", "++")
             ):
                 risky += 1
                 break
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import re
+import sys
 from abc import ABC, abstractmethod
 from typing import Callable
 
-from nim_audit.models.env import DiscoveredVar, DiscoveryResult, Evidence
+from nim_audit.models.env import DiscoveredVar, DiscoveryResult, Evidence, Signals
 
 DEFAULT_PREFIXES = ["NIM", "TRT", "CUDA", "NCCL"]
 SCAN_EXTS = (".sh", ".bash", ".py", ".json", ".yaml", ".yml", ".toml", ".ini", ".conf", ".txt")
@@ -62,12 +63,12 @@ def _boost_for_path(p: str) -> float:
     return b
 
 
-def _signals(text: str, var: str) -> dict[str, int]:
+def _signals(text: str, var: str) -> Signals:
     """Extract signal types for a variable from text."""
     cond = len(re.findall(r"\$\{\s*%s\s*[:-]" % re.escape(var), text))
     defaults = len(re.findall(r"\b(export\s+)?%s\s*=" % re.escape(var), text))
     help_hits = len(re.findall(r"(--help|usage:|Options:)", text, flags=re.IGNORECASE))
-    return {"conditional": cond, "assignment": defaults, "help_context": help_hits}
+    return Signals(conditional=cond, assignment=defaults, help_context=help_hits)
 
 
 def discover_env_vars(
@@ -120,9 +121,12 @@ def discover_env_vars(
         if not matches:
             continue
 
+        # Every Evidence from this file shares one interned path string, and
+        # each var name is interned once so all files key on the same object
+        path = sys.intern(path)
         per: dict[str, int] = {}
         for m in matches:
-            v = m.group(0)
+            v = sys.intern(m.group(0))
             per[v] = per.get(v, 0) + 1
 
         for v, cnt in per.items():
@@ -140,15 +144,15 @@ def discover_env_vars(
             score = (
                 float(cnt)
                 + _boost_for_path(path)
-                + 1.0 * sig["assignment"]
-                + 1.5 * sig["conditional"]
-                + (0.5 if sig["help_context"] else 0.0)
+                + 1.0 * sig.assignment
+                + 1.5 * sig.conditional
+                + (0.5 if sig.help_context else 0.0)
             )
             evidence = Evidence(
                 path=path,
                 count=cnt,
                 score=score,
-                sample_snippets=snippets,
+                sample_snippets=tuple(snippets),
                 signals=sig,
             )
             agg.setdefault(v, []).append(evidence)
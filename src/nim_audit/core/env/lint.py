@@ -7,7 +7,7 @@ from typing import Any
 
 import yaml
 
-from nim_audit.models.env import Finding, LintResult, Registry, RegistryEntry, Severity
+from nim_audit.models.env import Finding, ImpactMetric, LintResult, Registry, RegistryEntry, Severity
 from nim_audit.core.env.cel import eval_cel, CelError
 
 
@@ -119,7 +119,7 @@ def _lint_registry_heuristics(
         if not ent:
             continue
         for a in ent.affects:
-            if a.metric.value == "determinism" and a.impact.value in ("-", "--"):
+            if a.metric is ImpactMetric.DETERMINISM and a.impact.value in ("-", "--"):
                 findings.append(
                     Finding(
                         id="ENV-DETERMINISM",
@@ -128,7 +128,7 @@ def _lint_registry_heuristics(
                         message="Registry marks this as reducing determinism.",
                     )
                 )
-            if a.metric.value == "memory" and a.impact.value in ("+", "++"):
+            if a.metric is ImpactMetric.MEMORY and a.impact.value in ("+", "++"):
                 findings.append(
                     Finding(
                         id="ENV-MEMORY",
@@ -137,7 +137,7 @@ def _lint_registry_heuristics(
                         message="Registry marks this as increasing memory usage.",
                     )
                 )
-            if a.metric.value == "compatibility" and a.impact.value in ("-", "--"):
+            if a.metric is ImpactMetric.COMPATIBILITY and a.impact.value in ("-", "--"):
                 findings.append(
                     Finding(
                         id="ENV-COMPAT",
@@ -237,16 +237,4 @@ def lint_env(
     else:
         findings.extend(_lint_rules_v1(effective, rules))
 
-    overall = "PASS"
-    if any(f.severity == Severity.FAIL for f in findings):
-        overall = "FAIL"
-    elif any(f.severity == Severity.WARN for f in findings):
-        overall = "WARN"
-
-    counts = {
-        "info": sum(1 for f in findings if f.severity == Severity.INFO),
-        "warn": sum(1 for f in findings if f.severity == Severity.WARN),
-        "fail": sum(1 for f in findings if f.severity == Severity.FAIL),
-    }
-
-    return LintResult(overall=overall, findings=findings, counts=counts)
+    return LintResult(findings=tuple(findings))
@@ -8,6 +8,7 @@ from typing import Any
 
 import yaml
 
+from nim_audit.models._validators import adapter
 from nim_audit.models.env import (
     Affect,
     ImpactLevel,
@@ -52,12 +53,12 @@ def _parse_affect_item(it: Any) -> Affect | None:
         metric_str = str(m).strip().lower()
         impact_str = str(imp).strip()
         try:
-            metric = ImpactMetric(metric_str)
+            metric = ImpactMetric.parse(metric_str)
             impact = ImpactLevel(impact_str)
             return Affect(metric=metric, impact=impact)
         except ValueError:
             return Affect(
-                metric=ImpactMetric(metric_str) if metric_str in [e.value for e in ImpactMetric] else ImpactMetric.LATENCY,
+                metric=ImpactMetric.parse(metric_str) if metric_str in [e.label for e in ImpactMetric] else ImpactMetric.LATENCY,
                 impact=ImpactLevel(impact_str) if impact_str in [e.value for e in ImpactLevel] else ImpactLevel.NONE,
             )
     if isinstance(it, dict):
@@ -66,7 +67,7 @@ def _parse_affect_item(it: Any) -> Affect | None:
             metric_str = str(it["metric"]).lower()
             impact_str = str(it["impact"])
             try:
-                metric = ImpactMetric(metric_str)
+                metric = ImpactMetric.parse(metric_str)
                 impact = ImpactLevel(impact_str)
                 return Affect(metric=metric, impact=impact)
             except ValueError:
@@ -77,7 +78,7 @@ def _parse_affect_item(it: Any) -> Affect | None:
                 metric_str = str(metric_key).lower()
                 impact_str = str(impact_val)
                 try:
-                    metric = ImpactMetric(metric_str)
+                    metric = ImpactMetric.parse(metric_str)
                     impact = ImpactLevel(impact_str)
                     return Affect(metric=metric, impact=impact)
                 except ValueError:
@@ -98,8 +99,8 @@ def _normalize_affects(raw: Any, warnings: list[str], var: str) -> list[Affect]:
         if not a:
             warnings.append(f"{var}: invalid affects item {it!r}")
             continue
-        if a.metric.value not in CONTROLLED_METRICS:
-            warnings.append(f"{var}: affects.metric '{a.metric.value}' not in {CONTROLLED_METRICS}")
+        if a.metric.label not in CONTROLLED_METRICS:
+            warnings.append(f"{var}: affects.metric '{a.metric.label}' not in {CONTROLLED_METRICS}")
         if a.impact.value not in CONTROLLED_IMPACTS:
             warnings.append(f"{var}: affects.impact '{a.impact.value}' not in {CONTROLLED_IMPACTS}")
         out.append(a)
@@ -107,7 +108,7 @@ def _normalize_affects(raw: Any, warnings: list[str], var: str) -> list[Affect]:
     seen: set[tuple[str, str]] = set()
     unique: list[Affect] = []
     for a in out:
-        key = (a.metric.value, a.impact.value)
+        key = (a.metric.label, a.impact.value)
         if key not in seen:
             seen.add(key)
             unique.append(a)
@@ -129,7 +130,7 @@ def load_registry(
         Registry with entries and interactions
     """
     warnings: list[str] = []
-    entries: dict[str, RegistryEntry] = {}
+    rows: list[dict[str, Any]] = []
     edges: list[InteractionEdge] = []
 
     # Use defaults if not provided
@@ -159,20 +160,31 @@ def load_registry(
         if confidence not in ("HIGH", "MED", "LOW"):
             warnings.append(f"{name}: confidence '{confidence}' not in HIGH|MED|LOW")
             confidence = "LOW"
-        entries[name] = RegistryEntry(
-            name=name,
-            type=str(it.get("type")) if it.get("type") is not None else None,
-            scope=str(it.get("scope")) if it.get("scope") is not None else None,
-            precedence=str(it.get("precedence")) if it.get("precedence") is not None else None,
-            default=str(it.get("default")) if it.get("default") is not None else None,
-            affects=affects,
-            determinism=str(it.get("determinism")) if it.get("determinism") is not None else None,
-            interactions=list(it.get("interactions") or []),
-            failure_modes=[str(x) for x in (it.get("failure_modes") or [])],
-            confidence=confidence,
-            evidence=list(it.get("evidence") or []),
+        rows.append(
+            {
+                "name": name,
+                "type": str(it.get("type")) if it.get("type") is not None else None,
+                "scope": str(it.get("scope")) if it.get("scope") is not None else None,
+                "precedence": (
+                    str(it.get("precedence")) if it.get("precedence") is not None else None
+                ),
+                "default": str(it.get("default")) if it.get("default") is not None else None,
+                "affects": affects,
+                "determinism": (
+                    str(it.get("determinism")) if it.get("determinism") is not None else None
+                ),
+                "interactions": list(it.get("interactions") or []),
+                "failure_modes": [str(x) for x in (it.get("failure_modes") or [])],
+                "confidence": confidence,
+                "evidence": list(it.get("evidence") or []),
+            }
         )
 
+    # Validate all entries in one call through the shared adapter
+    entries: dict[str, RegistryEntry] = {
+        e.name: e for e in adapter(list[RegistryEntry]).validate_python(rows)
+    }
+
     if interactions_path and os.path.exists(interactions_path):
         with open(interactions_path, "r", encoding="utf-8") as f:
             iraw = yaml.safe_load(f) or {}
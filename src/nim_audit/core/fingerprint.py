@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import hashlib
 import uuid
-from datetime import datetime
 from typing import TYPE_CHECKING
 
-from nim_audit.models.common import AuditError
+from nim_audit.models.common import AuditError, utcnow
 from nim_audit.models.fingerprint import (
     BehavioralSignature,
     FingerprintComparison,
@@ -112,7 +110,7 @@ class BehavioralFingerprinter:
             signature = BehavioralSignature(
                 image_reference=image.reference,
                 fingerprint_id=str(uuid.uuid4()),
-                generated_at=datetime.utcnow(),
+                generated_at=utcnow(),
                 responses=responses,
                 avg_latency_ms=total_latency / len(responses) if responses else 0.0,
                 total_tokens_in=total_tokens_in,
@@ -171,17 +169,14 @@ class BehavioralFingerprinter:
                 content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
                 usage = data.get("usage", {})
 
-                response_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-
                 responses.append(
-                    PromptResponse(
-                        prompt_id=prompt_id,
-                        prompt=prompt_text,
-                        response=content,
+                    PromptResponse.from_text(
+                        prompt_id,
+                        prompt_text,
+                        content,
                         tokens_in=usage.get("prompt_tokens", 0),
                         tokens_out=usage.get("completion_tokens", 0),
                         latency_ms=latency_ms,
-                        response_hash=response_hash,
                     )
                 )
 
@@ -214,61 +209,7 @@ class BehavioralFingerprinter:
         Returns:
             FingerprintComparison with detailed comparison results
         """
-        identical = 0
-        different = 0
-        response_diffs: list[dict[str, str]] = []
-
-        # Build lookup by prompt_id
-        source_by_id = {r.prompt_id: r for r in source.responses}
-        target_by_id = {r.prompt_id: r for r in target.responses}
-
-        all_ids = set(source_by_id.keys()) | set(target_by_id.keys())
-
-        for prompt_id in all_ids:
-            source_resp = source_by_id.get(prompt_id)
-            target_resp = target_by_id.get(prompt_id)
-
-            if source_resp and target_resp:
-                if source_resp.response_hash == target_resp.response_hash:
-                    identical += 1
-                else:
-                    different += 1
-                    response_diffs.append(
-                        {
-                            "prompt_id": prompt_id,
-                            "source": source_resp.response[:100],
-                            "target": target_resp.response[:100],
-                        }
-                    )
-            else:
-                different += 1
-                response_diffs.append(
-                    {
-                        "prompt_id": prompt_id,
-                        "source": source_resp.response[:100] if source_resp else "MISSING",
-                        "target": target_resp.response[:100] if target_resp else "MISSING",
-                    }
-                )
-
-        total = identical + different
-        similarity = identical / total if total > 0 else 0.0
-
-        # Calculate latency change
-        latency_change = 0.0
-        if source.avg_latency_ms > 0:
-            latency_change = (
-                (target.avg_latency_ms - source.avg_latency_ms) / source.avg_latency_ms * 100
-            )
-
-        return FingerprintComparison(
-            source=source,
-            target=target,
-            identical_responses=identical,
-            different_responses=different,
-            similarity_score=similarity,
-            response_diffs=response_diffs,
-            latency_change_percent=latency_change,
-        )
+        return FingerprintComparison(source=source, target=target)
 
     def load_fingerprint(self, path: str) -> BehavioralSignature:
         """Load a fingerprint from a JSON file.
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import re
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from nim_audit.models.common import AuditError
 from nim_audit.models.image import ImageDigest, ImageManifest, ImageMetadata, LayerInfo
+from nim_audit.registry.base import NIM_METADATA_LABELS, parse_reference, parse_timestamp
 
 
 class NIMImage:
@@ -76,7 +75,6 @@ class NIMImage:
         Raises:
             ValueError: If the reference is invalid
         """
-        parsed = cls._parse_reference(reference)
         metadata = cls._fetch_registry_metadata(reference, auth)
         return cls(metadata)
 
@@ -108,59 +106,6 @@ class NIMImage:
         """
         return cls(metadata)
 
-    @staticmethod
-    def _parse_reference(reference: str) -> dict[str, str | None]:
-        """Parse an image reference into components.
-
-        Args:
-            reference: Image reference string
-
-        Returns:
-            Dict with registry, repository, tag, and digest
-        """
-        result: dict[str, str | None] = {
-            "registry": None,
-            "repository": None,
-            "tag": None,
-            "digest": None,
-        }
-
-        # Handle digest
-        if "@" in reference:
-            ref_part, digest = reference.rsplit("@", 1)
-            result["digest"] = digest
-            reference = ref_part
-
-        # Handle tag
-        if ":" in reference:
-            # Check if it's a port or a tag
-            parts = reference.rsplit(":", 1)
-            if "/" in parts[1] or parts[1].isdigit():
-                # It's a port number, not a tag
-                pass
-            else:
-                reference = parts[0]
-                result["tag"] = parts[1]
-
-        # Handle registry and repository
-        parts = reference.split("/")
-        if len(parts) == 1:
-            # Just a repository name (e.g., "ubuntu")
-            result["repository"] = parts[0]
-        elif len(parts) == 2:
-            # Could be registry/repo or namespace/repo
-            if "." in parts[0] or ":" in parts[0] or parts[0] == "localhost":
-                result["registry"] = parts[0]
-                result["repository"] = parts[1]
-            else:
-                result["repository"] = reference
-        else:
-            # registry/namespace/repo or registry/namespace/.../repo
-            result["registry"] = parts[0]
-            result["repository"] = "/".join(parts[1:])
-
-        return result
-
     @staticmethod
     def _fetch_registry_metadata(
         reference: str,
@@ -168,21 +113,22 @@ class NIMImage:
     ) -> ImageMetadata:
         """Fetch metadata from a container registry.
 
-        This is a placeholder implementation. In production, this would
-        use the OCI registry API or Docker registry API.
+        Uses the process-wide client for the registry host, so images loaded
+        in the same run share its connection pool, bearer tokens and caches.
+        Explicit credentials get a client of their own instead.
         """
-        parsed = NIMImage._parse_reference(reference)
-
-        # For now, return placeholder metadata
-        # Real implementation would fetch from registry
-        return ImageMetadata(
-            reference=reference,
-            repository=parsed.get("repository") or reference,
-            tag=parsed.get("tag"),
-            digest=ImageDigest.from_string(parsed["digest"]) if parsed.get("digest") else None,
-            labels={},
-            env={},
-        )
+        import httpx
+
+        from nim_audit.registry import RegistryAuth, RegistryError, get_registry_client
+
+        registry = get_registry_client(reference)
+        try:
+            if auth:
+                with type(registry)(auth=RegistryAuth(**auth)) as own_registry:
+                    return own_registry.get_metadata(reference)
+            return registry.get_metadata(reference)
+        except (RegistryError, httpx.HTTPError) as e:
+            raise ValueError(f"Failed to fetch image '{reference}': {e}") from e
 
     @staticmethod
     def _fetch_local_metadata(reference: str) -> ImageMetadata:
@@ -202,79 +148,52 @@ class NIMImage:
 
             # Parse environment variables
             env_list = config.get("Config", {}).get("Env", []) or []
-            env = {}
-            for item in env_list:
-                if "=" in item:
-                    key, value = item.split("=", 1)
-                    env[key] = value
+            env = dict(item.split("=", 1) for item in env_list if "=" in item)
 
             # Parse exposed ports
-            exposed_ports = []
             ports_config = config.get("Config", {}).get("ExposedPorts", {}) or {}
-            for port_spec in ports_config.keys():
-                port_match = re.match(r"(\d+)", port_spec)
-                if port_match:
-                    exposed_ports.append(int(port_match.group(1)))
-
-            # Parse creation timestamp
-            created = None
-            created_str = config.get("Created")
-            if created_str:
-                try:
-                    # Handle both formats: with and without fractional seconds
-                    created_str = created_str.replace("Z", "+00:00")
-                    if "." in created_str:
-                        # Truncate fractional seconds to 6 digits
-                        parts = created_str.split(".")
-                        frac_and_tz = parts[1]
-                        # Find where timezone starts
-                        tz_start = -1
-                        for i, c in enumerate(frac_and_tz):
-                            if c in "+-":
-                                tz_start = i
-                                break
-                        if tz_start > 0:
-                            frac = frac_and_tz[:tz_start][:6]
-                            tz = frac_and_tz[tz_start:]
-                            created_str = f"{parts[0]}.{frac}{tz}"
-                    created = datetime.fromisoformat(created_str)
-                except (ValueError, TypeError):
-                    pass
+            # Specs look like "8000/tcp"
+            exposed_ports = tuple(
+                int(port) for spec in ports_config if (port := spec.partition("/")[0]).isdigit()
+            )
+
+            created = parse_timestamp(config.get("Created"))
 
             # Build manifest from layer info
-            layers = []
-            for layer_digest in image.attrs.get("RootFS", {}).get("Layers", []):
-                layers.append(
-                    LayerInfo(
-                        digest=ImageDigest.from_string(layer_digest),
-                        size=0,  # Size not available from this API
-                        media_type="application/vnd.docker.image.rootfs.diff.tar.gzip",
-                    )
+            layers = tuple(
+                LayerInfo(
+                    digest=ImageDigest.from_string(layer_digest),
+                    size=0,  # Size not available from this API
+                    media_type="application/vnd.docker.image.rootfs.diff.tar.gzip",
                 )
+                for layer_digest in image.attrs.get("RootFS", {}).get("Layers", [])
+            )
 
             manifest = None
             if layers:
-                manifest = ImageManifest(
+                # Daemon data is already well-typed; skip re-validation
+                manifest = ImageManifest.model_construct(
                     schema_version=2,
                     media_type="application/vnd.docker.distribution.manifest.v2+json",
-                    digest=ImageDigest(hash=image.id.replace("sha256:", "")),
-                    config_digest=ImageDigest(hash=image.id.replace("sha256:", "")),
+                    digest=ImageDigest(hash=image.id.removeprefix("sha256:")),
+                    config_digest=ImageDigest(hash=image.id.removeprefix("sha256:")),
                     layers=layers,
                 )
 
             # Extract NIM-specific metadata from labels
-            nim_version = labels.get("com.nvidia.nim.version")
-            model_name = labels.get("com.nvidia.nim.model.name")
-            model_version = labels.get("com.nvidia.nim.model.version")
-            quantization = labels.get("com.nvidia.nim.model.quantization")
+            nim_version, model_name, model_version, quantization = map(
+                labels.get, NIM_METADATA_LABELS
+            )
 
-            parsed = NIMImage._parse_reference(reference)
+            parsed = parse_reference(reference)
 
-            return ImageMetadata(
+            # Trusted daemon data: fields are built above with the right
+            # types, so construct without running validation
+            return ImageMetadata.model_construct(
                 reference=reference,
-                repository=parsed.get("repository") or reference,
-                tag=parsed.get("tag"),
-                digest=ImageDigest(hash=image.id.replace("sha256:", "")),
+                repository=parsed.repository or reference,
+                tag=parsed.tag,
+                digest=ImageDigest(hash=image.id.removeprefix("sha256:")),
                 manifest=manifest,
                 labels=labels,
                 created=created,
@@ -286,8 +205,8 @@ class NIMImage:
                 quantization=quantization,
                 env=env,
                 exposed_ports=exposed_ports,
-                entrypoint=config.get("Config", {}).get("Entrypoint", []) or [],
-                cmd=config.get("Config", {}).get("Cmd", []) or [],
+                entrypoint=tuple(config.get("Config", {}).get("Entrypoint") or ()),
+                cmd=tuple(config.get("Config", {}).get("Cmd") or ()),
                 raw_config=config,
             )
 
@@ -236,7 +236,7 @@ class PolicyLinter:
                     id=rule_data["id"],
                     name=rule_data["name"],
                     description=rule_data.get("description", ""),
-                    severity=RuleSeverity(rule_data.get("severity", "warning")),
+                    severity=RuleSeverity.parse(rule_data.get("severity", "warning")),
                     category=rule_data.get("category", "general"),
                     enabled=rule_data.get("enabled", True),
                     condition=rule_data["condition"],
@@ -268,14 +268,14 @@ class PolicyLinter:
             "version": policy.version,
             "description": policy.description,
             "author": policy.author,
-            "tags": policy.tags,
-            "extends": policy.extends,
+            "tags": list(policy.tags),
+            "extends": list(policy.extends),
             "rules": [
                 {
                     "id": rule.id,
                     "name": rule.name,
                     "description": rule.description,
-                    "severity": rule.severity.value,
+                    "severity": rule.severity.label,
                     "category": rule.category,
                     "enabled": rule.enabled,
                     "condition": rule.condition,
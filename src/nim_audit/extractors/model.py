@@ -10,7 +10,7 @@ from typing import Any
 
 from nim_audit.extractors.base import ExtractorResult
 from nim_audit.models.common import AuditError
-from nim_audit.utils.hashing import hash_file
+from nim_audit.utils.hashing import short_hash_file
 
 
 class ModelExtractor:
@@ -233,7 +233,7 @@ class ModelExtractor:
                         file_info = {
                             "path": str(path),
                             "size": path.stat().st_size,
-                            "hash": hash_file(path)[:16] if path.stat().st_size < 100_000_000 else None,
+                            "hash": short_hash_file(path) if path.stat().st_size < 100_000_000 else None,
                         }
                         data["model_files"].append(file_info)
                         data["total_model_size"] += path.stat().st_size
@@ -2,13 +2,73 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
+import posixpath
+import tarfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from nim_audit.extractors.base import ExtractorResult
 from nim_audit.models.common import AuditError
-from nim_audit.utils.hashing import hash_file
+from nim_audit.utils import fastjson
+from nim_audit.utils.docker_client import get_docker_client
+from nim_audit.utils.hashing import short_hash_file
+from nim_audit.utils.streams import ChunkReader
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    """Decode a protobuf varint at ``pos``, returning (value, new_pos)."""
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(buf) or shift > 63:
+            raise ValueError("Truncated or oversized varint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _count_sp_pieces(buf: bytes) -> int:
+    """Count vocabulary pieces in a serialized SentencePiece ModelProto.
+
+    Walks the top-level protobuf wire format and counts occurrences of
+    field 1 (``repeated SentencePiece pieces``) without decoding them,
+    which avoids depending on the protobuf or sentencepiece runtimes.
+
+    Raises:
+        ValueError: If the data is not a well-formed protobuf message
+    """
+    count = 0
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        tag, pos = _read_varint(buf, pos)
+        field, wire_type = tag >> 3, tag & 7
+        if field == 0:
+            raise ValueError("Invalid protobuf field number 0")
+        if wire_type == 0:
+            _, pos = _read_varint(buf, pos)
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 2:
+            length, pos = _read_varint(buf, pos)
+            pos += length
+            if field == 1:
+                count += 1
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+        if pos > end:
+            raise ValueError("Truncated protobuf message")
+    return count
 
 
 class TokenizerExtractor:
@@ -17,6 +77,11 @@ class TokenizerExtractor:
     Extracts tokenizer configuration, vocabulary, and special tokens
     from NIM containers.
 
+    File hashes are only computed when ``compute_hashes`` is set. Hashing
+    reads every tokenizer file in full, which dominates extraction time for
+    large ``tokenizer.json`` files, so leave it off unless content
+    integrity is needed.
+
     Example:
         extractor = TokenizerExtractor()
         result = extractor.extract("nvcr.io/nim/llama3:1.5.0")
@@ -36,6 +101,8 @@ class TokenizerExtractor:
         "spiece.model",
     ]
 
+    _FILESET = frozenset(TOKENIZER_FILES)
+
     # Common tokenizer directories
     TOKENIZER_DIRS = [
         "/opt/nim/models",
@@ -44,6 +111,38 @@ class TokenizerExtractor:
         "/home/nim/models",
     ]
 
+    # TOKENIZER_DIRS relative to an extracted container filesystem root
+    _REL_DIRS = tuple(d.lstrip("/") for d in TOKENIZER_DIRS)
+
+    # Scalar fields of a fresh result; containers are filled in by _new_result
+    _RESULT_TEMPLATE: dict[str, Any] = {
+        "tokenizer_files": None,
+        "tokenizer_type": None,
+        "vocab_size": None,
+        "special_tokens": None,
+        "tokenizer_config": None,
+        "bos_token": None,
+        "eos_token": None,
+        "pad_token": None,
+        "unk_token": None,
+    }
+
+    def __init__(self, *, compute_hashes: bool = False) -> None:
+        """Initialize the tokenizer extractor.
+
+        Args:
+            compute_hashes: Include a short content hash for each file found
+        """
+        self._compute_hashes = compute_hashes
+
+    @classmethod
+    def _new_result(cls) -> dict[str, Any]:
+        """Create an empty result dict with fresh mutable containers."""
+        data = dict(cls._RESULT_TEMPLATE)
+        data["tokenizer_files"] = []
+        data["special_tokens"] = {}
+        return data
+
     @property
     def name(self) -> str:
         """Unique name for this extractor."""
@@ -80,18 +179,6 @@ class TokenizerExtractor:
             ExtractorResult with tokenizer information
         """
         try:
-            data: dict[str, Any] = {
-                "tokenizer_files": [],
-                "tokenizer_type": None,
-                "vocab_size": None,
-                "special_tokens": {},
-                "tokenizer_config": None,
-                "bos_token": None,
-                "eos_token": None,
-                "pad_token": None,
-                "unk_token": None,
-            }
-
             if container_fs and container_fs.exists():
                 data = self._extract_from_fs(container_fs)
             else:
@@ -113,62 +200,43 @@ class TokenizerExtractor:
 
     def _extract_from_fs(self, container_fs: Path) -> dict[str, Any]:
         """Extract tokenizer info from a filesystem path."""
-        data: dict[str, Any] = {
-            "tokenizer_files": [],
-            "tokenizer_type": None,
-            "vocab_size": None,
-            "special_tokens": {},
-            "tokenizer_config": None,
-            "bos_token": None,
-            "eos_token": None,
-            "pad_token": None,
-            "unk_token": None,
-        }
-
-        # Search for tokenizer files
-        for tokenizer_dir in self.TOKENIZER_DIRS:
-            dir_path = container_fs / tokenizer_dir.lstrip("/")
-            if dir_path.exists():
-                self._scan_directory(dir_path, data)
+        data = self._new_result()
+
+        # Search tokenizer directories concurrently; the walks are I/O bound
+        # and independent, so page-cache misses overlap across threads.
+        # Results are merged on this thread in directory order.
+        with ThreadPoolExecutor(max_workers=len(self._REL_DIRS)) as executor:
+            futures = [
+                executor.submit(self._collect_directory, container_fs / rel_dir)
+                for rel_dir in self._REL_DIRS
+            ]
+            for future in futures:
+                self._merge_collected(future.result(), data)
 
         return data
 
     def _extract_from_image(self, image_id: str) -> dict[str, Any]:
         """Extract tokenizer info by inspecting image."""
-        data: dict[str, Any] = {
-            "tokenizer_files": [],
-            "tokenizer_type": None,
-            "vocab_size": None,
-            "special_tokens": {},
-            "tokenizer_config": None,
-            "bos_token": None,
-            "eos_token": None,
-            "pad_token": None,
-            "unk_token": None,
-        }
+        data = self._new_result()
 
         try:
-            import docker
+            from docker.errors import NotFound
 
-            client = docker.from_env()
+            client = get_docker_client()
             container = client.containers.create(image_id, command="sleep 1")
 
             try:
+                # Fetch each candidate file as its own small tar archive from
+                # the daemon rather than exec'ing `cat` inside the container.
+                # Archiving a whole model directory would also stream the
+                # weights stored next to the tokenizer.
                 for tokenizer_dir in self.TOKENIZER_DIRS:
                     for tokenizer_file in self.TOKENIZER_FILES:
-                        file_path = f"{tokenizer_dir}/{tokenizer_file}"
-                        exit_code, content = container.exec_run(f"cat {file_path} 2>/dev/null")
-
-                        if exit_code == 0 and content:
-                            data["tokenizer_files"].append(file_path)
-
-                            # Parse JSON files
-                            if tokenizer_file.endswith(".json"):
-                                try:
-                                    file_data = json.loads(content.decode())
-                                    self._process_tokenizer_file(tokenizer_file, file_data, data)
-                                except json.JSONDecodeError:
-                                    pass
+                        try:
+                            stream, _ = container.get_archive(f"{tokenizer_dir}/{tokenizer_file}")
+                        except NotFound:
+                            continue
+                        self._scan_archive(stream, tokenizer_dir, data)
             finally:
                 container.remove(force=True)
 
@@ -179,32 +247,106 @@ class TokenizerExtractor:
 
         return data
 
-    def _scan_directory(self, dir_path: Path, data: dict[str, Any]) -> None:
-        """Scan a directory for tokenizer files."""
-        for path in dir_path.rglob("*"):
-            if path.is_file() and path.name in self.TOKENIZER_FILES:
-                file_info = {
-                    "path": str(path),
-                    "size": path.stat().st_size,
-                    "hash": hash_file(path)[:16],
-                }
-                data["tokenizer_files"].append(file_info)
+    def _scan_archive(self, stream: Iterator[bytes], parent_dir: str, data: dict[str, Any]) -> None:
+        """Scan a tar stream from ``container.get_archive`` for tokenizer files.
+
+        Args:
+            stream: Iterator of raw tar chunks
+            parent_dir: Container directory the archive member names are relative to
+            data: Result dict to update
+        """
+        with tarfile.open(fileobj=ChunkReader(stream), mode="r|") as tar:
+            for member in tar:
+                filename = posixpath.basename(member.name)
+                if not member.isfile() or filename not in self._FILESET:
+                    continue
+
+                data["tokenizer_files"].append(posixpath.join(parent_dir, member.name))
 
                 # Parse JSON files
-                if path.suffix == ".json":
+                if filename.endswith(".json"):
+                    extracted = tar.extractfile(member)
+                    if extracted is None:
+                        continue
                     try:
-                        file_data = json.loads(path.read_text())
-                        self._process_tokenizer_file(path.name, file_data, data)
-                    except (json.JSONDecodeError, OSError):
+                        file_data = fastjson.loads(extracted.read())
+                        self._process_tokenizer_file(filename, file_data, data)
+                    except json.JSONDecodeError:
                         pass
+                elif filename.endswith(".model"):
+                    extracted = tar.extractfile(member)
+                    if extracted is not None:
+                        self._process_tokenizer_file(filename, extracted.read(), data)
+
+    def _collect_directory(self, dir_path: Path) -> list[tuple[str, dict[str, Any], Any]]:
+        """Collect tokenizer files under a directory without touching shared state.
+
+        Safe to run from a worker thread. Missing directories yield no entries.
+
+        Returns:
+            List of (filename, file_info, file_data) tuples, where file_data is
+            parsed JSON, raw sentencepiece model bytes, or None
+        """
+        collected: list[tuple[str, dict[str, Any], Any]] = []
+
+        # Manual scandir walk: entry types come from the directory listing and
+        # names are filtered before any stat, so non-matching files cost nothing.
+        stack = [str(dir_path)]
+        while stack:
+            try:
+                scanner = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with scanner:
+                for entry in scanner:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    # Files may be symlinks, as in a Hugging Face cache snapshot
+                    # whose files all point into its blobs/ directory
+                    if entry.name not in self._FILESET or not entry.is_file():
+                        continue
+
+                    size = entry.stat().st_size
+                    file_info: dict[str, Any] = {"path": entry.path, "size": size}
+                    if self._compute_hashes:
+                        file_info["hash"] = short_hash_file(entry.path)
+
+                    # Parse JSON files straight from bytes (mmap for large ones)
+                    file_data = None
+                    if entry.name.endswith(".json"):
+                        with contextlib.suppress(json.JSONDecodeError, OSError):
+                            file_data = fastjson.load_file(entry.path, size)
+                    elif entry.name.endswith(".model"):
+                        with contextlib.suppress(OSError):
+                            file_data = Path(entry.path).read_bytes()
+
+                    collected.append((entry.name, file_info, file_data))
+
+        return collected
+
+    def _merge_collected(
+        self,
+        collected: list[tuple[str, dict[str, Any], Any]],
+        data: dict[str, Any],
+    ) -> None:
+        """Merge entries gathered by _collect_directory into a result dict."""
+        for filename, file_info, file_data in collected:
+            data["tokenizer_files"].append(file_info)
+            if file_data is not None:
+                self._process_tokenizer_file(filename, file_data, data)
 
     def _process_tokenizer_file(
         self,
         filename: str,
-        file_data: dict[str, Any],
+        file_data: Any,
         data: dict[str, Any],
     ) -> None:
-        """Process a tokenizer file and extract information."""
+        """Process a tokenizer file and extract information.
+
+        ``file_data`` is the parsed document for JSON files and the raw
+        bytes for sentencepiece ``.model`` files.
+        """
         if filename == "tokenizer_config.json":
             data["tokenizer_config"] = file_data
             data["tokenizer_type"] = file_data.get("tokenizer_class")
@@ -222,9 +364,11 @@ class TokenizerExtractor:
 
             # Get added tokens
             if "added_tokens" in file_data:
-                for token in file_data["added_tokens"]:
-                    if isinstance(token, dict) and "content" in token:
-                        data["special_tokens"][token["content"]] = token.get("id")
+                data["special_tokens"].update(
+                    (token["content"], token.get("id"))
+                    for token in file_data["added_tokens"]
+                    if isinstance(token, dict) and "content" in token
+                )
 
         elif filename == "special_tokens_map.json":
             data["special_tokens"].update(file_data)
@@ -232,6 +376,11 @@ class TokenizerExtractor:
         elif filename == "vocab.json":
             data["vocab_size"] = len(file_data)
 
+        elif filename.endswith(".model"):
+            # SentencePiece ModelProto (tokenizer.model / spiece.model)
+            with contextlib.suppress(ValueError):
+                data["vocab_size"] = _count_sp_pieces(file_data)
+
     @staticmethod
     def _extract_token(token_data: Any) -> str | None:
         """Extract token string from various formats."""
@@ -1,182 +1,217 @@
 """GPU compatibility matrix for NIM containers."""
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Architecture and workload tag strings repeat across most entries; intern
+# them so every entry shares one canonical object per value.
+_ARCH = {k: sys.intern(k) for k in ("Hopper", "Ada Lovelace", "Ampere", "Turing", "Volta")}
+_TAGS = {
+    t: sys.intern(t)
+    for t in (
+        "large_models",
+        "high_throughput",
+        "very_large_models",
+        "inference",
+        "mixed_workloads",
+        "small_models",
+        "cost_effective",
+        "training_inference",
+        "medium_models",
+        "small_medium_models",
+        "cloud_deployments",
+        "enterprise",
+        "professional",
+        "workstation",
+        "legacy",
+        "development",
+    )
+}
 
-def get_gpu_matrix() -> dict[str, dict[str, Any]]:
+_GPU_MATRIX: dict[str, dict[str, Any]] = {
+    # NVIDIA Hopper Architecture (H Series)
+    "H100": {
+        "architecture": _ARCH["Hopper"],
+        "compute_capability": "9.0",
+        "memory_gb": 80,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["large_models"], _TAGS["high_throughput"]],
+    },
+    "H100-80GB": {
+        "architecture": _ARCH["Hopper"],
+        "compute_capability": "9.0",
+        "memory_gb": 80,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["large_models"], _TAGS["high_throughput"]],
+    },
+    "H200": {
+        "architecture": _ARCH["Hopper"],
+        "compute_capability": "9.0",
+        "memory_gb": 141,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["very_large_models"], _TAGS["high_throughput"]],
+    },
+    # NVIDIA Ada Lovelace Architecture (L Series)
+    "L40": {
+        "architecture": _ARCH["Ada Lovelace"],
+        "compute_capability": "8.9",
+        "memory_gb": 48,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["inference"], _TAGS["mixed_workloads"]],
+    },
+    "L40S": {
+        "architecture": _ARCH["Ada Lovelace"],
+        "compute_capability": "8.9",
+        "memory_gb": 48,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["inference"], _TAGS["mixed_workloads"]],
+    },
+    "L4": {
+        "architecture": _ARCH["Ada Lovelace"],
+        "compute_capability": "8.9",
+        "memory_gb": 24,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["small_models"], _TAGS["cost_effective"]],
+    },
+    # NVIDIA Ampere Architecture (A Series)
+    "A100": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.0",
+        "memory_gb": 80,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["large_models"], _TAGS["training_inference"]],
+    },
+    "A100-80GB": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.0",
+        "memory_gb": 80,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["large_models"], _TAGS["training_inference"]],
+    },
+    "A100-40GB": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.0",
+        "memory_gb": 40,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["medium_models"], _TAGS["training_inference"]],
+    },
+    "A10": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.6",
+        "memory_gb": 24,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["inference"], _TAGS["small_medium_models"]],
+    },
+    "A10G": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.6",
+        "memory_gb": 24,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["inference"], _TAGS["cloud_deployments"]],
+    },
+    "A30": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.0",
+        "memory_gb": 24,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["inference"], _TAGS["enterprise"]],
+    },
+    "A40": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.6",
+        "memory_gb": 48,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["medium_models"], _TAGS["professional"]],
+    },
+    "A6000": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.6",
+        "memory_gb": 48,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["professional"], _TAGS["workstation"]],
+    },
+    # NVIDIA Turing Architecture (T Series)
+    "T4": {
+        "architecture": _ARCH["Turing"],
+        "compute_capability": "7.5",
+        "memory_gb": 16,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["small_models"], _TAGS["cost_effective"], _TAGS["inference"]],
+    },
+    # NVIDIA Volta Architecture (V Series)
+    "V100": {
+        "architecture": _ARCH["Volta"],
+        "compute_capability": "7.0",
+        "memory_gb": 32,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["legacy"], _TAGS["small_medium_models"]],
+    },
+    "V100-32GB": {
+        "architecture": _ARCH["Volta"],
+        "compute_capability": "7.0",
+        "memory_gb": 32,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["legacy"], _TAGS["small_medium_models"]],
+    },
+    "V100-16GB": {
+        "architecture": _ARCH["Volta"],
+        "compute_capability": "7.0",
+        "memory_gb": 16,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["legacy"], _TAGS["small_models"]],
+    },
+    # Consumer GPUs (for development/testing)
+    "RTX 4090": {
+        "architecture": _ARCH["Ada Lovelace"],
+        "compute_capability": "8.9",
+        "memory_gb": 24,
+        "tensor_cores": True,
+        "fp8_support": True,
+        "recommended_for": [_TAGS["development"], _TAGS["small_models"]],
+    },
+    "RTX 3090": {
+        "architecture": _ARCH["Ampere"],
+        "compute_capability": "8.6",
+        "memory_gb": 24,
+        "tensor_cores": True,
+        "fp8_support": False,
+        "recommended_for": [_TAGS["development"], _TAGS["small_models"]],
+    },
+}
+
+# Read-only view handed out to callers; shared without per-call copies.
+_GPU_MATRIX_VIEW: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {name: MappingProxyType(spec) for name, spec in _GPU_MATRIX.items()}
+)
+
+
+def get_gpu_matrix() -> Mapping[str, Mapping[str, Any]]:
     """Get the GPU compatibility matrix.
 
     Returns:
-        Dictionary mapping GPU names to their specifications
+        Read-only mapping of GPU names to their specifications
     """
-    return {
-        # NVIDIA Hopper Architecture (H Series)
-        "H100": {
-            "architecture": "Hopper",
-            "compute_capability": "9.0",
-            "memory_gb": 80,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["large_models", "high_throughput"],
-        },
-        "H100-80GB": {
-            "architecture": "Hopper",
-            "compute_capability": "9.0",
-            "memory_gb": 80,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["large_models", "high_throughput"],
-        },
-        "H200": {
-            "architecture": "Hopper",
-            "compute_capability": "9.0",
-            "memory_gb": 141,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["very_large_models", "high_throughput"],
-        },
-        # NVIDIA Ada Lovelace Architecture (L Series)
-        "L40": {
-            "architecture": "Ada Lovelace",
-            "compute_capability": "8.9",
-            "memory_gb": 48,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["inference", "mixed_workloads"],
-        },
-        "L40S": {
-            "architecture": "Ada Lovelace",
-            "compute_capability": "8.9",
-            "memory_gb": 48,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["inference", "mixed_workloads"],
-        },
-        "L4": {
-            "architecture": "Ada Lovelace",
-            "compute_capability": "8.9",
-            "memory_gb": 24,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["small_models", "cost_effective"],
-        },
-        # NVIDIA Ampere Architecture (A Series)
-        "A100": {
-            "architecture": "Ampere",
-            "compute_capability": "8.0",
-            "memory_gb": 80,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["large_models", "training_inference"],
-        },
-        "A100-80GB": {
-            "architecture": "Ampere",
-            "compute_capability": "8.0",
-            "memory_gb": 80,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["large_models", "training_inference"],
-        },
-        "A100-40GB": {
-            "architecture": "Ampere",
-            "compute_capability": "8.0",
-            "memory_gb": 40,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["medium_models", "training_inference"],
-        },
-        "A10": {
-            "architecture": "Ampere",
-            "compute_capability": "8.6",
-            "memory_gb": 24,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["inference", "small_medium_models"],
-        },
-        "A10G": {
-            "architecture": "Ampere",
-            "compute_capability": "8.6",
-            "memory_gb": 24,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["inference", "cloud_deployments"],
-        },
-        "A30": {
-            "architecture": "Ampere",
-            "compute_capability": "8.0",
-            "memory_gb": 24,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["inference", "enterprise"],
-        },
-        "A40": {
-            "architecture": "Ampere",
-            "compute_capability": "8.6",
-            "memory_gb": 48,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["medium_models", "professional"],
-        },
-        "A6000": {
-            "architecture": "Ampere",
-            "compute_capability": "8.6",
-            "memory_gb": 48,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["professional", "workstation"],
-        },
-        # NVIDIA Turing Architecture (T Series)
-        "T4": {
-            "architecture": "Turing",
-            "compute_capability": "7.5",
-            "memory_gb": 16,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["small_models", "cost_effective", "inference"],
-        },
-        # NVIDIA Volta Architecture (V Series)
-        "V100": {
-            "architecture": "Volta",
-            "compute_capability": "7.0",
-            "memory_gb": 32,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["legacy", "small_medium_models"],
-        },
-        "V100-32GB": {
-            "architecture": "Volta",
-            "compute_capability": "7.0",
-            "memory_gb": 32,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["legacy", "small_medium_models"],
-        },
-        "V100-16GB": {
-            "architecture": "Volta",
-            "compute_capability": "7.0",
-            "memory_gb": 16,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["legacy", "small_models"],
-        },
-        # Consumer GPUs (for development/testing)
-        "RTX 4090": {
-            "architecture": "Ada Lovelace",
-            "compute_capability": "8.9",
-            "memory_gb": 24,
-            "tensor_cores": True,
-            "fp8_support": True,
-            "recommended_for": ["development", "small_models"],
-        },
-        "RTX 3090": {
-            "architecture": "Ampere",
-            "compute_capability": "8.6",
-            "memory_gb": 24,
-            "tensor_cores": True,
-            "fp8_support": False,
-            "recommended_for": ["development", "small_models"],
-        },
-    }
+    return _GPU_MATRIX_VIEW
 
 
 def get_min_requirements() -> dict[str, Any]:
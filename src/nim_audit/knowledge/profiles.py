@@ -1,130 +1,139 @@
 """Optimized profiles for NIM deployments."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-
-def get_profiles() -> dict[str, dict[str, Any]]:
-    """Get optimized configuration profiles.
-
-    Returns:
-        Dictionary mapping profile names to their configurations
-    """
-    return {
-        "high-throughput": {
-            "name": "High Throughput",
-            "description": "Optimized for maximum requests per second",
-            "use_case": "Production deployments with high concurrency",
-            "env": {
-                "NIM_MAX_BATCH_SIZE": "32",
-                "NIM_MAX_CONCURRENT_REQUESTS": "64",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.95",
-                "NIM_ENABLE_CHUNKED_PREFILL": "true",
-                "NIM_ENABLE_PREFIX_CACHING": "true",
-            },
-            "requirements": {
-                "min_memory_gb": 40,
-                "recommended_gpus": ["H100", "A100-80GB"],
-            },
+_PROFILES: dict[str, dict[str, Any]] = {
+    "high-throughput": {
+        "name": "High Throughput",
+        "description": "Optimized for maximum requests per second",
+        "use_case": "Production deployments with high concurrency",
+        "env": {
+            "NIM_MAX_BATCH_SIZE": "32",
+            "NIM_MAX_CONCURRENT_REQUESTS": "64",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.95",
+            "NIM_ENABLE_CHUNKED_PREFILL": "true",
+            "NIM_ENABLE_PREFIX_CACHING": "true",
+        },
+        "requirements": {
+            "min_memory_gb": 40,
+            "recommended_gpus": ["H100", "A100-80GB"],
+        },
+    },
+    "low-latency": {
+        "name": "Low Latency",
+        "description": "Optimized for fastest time-to-first-token",
+        "use_case": "Interactive applications requiring fast responses",
+        "env": {
+            "NIM_MAX_BATCH_SIZE": "1",
+            "NIM_MAX_CONCURRENT_REQUESTS": "8",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.85",
+            "NIM_ENABLE_CHUNKED_PREFILL": "false",
+        },
+        "requirements": {
+            "min_memory_gb": 24,
+            "recommended_gpus": ["H100", "L40S", "A10"],
+        },
+    },
+    "memory-efficient": {
+        "name": "Memory Efficient",
+        "description": "Optimized for running larger models on smaller GPUs",
+        "use_case": "Resource-constrained environments",
+        "env": {
+            "NIM_MAX_BATCH_SIZE": "4",
+            "NIM_MAX_CONCURRENT_REQUESTS": "8",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.9",
+            "NIM_QUANTIZATION": "int8",
+            "NIM_KV_CACHE_DTYPE": "fp8",
+            "NIM_SWAP_SPACE": "4",
+        },
+        "requirements": {
+            "min_memory_gb": 16,
+            "recommended_gpus": ["L4", "T4", "A10"],
         },
-        "low-latency": {
-            "name": "Low Latency",
-            "description": "Optimized for fastest time-to-first-token",
-            "use_case": "Interactive applications requiring fast responses",
-            "env": {
-                "NIM_MAX_BATCH_SIZE": "1",
-                "NIM_MAX_CONCURRENT_REQUESTS": "8",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.85",
-                "NIM_ENABLE_CHUNKED_PREFILL": "false",
-            },
-            "requirements": {
-                "min_memory_gb": 24,
-                "recommended_gpus": ["H100", "L40S", "A10"],
-            },
+    },
+    "balanced": {
+        "name": "Balanced",
+        "description": "Balanced configuration for general use",
+        "use_case": "Default production configuration",
+        "env": {
+            "NIM_MAX_BATCH_SIZE": "8",
+            "NIM_MAX_CONCURRENT_REQUESTS": "16",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.9",
+            "NIM_ENABLE_CHUNKED_PREFILL": "true",
         },
-        "memory-efficient": {
-            "name": "Memory Efficient",
-            "description": "Optimized for running larger models on smaller GPUs",
-            "use_case": "Resource-constrained environments",
-            "env": {
-                "NIM_MAX_BATCH_SIZE": "4",
-                "NIM_MAX_CONCURRENT_REQUESTS": "8",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.9",
-                "NIM_QUANTIZATION": "int8",
-                "NIM_KV_CACHE_DTYPE": "fp8",
-                "NIM_SWAP_SPACE": "4",
-            },
-            "requirements": {
-                "min_memory_gb": 16,
-                "recommended_gpus": ["L4", "T4", "A10"],
-            },
+        "requirements": {
+            "min_memory_gb": 24,
+            "recommended_gpus": ["H100", "A100", "L40", "A10"],
         },
-        "balanced": {
-            "name": "Balanced",
-            "description": "Balanced configuration for general use",
-            "use_case": "Default production configuration",
-            "env": {
-                "NIM_MAX_BATCH_SIZE": "8",
-                "NIM_MAX_CONCURRENT_REQUESTS": "16",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.9",
-                "NIM_ENABLE_CHUNKED_PREFILL": "true",
-            },
-            "requirements": {
-                "min_memory_gb": 24,
-                "recommended_gpus": ["H100", "A100", "L40", "A10"],
-            },
+    },
+    "development": {
+        "name": "Development",
+        "description": "Configuration for development and testing",
+        "use_case": "Local development and debugging",
+        "env": {
+            "NIM_MAX_BATCH_SIZE": "1",
+            "NIM_MAX_CONCURRENT_REQUESTS": "4",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.7",
+            "NIM_LOG_LEVEL": "DEBUG",
+            "NIM_METRICS_ENABLED": "true",
         },
-        "development": {
-            "name": "Development",
-            "description": "Configuration for development and testing",
-            "use_case": "Local development and debugging",
-            "env": {
-                "NIM_MAX_BATCH_SIZE": "1",
-                "NIM_MAX_CONCURRENT_REQUESTS": "4",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.7",
-                "NIM_LOG_LEVEL": "DEBUG",
-                "NIM_METRICS_ENABLED": "true",
-            },
-            "requirements": {
-                "min_memory_gb": 8,
-                "recommended_gpus": ["RTX 4090", "RTX 3090", "T4"],
-            },
+        "requirements": {
+            "min_memory_gb": 8,
+            "recommended_gpus": ["RTX 4090", "RTX 3090", "T4"],
         },
-        "multi-gpu": {
-            "name": "Multi-GPU",
-            "description": "Configuration for multi-GPU tensor parallelism",
-            "use_case": "Large model inference across multiple GPUs",
-            "env": {
-                "NIM_TENSOR_PARALLEL_SIZE": "2",
-                "NIM_MAX_BATCH_SIZE": "16",
-                "NIM_MAX_CONCURRENT_REQUESTS": "32",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.9",
-            },
-            "requirements": {
-                "min_gpus": 2,
-                "min_memory_gb": 48,
-                "recommended_gpus": ["H100", "A100-80GB"],
-            },
+    },
+    "multi-gpu": {
+        "name": "Multi-GPU",
+        "description": "Configuration for multi-GPU tensor parallelism",
+        "use_case": "Large model inference across multiple GPUs",
+        "env": {
+            "NIM_TENSOR_PARALLEL_SIZE": "2",
+            "NIM_MAX_BATCH_SIZE": "16",
+            "NIM_MAX_CONCURRENT_REQUESTS": "32",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.9",
         },
-        "cost-optimized": {
-            "name": "Cost Optimized",
-            "description": "Configuration optimized for cloud cost efficiency",
-            "use_case": "Cloud deployments with cost constraints",
-            "env": {
-                "NIM_MAX_BATCH_SIZE": "16",
-                "NIM_MAX_CONCURRENT_REQUESTS": "32",
-                "NIM_GPU_MEMORY_UTILIZATION": "0.95",
-                "NIM_QUANTIZATION": "int8",
-                "NIM_ENABLE_PREFIX_CACHING": "true",
-            },
-            "requirements": {
-                "min_memory_gb": 16,
-                "recommended_gpus": ["L4", "T4", "A10G"],
-            },
+        "requirements": {
+            "min_gpus": 2,
+            "min_memory_gb": 48,
+            "recommended_gpus": ["H100", "A100-80GB"],
         },
-    }
+    },
+    "cost-optimized": {
+        "name": "Cost Optimized",
+        "description": "Configuration optimized for cloud cost efficiency",
+        "use_case": "Cloud deployments with cost constraints",
+        "env": {
+            "NIM_MAX_BATCH_SIZE": "16",
+            "NIM_MAX_CONCURRENT_REQUESTS": "32",
+            "NIM_GPU_MEMORY_UTILIZATION": "0.95",
+            "NIM_QUANTIZATION": "int8",
+            "NIM_ENABLE_PREFIX_CACHING": "true",
+        },
+        "requirements": {
+            "min_memory_gb": 16,
+            "recommended_gpus": ["L4", "T4", "A10G"],
+        },
+    },
+}
+
+# Read-only view handed out to callers; shared without per-call copies.
+_PROFILES_VIEW: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {name: MappingProxyType(entry) for name, entry in _PROFILES.items()}
+)
+
+
+def get_profiles() -> Mapping[str, Mapping[str, Any]]:
+    """Get optimized configuration profiles.
+
+    Returns:
+        Read-only mapping of profile names to their configurations
+    """
+    return _PROFILES_VIEW
 
 
-def get_profile(name: str) -> dict[str, Any] | None:
+def get_profile(name: str) -> Mapping[str, Any] | None:
     """Get a specific profile by name.
 
     Args:
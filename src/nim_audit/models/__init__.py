@@ -1,69 +1,77 @@
 """Data models for nim-audit.
 
-All models are Pydantic BaseModel with frozen=True for immutability.
+All models are immutable: Pydantic BaseModel with frozen=True, or frozen
+slotted dataclasses for plain-data leaf types.
+
+Submodules are imported on first attribute access (PEP 562) so that
+importing one model family does not build schemas for all of them.
 """
 
-from nim_audit.models.image import (
-    ImageDigest,
-    ImageManifest,
-    ImageMetadata,
-    LayerInfo,
-)
-from nim_audit.models.diff import (
-    BreakingChange,
-    ChangeCategory,
-    ChangeType,
-    DiffEntry,
-    DiffReport,
-    DiffResult,
-    Severity,
-)
-from nim_audit.models.config import (
-    ConfigEntry,
-    ConfigImpact,
-    ConfigReport,
-    ConfigResult,
-    ImpactLevel,
-)
-from nim_audit.models.compat import (
-    CompatReport,
-    CompatResult,
-    GPUInfo,
-    GPURequirements,
-)
-from nim_audit.models.fingerprint import (
-    BehavioralSignature,
-    FingerprintComparison,
-    FingerprintResult,
-    PromptResponse,
-)
-from nim_audit.models.policy import (
-    LintResult,
-    LintViolation,
-    Policy,
-    Rule,
-    RuleSeverity,
-)
-from nim_audit.models.common import AuditError
-from nim_audit.models.env import (
-    Affect,
-    DiscoveredVar,
-    DiscoveryResult,
-    EnvDescribeVar,
-    EnvDiff,
-    EnvSurface,
-    Evidence,
-    Finding,
-    ImpactLevel as EnvImpactLevel,
-    ImpactMetric,
-    InteractionEdge,
-    LintResult as EnvLintResult,
-    Registry,
-    RegistryEntry,
-    Severity as EnvSeverity,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
+# Public name -> (defining module, attribute name in that module)
+_LAZY: dict[str, tuple[str, str]] = {
+    # Image
+    "ImageDigest": ("nim_audit.models.image", "ImageDigest"),
+    "ImageManifest": ("nim_audit.models.image", "ImageManifest"),
+    "ImageMetadata": ("nim_audit.models.image", "ImageMetadata"),
+    "LayerInfo": ("nim_audit.models.image", "LayerInfo"),
+    # Diff
+    "BreakingChange": ("nim_audit.models.diff", "BreakingChange"),
+    "ChangeCategory": ("nim_audit.models.diff", "ChangeCategory"),
+    "ChangeType": ("nim_audit.models.diff", "ChangeType"),
+    "DiffEntry": ("nim_audit.models.diff", "DiffEntry"),
+    "DiffReport": ("nim_audit.models.diff", "DiffReport"),
+    "DiffResult": ("nim_audit.models.diff", "DiffResult"),
+    "Severity": ("nim_audit.models.diff", "Severity"),
+    # Config
+    "ConfigEntry": ("nim_audit.models.config", "ConfigEntry"),
+    "ConfigImpact": ("nim_audit.models.config", "ConfigImpact"),
+    "ConfigReport": ("nim_audit.models.config", "ConfigReport"),
+    "ConfigResult": ("nim_audit.models.config", "ConfigResult"),
+    "ImpactLevel": ("nim_audit.models.config", "ImpactLevel"),
+    # Compat
+    "CompatReport": ("nim_audit.models.compat", "CompatReport"),
+    "CompatResult": ("nim_audit.models.compat", "CompatResult"),
+    "GPUInfo": ("nim_audit.models.compat", "GPUInfo"),
+    "GPURequirements": ("nim_audit.models.compat", "GPURequirements"),
+    # Fingerprint
+    "BehavioralSignature": ("nim_audit.models.fingerprint", "BehavioralSignature"),
+    "FingerprintComparison": ("nim_audit.models.fingerprint", "FingerprintComparison"),
+    "FingerprintResult": ("nim_audit.models.fingerprint", "FingerprintResult"),
+    "PromptResponse": ("nim_audit.models.fingerprint", "PromptResponse"),
+    # Policy
+    "LintResult": ("nim_audit.models.policy", "LintResult"),
+    "LintViolation": ("nim_audit.models.policy", "LintViolation"),
+    "Policy": ("nim_audit.models.policy", "Policy"),
+    "Rule": ("nim_audit.models.policy", "Rule"),
+    "RuleSeverity": ("nim_audit.models.policy", "RuleSeverity"),
+    # Common
+    "AuditError": ("nim_audit.models.common", "AuditError"),
+    "Result": ("nim_audit.models.common", "Result"),
+    # Env
+    "Affect": ("nim_audit.models.env", "Affect"),
+    "DiscoveredVar": ("nim_audit.models.env", "DiscoveredVar"),
+    "DiscoveryResult": ("nim_audit.models.env", "DiscoveryResult"),
+    "EnvDescribeVar": ("nim_audit.models.env", "EnvDescribeVar"),
+    "EnvDiff": ("nim_audit.models.env", "EnvDiff"),
+    "EnvSurface": ("nim_audit.models.env", "EnvSurface"),
+    "Evidence": ("nim_audit.models.env", "Evidence"),
+    "Finding": ("nim_audit.models.env", "Finding"),
+    "EnvImpactLevel": ("nim_audit.models.env", "ImpactLevel"),
+    "ImpactMetric": ("nim_audit.models.env", "ImpactMetric"),
+    "InteractionEdge": ("nim_audit.models.env", "InteractionEdge"),
+    "EnvLintResult": ("nim_audit.models.env", "LintResult"),
+    "Registry": ("nim_audit.models.env", "Registry"),
+    "RegistryEntry": ("nim_audit.models.env", "RegistryEntry"),
+    "Signals": ("nim_audit.models.env", "Signals"),
+    "EnvSeverity": ("nim_audit.models.env", "Severity"),
+}
+
+__all__ = (
     # Image
     "ImageDigest",
     "ImageManifest",
@@ -101,6 +109,7 @@ __all__ = [
     "RuleSeverity",
     # Common
     "AuditError",
+    "Result",
     # Env
     "Affect",
     "DiscoveredVar",
@@ -116,5 +125,83 @@ __all__ = [
     "EnvLintResult",
     "Registry",
     "RegistryEntry",
+    "Signals",
     "EnvSeverity",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if TYPE_CHECKING:
+    from nim_audit.models.image import (
+        ImageDigest,
+        ImageManifest,
+        ImageMetadata,
+        LayerInfo,
+    )
+    from nim_audit.models.diff import (
+        BreakingChange,
+        ChangeCategory,
+        ChangeType,
+        DiffEntry,
+        DiffReport,
+        DiffResult,
+        Severity,
+    )
+    from nim_audit.models.config import (
+        ConfigEntry,
+        ConfigImpact,
+        ConfigReport,
+        ConfigResult,
+        ImpactLevel,
+    )
+    from nim_audit.models.compat import (
+        CompatReport,
+        CompatResult,
+        GPUInfo,
+        GPURequirements,
+    )
+    from nim_audit.models.fingerprint import (
+        BehavioralSignature,
+        FingerprintComparison,
+        FingerprintResult,
+        PromptResponse,
+    )
+    from nim_audit.models.policy import (
+        LintResult,
+        LintViolation,
+        Policy,
+        Rule,
+        RuleSeverity,
+    )
+    from nim_audit.models.common import AuditError, Result
+    from nim_audit.models.env import (
+        Affect,
+        DiscoveredVar,
+        DiscoveryResult,
+        EnvDescribeVar,
+        EnvDiff,
+        EnvSurface,
+        Evidence,
+        Finding,
+        ImpactLevel as EnvImpactLevel,
+        ImpactMetric,
+        InteractionEdge,
+        LintResult as EnvLintResult,
+        Registry,
+        RegistryEntry,
+        Severity as EnvSeverity,
+        Signals,
+    )
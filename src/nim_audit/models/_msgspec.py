@@ -0,0 +1,143 @@
+"""Opt-in msgspec mirrors of the diff report types.
+
+For tools that dump many diff reports (CI pipelines), msgspec's encoder is
+much faster than Pydantic's. The structs here mirror ``DiffEntry``,
+``BreakingChange`` and ``DiffReport`` with enums stored as their integer
+values. Entry structs are ``array_like``, so each entry is written as a
+positional array rather than an object.
+
+Requires the optional ``msgspec`` dependency (``pip install nim-audit[fast]``).
+Use ``DiffReport.to_msgspec()`` / ``DiffReport.from_msgspec()`` or the
+``encode_diff_report`` / ``decode_diff_report`` helpers.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+if TYPE_CHECKING:
+    from nim_audit.models.diff import DiffReport
+
+
+class DiffEntryMs(msgspec.Struct, frozen=True, gc=False, array_like=True):
+    """msgspec mirror of ``DiffEntry``."""
+
+    category: int
+    change_type: int
+    path: str
+    old_value: str | None
+    new_value: str | None
+    severity: int
+    description: str
+
+
+class BreakingChangeMs(msgspec.Struct, frozen=True, gc=False, array_like=True):
+    """msgspec mirror of ``BreakingChange``."""
+
+    category: int
+    title: str
+    description: str
+    impact: str
+    migration: str | None
+    related_entries: tuple[str, ...]
+
+
+class DiffReportMs(msgspec.Struct, frozen=True):
+    """msgspec mirror of ``DiffReport``.
+
+    Image metadata is kept as plain dicts; summary counts are not stored
+    because they are derived from the entries when converting back.
+    """
+
+    source_image: dict[str, Any]
+    target_image: dict[str, Any]
+    generated_at: datetime
+    entries: tuple[DiffEntryMs, ...] = ()
+    breaking_changes: tuple[BreakingChangeMs, ...] = ()
+
+
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(DiffReportMs)
+
+
+def to_struct(report: DiffReport) -> DiffReportMs:
+    """Convert a diff report to its msgspec mirror."""
+    return DiffReportMs(
+        source_image=report.source_image.model_dump(),
+        target_image=report.target_image.model_dump(),
+        generated_at=report.generated_at,
+        entries=tuple(
+            DiffEntryMs(
+                e.category,
+                e.change_type,
+                e.path,
+                e.old_value,
+                e.new_value,
+                e.severity,
+                e.description,
+            )
+            for e in report.entries
+        ),
+        breaking_changes=tuple(
+            BreakingChangeMs(
+                b.category, b.title, b.description, b.impact, b.migration, b.related_entries
+            )
+            for b in report.breaking_changes
+        ),
+    )
+
+
+def from_struct(struct: DiffReportMs) -> DiffReport:
+    """Convert a msgspec mirror back to a diff report."""
+    from nim_audit.models.diff import (
+        BreakingChange,
+        ChangeCategory,
+        ChangeType,
+        DiffEntry,
+        DiffReport,
+        Severity,
+    )
+    from nim_audit.models.image import ImageMetadata
+
+    return DiffReport.build(
+        source_image=ImageMetadata.model_validate(struct.source_image),
+        target_image=ImageMetadata.model_validate(struct.target_image),
+        entries=(
+            DiffEntry(
+                category=ChangeCategory.parse(e.category),
+                change_type=ChangeType.parse(e.change_type),
+                path=e.path,
+                old_value=e.old_value,
+                new_value=e.new_value,
+                severity=Severity.parse(e.severity),
+                description=e.description,
+            )
+            for e in struct.entries
+        ),
+        breaking_changes=(
+            BreakingChange(
+                category=ChangeCategory.parse(b.category),
+                title=b.title,
+                description=b.description,
+                impact=b.impact,
+                migration=b.migration,
+                related_entries=b.related_entries,
+            )
+            for b in struct.breaking_changes
+        ),
+        now=struct.generated_at,
+    )
+
+
+def encode_diff_report(report: DiffReport) -> bytes:
+    """Serialize a diff report to compact JSON with msgspec."""
+    encoded: bytes = _encoder.encode(to_struct(report))
+    return encoded
+
+
+def decode_diff_report(data: bytes | str) -> DiffReport:
+    """Parse JSON written by ``encode_diff_report`` back into a diff report."""
+    return from_struct(_decoder.decode(data))
@@ -0,0 +1,25 @@
+"""Shared pydantic validators, built on first use.
+
+Building a validator compiles the type's core schema, so each one is created
+once per process and reused for every load instead of per call.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@cache
+def adapter(tp: Any) -> TypeAdapter[Any]:
+    """Get the shared TypeAdapter for a type.
+
+    Args:
+        tp: Any type pydantic can validate (model, dataclass, ``list[X]``, ...)
+
+    Returns:
+        The cached adapter for ``tp``
+    """
+    return TypeAdapter(tp)
@@ -1,22 +1,153 @@
 """Common model types shared across modules."""
 
-from enum import Enum
-from typing import Any
+from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import IntEnum
+from typing import Any, Generic, Literal, Self, TypeVar
 
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
-class AuditError(BaseModel):
-    """Represents an error that occurred during an audit operation."""
+from nim_audit.models._validators import adapter
 
-    model_config = {"frozen": True}
+# Config shared by the frozen Pydantic models. Every validation option is
+# spelled out so the fast defaults cannot be changed by an inherited config.
+FROZEN_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    populate_by_name=False,
+    arbitrary_types_allowed=False,
+    validate_default=False,
+    revalidate_instances="never",
+)
 
-    code: str = Field(description="Error code for programmatic handling")
-    message: str = Field(description="Human-readable error message")
-    details: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Additional error context",
-    )
+
+def utcnow() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.fromtimestamp(time.time(), UTC)
+
+
+class LabeledIntEnum(IntEnum):
+    """IntEnum whose members keep the string label they are serialized as.
+
+    Members are declared as ``NAME = number, "label"``. Comparisons and
+    filtering are plain integer compares, while ``str()``, f-strings and JSON
+    dumps use the label, and the label is accepted when parsing, so the
+    on-wire format matches the former ``str`` enums.
+    """
+
+    label: str
+
+    def __new__(cls, value: int, label: str) -> Self:
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.label = label
+        return member
+
+    def __str__(self) -> str:
+        return self.label
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.label, format_spec)
+
+    @classmethod
+    def parse(cls, value: int | str) -> Self:
+        """Look up a member by its integer value or its string label.
+
+        This is the typed spelling of ``cls(value)``, which mypy checks
+        against the two-argument ``__new__`` used to declare members.
+
+        Raises:
+            ValueError: If no member has that value or label.
+        """
+        for member in cls:
+            if value in (member._value_, member.label):
+                return member
+        raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+
+    @classmethod
+    def _missing_(cls, value: object) -> Self | None:
+        if not isinstance(value, str):
+            return None
+        try:
+            return cls.parse(value)
+        except ValueError:
+            return None
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        schema = handler(source)
+        serializer = core_schema.plain_serializer_function_ser_schema(
+            lambda member: member.label, when_used="json"
+        )
+        schema["serialization"] = serializer  # type: ignore[index]
+        return schema
+
+
+class DataModel:
+    """Mixin giving frozen dataclass models the ``model_dump`` API of BaseModel.
+
+    Plain-data leaf types are ``@dataclass(frozen=True, slots=True)`` rather
+    than Pydantic models: they are only built from already-typed values, so
+    per-instance validation is wasted work. Pydantic models can still hold
+    them as fields and validate them from dicts when loading JSON.
+    """
+
+    __slots__ = ()
+
+    def model_dump(self, *, mode: Literal["python", "json"] = "python") -> dict[str, Any]:
+        """Serialize to a dict, matching ``BaseModel.model_dump`` output."""
+        cls: Any = type(self)
+        result: dict[str, Any] = adapter(cls).dump_python(self, mode=mode)
+        return result
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuditError(DataModel):
+    """Represents an error that occurred during an audit operation.
+
+    Attributes:
+        code: Error code for programmatic handling
+        message: Human-readable error message
+        details: Additional error context
+    """
+
+    code: str
+    message: str
+    details: dict[str, Any] = field(default_factory=dict)
 
     def __str__(self) -> str:
         return f"[{self.code}] {self.message}"
+
+
+ReportT = TypeVar("ReportT")
+
+
+class Result(BaseModel, Generic[ReportT]):
+    """Outcome of an audit operation: a report on success, errors on failure.
+
+    Operation-specific results subclass ``Result[SomeReport]`` so they share
+    these fields and constructors.
+    """
+
+    model_config = FROZEN_MODEL_CONFIG
+
+    success: bool = Field(description="Whether the operation succeeded")
+    report: ReportT | None = Field(default=None, description="The report if successful")
+    errors: tuple[AuditError, ...] = Field(default=(), description="Errors that occurred")
+
+    @classmethod
+    def ok(cls, report: ReportT) -> Self:
+        """Create a successful result."""
+        return cls(success=True, report=report)
+
+    @classmethod
+    def fail(cls, errors: Sequence[AuditError]) -> Self:
+        """Create a failed result."""
+        return cls(success=False, errors=tuple(errors))
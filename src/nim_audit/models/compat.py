@@ -1,31 +1,53 @@
 """GPU compatibility data models."""
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from typing import Any
 
-from nim_audit.models.common import AuditError
+from pydantic import BaseModel, Field, PrivateAttr
 
+from nim_audit.models.common import FROZEN_MODEL_CONFIG, DataModel, Result
 
-class GPUInfo(BaseModel):
-    """Information about a GPU."""
+# Bit set in CompatReport.issue_mask for each failed check, with its message
+ISSUE_COMPUTE = 1
+ISSUE_MEMORY = 2
+ISSUE_DRIVER = 4
+ISSUE_UNSUPPORTED_GPU = 8
 
-    model_config = {"frozen": True}
+_ISSUE_BITS = (
+    (ISSUE_COMPUTE, "Compute capability below minimum requirement"),
+    (ISSUE_MEMORY, "GPU memory below minimum requirement"),
+    (ISSUE_DRIVER, "NVIDIA driver version below minimum requirement"),
+    (ISSUE_UNSUPPORTED_GPU, "GPU not in explicitly supported list"),
+)
 
-    name: str = Field(description="GPU name (e.g., 'A100', 'H100')")
-    compute_capability: str | None = Field(
-        default=None,
-        description="CUDA compute capability (e.g., '8.0')",
-    )
-    memory_gb: float | None = Field(default=None, description="GPU memory in GB")
-    architecture: str | None = Field(
-        default=None,
-        description="GPU architecture (e.g., 'Ampere', 'Hopper')",
-    )
+# Issue messages for every possible mask, in check order
+_ISSUE_STRINGS = tuple(
+    tuple(message for bit, message in _ISSUE_BITS if mask & bit)
+    for mask in range(1 << len(_ISSUE_BITS))
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GPUInfo(DataModel):
+    """Information about a GPU.
+
+    Attributes:
+        name: GPU name (e.g., 'A100', 'H100')
+        compute_capability: CUDA compute capability (e.g., '8.0')
+        memory_gb: GPU memory in GB
+        architecture: GPU architecture (e.g., 'Ampere', 'Hopper')
+    """
+
+    name: str
+    compute_capability: str | None = None
+    memory_gb: float | None = None
+    architecture: str | None = None
 
 
 class GPURequirements(BaseModel):
     """GPU requirements for a NIM image."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     min_compute_capability: str | None = Field(
         default=None,
@@ -33,12 +55,12 @@ class GPURequirements(BaseModel):
     )
     min_memory_gb: float | None = Field(default=None, description="Minimum GPU memory in GB")
     min_driver_version: str | None = Field(default=None, description="Minimum NVIDIA driver version")
-    supported_gpus: list[str] = Field(
-        default_factory=list,
+    supported_gpus: tuple[str, ...] = Field(
+        default=(),
         description="Explicitly supported GPU models",
     )
-    supported_architectures: list[str] = Field(
-        default_factory=list,
+    supported_architectures: tuple[str, ...] = Field(
+        default=(),
         description="Supported GPU architectures",
     )
     tensor_cores_required: bool = Field(
@@ -50,7 +72,7 @@ class GPURequirements(BaseModel):
 class CompatReport(BaseModel):
     """GPU compatibility report."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     image_reference: str = Field(description="Image that was checked")
     requirements: GPURequirements = Field(description="Image GPU requirements")
@@ -66,45 +88,32 @@ class CompatReport(BaseModel):
     gpu_supported: bool = Field(default=True, description="GPU explicitly supported")
 
     # Warnings and recommendations
-    warnings: list[str] = Field(default_factory=list, description="Compatibility warnings")
-    recommendations: list[str] = Field(
-        default_factory=list,
+    warnings: tuple[str, ...] = Field(default=(), description="Compatibility warnings")
+    recommendations: tuple[str, ...] = Field(
+        default=(),
         description="Recommendations for optimal performance",
     )
 
-    @property
-    def compatibility_issues(self) -> list[str]:
-        """Get list of compatibility issues."""
-        issues = []
-        if not self.compute_compatible:
-            issues.append("Compute capability below minimum requirement")
-        if not self.memory_compatible:
-            issues.append("GPU memory below minimum requirement")
-        if not self.driver_compatible:
-            issues.append("NVIDIA driver version below minimum requirement")
-        if not self.gpu_supported:
-            issues.append("GPU not in explicitly supported list")
-        return issues
-
-
-class CompatResult(BaseModel):
-    """Result of a compatibility check operation."""
+    _issue_mask: int = PrivateAttr(default=0)
 
-    model_config = {"frozen": True}
+    def model_post_init(self, __context: Any) -> None:
+        self._issue_mask = (
+            (not self.compute_compatible) * ISSUE_COMPUTE
+            | (not self.memory_compatible) * ISSUE_MEMORY
+            | (not self.driver_compatible) * ISSUE_DRIVER
+            | (not self.gpu_supported) * ISSUE_UNSUPPORTED_GPU
+        )
 
-    success: bool = Field(description="Whether the check succeeded")
-    report: CompatReport | None = Field(
-        default=None,
-        description="The compatibility report if successful",
-    )
-    errors: list[AuditError] = Field(default_factory=list, description="Errors that occurred")
+    @property
+    def issue_mask(self) -> int:
+        """Get the failed checks as a bitmask of the ``ISSUE_*`` flags."""
+        return self._issue_mask
+
+    @property
+    def compatibility_issues(self) -> tuple[str, ...]:
+        """Get compatibility issues, in check order."""
+        return _ISSUE_STRINGS[self._issue_mask]
 
-    @classmethod
-    def ok(cls, report: CompatReport) -> "CompatResult":
-        """Create a successful result."""
-        return cls(success=True, report=report)
 
-    @classmethod
-    def fail(cls, errors: list[AuditError]) -> "CompatResult":
-        """Create a failed result."""
-        return cls(success=False, errors=errors)
+class CompatResult(Result[CompatReport]):
+    """Result of a compatibility check operation."""
@@ -1,39 +1,50 @@
 """Configuration analysis data models."""
 
-from enum import Enum
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from nim_audit.models.common import AuditError
+from nim_audit.models.common import FROZEN_MODEL_CONFIG, DataModel, LabeledIntEnum, Result
 
 
-class ImpactLevel(str, Enum):
-    """Impact level of a configuration option."""
+@lru_cache(maxsize=512)
+def _compiled(pattern: str) -> re.Pattern[str]:
+    """Compile a validation pattern once and reuse it across entries."""
+    return re.compile(pattern)
 
-    NONE = "none"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
 
+class ImpactLevel(LabeledIntEnum):
+    """Impact level of a configuration option, ordered from lowest to highest."""
 
-class ConfigImpact(BaseModel):
-    """Description of a configuration option's impact."""
+    NONE = 0, "none"
+    LOW = 1, "low"
+    MEDIUM = 2, "medium"
+    HIGH = 3, "high"
+    CRITICAL = 4, "critical"
 
-    model_config = {"frozen": True}
 
-    level: ImpactLevel = Field(description="Impact level")
-    description: str = Field(description="Impact description")
-    affects: list[str] = Field(
-        default_factory=list,
-        description="What aspects are affected (performance, memory, accuracy, etc)",
-    )
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConfigImpact(DataModel):
+    """Description of a configuration option's impact.
+
+    Attributes:
+        level: Impact level
+        description: Impact description
+        affects: What aspects are affected (performance, memory, accuracy, etc)
+    """
+
+    level: ImpactLevel
+    description: str
+    affects: tuple[str, ...] = ()
 
 
 class ConfigEntry(BaseModel):
     """A single configuration entry."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     name: str = Field(description="Environment variable or config name")
     value: str | None = Field(default=None, description="Current value")
@@ -46,7 +57,7 @@ class ConfigEntry(BaseModel):
         default=None,
         description="Deprecation message if deprecated",
     )
-    valid_values: list[str] | None = Field(
+    valid_values: tuple[str, ...] | None = Field(
         default=None,
         description="List of valid values if constrained",
     )
@@ -55,65 +66,93 @@ class ConfigEntry(BaseModel):
         description="Regex pattern for validation",
     )
 
+    # Derived once at construction; the entry is frozen
+    _is_set: bool = PrivateAttr(default=False)
+    _effective_value: str | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        value = self.value
+        if value is None:
+            self._effective_value = self.default_value
+        else:
+            self._is_set = value != self.default_value
+            self._effective_value = value
+
     @property
     def is_set(self) -> bool:
         """Check if this config has a non-default value."""
-        return self.value is not None and self.value != self.default_value
+        return self._is_set
 
     @property
     def effective_value(self) -> str | None:
         """Get the effective value (set value or default)."""
-        return self.value if self.value is not None else self.default_value
+        return self._effective_value
+
+    def is_valid(self, value: str) -> bool:
+        """Check a value against this entry's validation pattern.
+
+        Args:
+            value: Value to check
+
+        Returns:
+            True if there is no pattern or the whole value matches it
+        """
+        if self.validation_pattern is None:
+            return True
+        return _compiled(self.validation_pattern).fullmatch(value) is not None
 
 
 class ConfigReport(BaseModel):
     """Complete configuration analysis report."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     image_reference: str = Field(description="Image that was analyzed")
-    entries: list[ConfigEntry] = Field(default_factory=list, description="All config entries")
-    warnings: list[str] = Field(default_factory=list, description="Configuration warnings")
-    recommendations: list[str] = Field(
-        default_factory=list,
+    entries: tuple[ConfigEntry, ...] = Field(
+        default=(),
+        description="All config entries",
+    )
+    warnings: tuple[str, ...] = Field(default=(), description="Configuration warnings")
+    recommendations: tuple[str, ...] = Field(
+        default=(),
         description="Optimization recommendations",
     )
 
+    # Filtered views computed once at construction; the report is frozen
+    _high_impact: tuple[ConfigEntry, ...] = PrivateAttr(default=())
+    _deprecated: tuple[ConfigEntry, ...] = PrivateAttr(default=())
+    _required_missing: tuple[ConfigEntry, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        high_impact: list[ConfigEntry] = []
+        deprecated: list[ConfigEntry] = []
+        required_missing: list[ConfigEntry] = []
+        for e in self.entries:
+            if e.impact and e.impact.level >= ImpactLevel.HIGH:
+                high_impact.append(e)
+            if e.is_deprecated and e._is_set:
+                deprecated.append(e)
+            if e.is_required and not e._is_set:
+                required_missing.append(e)
+        self._high_impact = tuple(high_impact)
+        self._deprecated = tuple(deprecated)
+        self._required_missing = tuple(required_missing)
+
     @property
-    def high_impact_entries(self) -> list[ConfigEntry]:
+    def high_impact_entries(self) -> tuple[ConfigEntry, ...]:
         """Get entries with high or critical impact."""
-        return [
-            e
-            for e in self.entries
-            if e.impact and e.impact.level in (ImpactLevel.HIGH, ImpactLevel.CRITICAL)
-        ]
+        return self._high_impact
 
     @property
-    def deprecated_entries(self) -> list[ConfigEntry]:
+    def deprecated_entries(self) -> tuple[ConfigEntry, ...]:
         """Get deprecated config entries that are set."""
-        return [e for e in self.entries if e.is_deprecated and e.is_set]
+        return self._deprecated
 
     @property
-    def required_missing(self) -> list[ConfigEntry]:
+    def required_missing(self) -> tuple[ConfigEntry, ...]:
         """Get required entries that are not set."""
-        return [e for e in self.entries if e.is_required and not e.is_set]
+        return self._required_missing
 
 
-class ConfigResult(BaseModel):
+class ConfigResult(Result[ConfigReport]):
     """Result of a configuration analysis operation."""
-
-    model_config = {"frozen": True}
-
-    success: bool = Field(description="Whether the analysis succeeded")
-    report: ConfigReport | None = Field(default=None, description="The config report if successful")
-    errors: list[AuditError] = Field(default_factory=list, description="Errors that occurred")
-
-    @classmethod
-    def ok(cls, report: ConfigReport) -> "ConfigResult":
-        """Create a successful result."""
-        return cls(success=True, report=report)
-
-    @classmethod
-    def fail(cls, errors: list[AuditError]) -> "ConfigResult":
-        """Create a failed result."""
-        return cls(success=False, errors=errors)
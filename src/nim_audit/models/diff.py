@@ -1,78 +1,104 @@
 """Diff-related data models."""
 
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from nim_audit.models.common import AuditError
+from nim_audit.models.common import (
+    FROZEN_MODEL_CONFIG,
+    DataModel,
+    LabeledIntEnum,
+    Result,
+    utcnow,
+)
 from nim_audit.models.image import ImageMetadata
 
+if TYPE_CHECKING:
+    from nim_audit.models._msgspec import DiffReportMs
 
-class ChangeType(str, Enum):
+
+class ChangeType(LabeledIntEnum):
     """Type of change detected."""
 
-    ADDED = "added"
-    REMOVED = "removed"
-    MODIFIED = "modified"
-    UNCHANGED = "unchanged"
+    ADDED = 0, "added"
+    REMOVED = 1, "removed"
+    MODIFIED = 2, "modified"
+    UNCHANGED = 3, "unchanged"
 
 
-class ChangeCategory(str, Enum):
+class ChangeCategory(LabeledIntEnum):
     """Category of the changed artifact."""
 
-    METADATA = "metadata"
-    MODEL = "model"
-    TOKENIZER = "tokenizer"
-    API = "api"
-    RUNTIME = "runtime"
-    LAYER = "layer"
-    CONFIG = "config"
-    ENVIRONMENT = "environment"
-
-
-class Severity(str, Enum):
-    """Severity level of a change."""
-
-    INFO = "info"
-    WARNING = "warning"
-    BREAKING = "breaking"
-
-
-class DiffEntry(BaseModel):
-    """A single difference entry between two images."""
-
-    model_config = {"frozen": True}
-
-    category: ChangeCategory = Field(description="Category of the changed item")
-    change_type: ChangeType = Field(description="Type of change")
-    path: str = Field(description="Path or identifier of the changed item")
-    old_value: str | None = Field(default=None, description="Previous value")
-    new_value: str | None = Field(default=None, description="New value")
-    severity: Severity = Field(default=Severity.INFO, description="Change severity")
-    description: str = Field(default="", description="Human-readable description")
-
-
-class BreakingChange(BaseModel):
-    """A breaking change that may affect compatibility."""
-
-    model_config = {"frozen": True}
-
-    category: ChangeCategory = Field(description="Category of the breaking change")
-    title: str = Field(description="Short title of the breaking change")
-    description: str = Field(description="Detailed description")
-    impact: str = Field(description="Expected impact on users")
-    migration: str | None = Field(default=None, description="Migration guidance")
-    related_entries: list[str] = Field(
-        default_factory=list,
-        description="Paths of related diff entries",
-    )
+    METADATA = 0, "metadata"
+    MODEL = 1, "model"
+    TOKENIZER = 2, "tokenizer"
+    API = 3, "api"
+    RUNTIME = 4, "runtime"
+    LAYER = 5, "layer"
+    CONFIG = 6, "config"
+    ENVIRONMENT = 7, "environment"
+
+
+class Severity(LabeledIntEnum):
+    """Severity level of a change, ordered from least to most severe."""
+
+    INFO = 0, "info"
+    WARNING = 1, "warning"
+    BREAKING = 2, "breaking"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DiffEntry(DataModel):
+    """A single difference entry between two images.
+
+    Attributes:
+        category: Category of the changed item
+        change_type: Type of change
+        path: Path or identifier of the changed item
+        old_value: Previous value
+        new_value: New value
+        severity: Change severity
+        description: Human-readable description
+    """
+
+    category: ChangeCategory
+    change_type: ChangeType
+    path: str
+    old_value: str | None = None
+    new_value: str | None = None
+    severity: Severity = Severity.INFO
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BreakingChange(DataModel):
+    """A breaking change that may affect compatibility.
+
+    Attributes:
+        category: Category of the breaking change
+        title: Short title of the breaking change
+        description: Detailed description
+        impact: Expected impact on users
+        migration: Migration guidance
+        related_entries: Paths of related diff entries
+    """
+
+    category: ChangeCategory
+    title: str
+    description: str
+    impact: str
+    migration: str | None = None
+    related_entries: tuple[str, ...] = ()
 
 
 class DiffReport(BaseModel):
     """Complete diff report between two images."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     # Images compared
     source_image: ImageMetadata = Field(description="Source (old) image metadata")
@@ -80,14 +106,14 @@ class DiffReport(BaseModel):
 
     # Timestamp
     generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Report generation timestamp",
     )
 
     # Changes
-    entries: list[DiffEntry] = Field(default_factory=list, description="All diff entries")
-    breaking_changes: list[BreakingChange] = Field(
-        default_factory=list,
+    entries: tuple[DiffEntry, ...] = Field(default=(), description="All diff entries")
+    breaking_changes: tuple[BreakingChange, ...] = Field(
+        default=(),
         description="Detected breaking changes",
     )
 
@@ -97,35 +123,95 @@ class DiffReport(BaseModel):
     removed_count: int = Field(default=0, description="Number of removals")
     modified_count: int = Field(default=0, description="Number of modifications")
 
+    # Entries bucketed once at construction; the report is frozen
+    _by_category: dict[ChangeCategory, tuple[DiffEntry, ...]] = PrivateAttr(default_factory=dict)
+    _by_severity: dict[Severity, tuple[DiffEntry, ...]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        by_category: defaultdict[ChangeCategory, list[DiffEntry]] = defaultdict(list)
+        by_severity: defaultdict[Severity, list[DiffEntry]] = defaultdict(list)
+        for e in self.entries:
+            by_category[e.category].append(e)
+            by_severity[e.severity].append(e)
+        self._by_category = {k: tuple(v) for k, v in by_category.items()}
+        self._by_severity = {k: tuple(v) for k, v in by_severity.items()}
+
+    @classmethod
+    def build(
+        cls,
+        source_image: ImageMetadata,
+        target_image: ImageMetadata,
+        entries: Iterable[DiffEntry],
+        breaking_changes: Iterable[BreakingChange] = (),
+        *,
+        now: datetime | None = None,
+    ) -> "DiffReport":
+        """Create a report, deriving the summary counts from the entries.
+
+        Args:
+            source_image: Source (old) image metadata
+            target_image: Target (new) image metadata
+            entries: All diff entries
+            breaking_changes: Detected breaking changes
+            now: Generation timestamp; pass one shared value when building
+                many reports in a batch. Defaults to the current UTC time.
+
+        Returns:
+            The diff report
+        """
+        entries = tuple(entries)
+        counts = Counter(e.change_type for e in entries)
+        return cls(
+            source_image=source_image,
+            target_image=target_image,
+            generated_at=now if now is not None else utcnow(),
+            entries=entries,
+            breaking_changes=tuple(breaking_changes),
+            total_changes=len(entries),
+            added_count=counts[ChangeType.ADDED],
+            removed_count=counts[ChangeType.REMOVED],
+            modified_count=counts[ChangeType.MODIFIED],
+        )
+
+    def to_msgspec(self) -> "DiffReportMs":
+        """Convert to a msgspec struct for fast JSON encoding.
+
+        Requires the optional ``msgspec`` dependency.
+
+        Returns:
+            The msgspec mirror of this report
+        """
+        from nim_audit.models._msgspec import to_struct
+
+        return to_struct(self)
+
+    @classmethod
+    def from_msgspec(cls, struct: "DiffReportMs") -> "DiffReport":
+        """Create a report from its msgspec mirror.
+
+        Args:
+            struct: Struct produced by ``to_msgspec`` or decoded from JSON
+
+        Returns:
+            The diff report
+        """
+        from nim_audit.models._msgspec import from_struct
+
+        return from_struct(struct)
+
     @property
     def has_breaking_changes(self) -> bool:
         """Check if there are any breaking changes."""
         return len(self.breaking_changes) > 0
 
-    def entries_by_category(self, category: ChangeCategory) -> list[DiffEntry]:
+    def entries_by_category(self, category: ChangeCategory) -> tuple[DiffEntry, ...]:
         """Filter entries by category."""
-        return [e for e in self.entries if e.category == category]
+        return self._by_category.get(category, ())
 
-    def entries_by_severity(self, severity: Severity) -> list[DiffEntry]:
+    def entries_by_severity(self, severity: Severity) -> tuple[DiffEntry, ...]:
         """Filter entries by severity."""
-        return [e for e in self.entries if e.severity == severity]
+        return self._by_severity.get(severity, ())
 
 
-class DiffResult(BaseModel):
+class DiffResult(Result[DiffReport]):
     """Result of a diff operation."""
-
-    model_config = {"frozen": True}
-
-    success: bool = Field(description="Whether the diff operation succeeded")
-    report: DiffReport | None = Field(default=None, description="The diff report if successful")
-    errors: list[AuditError] = Field(default_factory=list, description="Errors that occurred")
-
-    @classmethod
-    def ok(cls, report: DiffReport) -> "DiffResult":
-        """Create a successful result."""
-        return cls(success=True, report=report)
-
-    @classmethod
-    def fail(cls, errors: list[AuditError]) -> "DiffResult":
-        """Create a failed result."""
-        return cls(success=False, errors=errors)
@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+import sys
+from collections import Counter
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
+from pydantic_core import CoreSchema, core_schema
 
+from nim_audit.models.common import FROZEN_MODEL_CONFIG, DataModel, LabeledIntEnum
 
-class ImpactMetric(str, Enum):
+
+class ImpactMetric(LabeledIntEnum):
     """Metrics that environment variables can affect."""
 
-    LATENCY = "latency"
-    THROUGHPUT = "throughput"
-    MEMORY = "memory"
-    DETERMINISM = "determinism"
-    NUMERICS = "numerics"
-    COMPATIBILITY = "compatibility"
+    LATENCY = 0, "latency"
+    THROUGHPUT = 1, "throughput"
+    MEMORY = 2, "memory"
+    DETERMINISM = 3, "determinism"
+    NUMERICS = 4, "numerics"
+    COMPATIBILITY = 5, "compatibility"
 
 
 class ImpactLevel(str, Enum):
@@ -38,134 +53,202 @@ class Severity(str, Enum):
     FAIL = "FAIL"
 
 
-class Affect(BaseModel):
-    """How an env var affects a metric."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Affect(DataModel):
+    """How an env var affects a metric.
 
-    model_config = {"frozen": True}
+    Attributes:
+        metric: The metric being affected
+        impact: The impact level
+    """
 
-    metric: ImpactMetric = Field(description="The metric being affected")
-    impact: ImpactLevel = Field(description="The impact level")
+    metric: ImpactMetric
+    impact: ImpactLevel
 
 
-class Evidence(BaseModel):
-    """Evidence of an env var's presence in a file."""
+class Signals(NamedTuple):
+    """Counts of the usage signals found for an env var in one file.
 
-    model_config = {"frozen": True}
+    Serialized as a ``{name: count}`` mapping.
+    """
+
+    conditional: int = 0
+    assignment: int = 0
+    help_context: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Get the signals as a ``{name: count}`` dict."""
+        return self._asdict()
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        schema = handler(source)
+        serializer = core_schema.plain_serializer_function_ser_schema(
+            cls.as_dict
+        )
+        schema["serialization"] = serializer  # type: ignore[index]
+        return schema
 
-    path: str = Field(description="File path where var was found")
-    count: int = Field(description="Number of occurrences")
-    score: float = Field(description="Relevance score")
-    sample_snippets: list[str] = Field(
-        default_factory=list, description="Sample code snippets"
-    )
-    signals: dict[str, int] = Field(
-        default_factory=dict,
-        description="Signal types (conditional, assignment, help_context)",
-    )
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Evidence(DataModel):
+    """Evidence of an env var's presence in a file.
+
+    Attributes:
+        path: File path where var was found
+        count: Number of occurrences
+        score: Relevance score
+        sample_snippets: Sample code snippets
+        signals: Signal types (conditional, assignment, help_context)
+    """
+
+    path: str
+    count: int
+    score: float
+    sample_snippets: tuple[str, ...] = ()
+    signals: Signals = Signals()
 
 
 class DiscoveredVar(BaseModel):
     """An environment variable discovered in the container."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG | ConfigDict(defer_build=True)
 
     name: str = Field(description="Variable name")
     score: float = Field(description="Total relevance score")
-    evidences: list[Evidence] = Field(
-        default_factory=list, description="Evidence of usage"
+    evidences: tuple[Evidence, ...] = Field(
+        default=(), description="Evidence of usage"
     )
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def _intern_name(cls, v: str) -> str:
+        # Names recur across files and registry lookups; share one string
+        return sys.intern(v)
+
 
 class DiscoveryResult(BaseModel):
     """Result of environment variable discovery."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG | ConfigDict(defer_build=True)
 
-    prefixes: list[str] = Field(description="Prefixes searched for")
-    vars: list[DiscoveredVar] = Field(description="Discovered variables")
+    prefixes: tuple[str, ...] = Field(description="Prefixes searched for")
+    vars: tuple[DiscoveredVar, ...] = Field(description="Discovered variables")
     files_scanned: int = Field(description="Number of files scanned")
 
 
 class RegistryEntry(BaseModel):
     """A known environment variable from the registry."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG | ConfigDict(defer_build=True)
 
     name: str = Field(description="Variable name")
     type: str | None = Field(default=None, description="Value type (enum, int, etc)")
     scope: str | None = Field(default=None, description="Scope (service, runtime)")
     precedence: str | None = Field(default=None, description="Precedence rules")
     default: str | None = Field(default=None, description="Default value")
-    affects: list[Affect] = Field(
-        default_factory=list, description="Metrics affected"
+    affects: tuple[Affect, ...] = Field(
+        default=(), description="Metrics affected"
     )
     determinism: str | None = Field(default=None, description="Determinism notes")
-    interactions: list[dict[str, Any]] = Field(
-        default_factory=list, description="Variable interactions"
+    interactions: tuple[dict[str, Any], ...] = Field(
+        default=(), description="Variable interactions"
     )
-    failure_modes: list[str] = Field(
-        default_factory=list, description="Known failure modes"
+    failure_modes: tuple[str, ...] = Field(
+        default=(), description="Known failure modes"
     )
     confidence: str = Field(default="LOW", description="Confidence level (HIGH/MED/LOW)")
-    evidence: list[dict[str, Any]] = Field(
-        default_factory=list, description="Evidence sources"
+    evidence: tuple[dict[str, Any], ...] = Field(
+        default=(), description="Evidence sources"
     )
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def _intern_name(cls, v: str) -> str:
+        return sys.intern(v)
+
 
-class InteractionEdge(BaseModel):
-    """An interaction between two environment variables."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InteractionEdge(DataModel):
+    """An interaction between two environment variables.
 
-    model_config = {"frozen": True}
+    Attributes:
+        var_a: First variable
+        var_b: Second variable
+        interaction_type: Type of interaction
+        description: Description of the interaction
+    """
 
-    var_a: str = Field(description="First variable")
-    var_b: str = Field(description="Second variable")
-    interaction_type: str = Field(description="Type of interaction")
-    description: str = Field(description="Description of the interaction")
+    var_a: str
+    var_b: str
+    interaction_type: str
+    description: str
 
 
 class Registry(BaseModel):
     """Registry of known environment variables."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG | ConfigDict(defer_build=True)
 
     entries: dict[str, RegistryEntry] = Field(
         default_factory=dict, description="Registry entries by name"
     )
-    interactions: list[InteractionEdge] = Field(
-        default_factory=list, description="Variable interactions"
+    interactions: tuple[InteractionEdge, ...] = Field(
+        default=(), description="Variable interactions"
     )
-    warnings: list[str] = Field(
-        default_factory=list, description="Parse warnings"
+    warnings: tuple[str, ...] = Field(
+        default=(), description="Parse warnings"
     )
 
 
-class Finding(BaseModel):
-    """A lint finding."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Finding(DataModel):
+    """A lint finding.
 
-    model_config = {"frozen": True}
+    Attributes:
+        id: Finding ID
+        severity: Severity level
+        env: Related env var
+        message: Finding message
+    """
 
-    id: str = Field(description="Finding ID")
-    severity: Severity = Field(description="Severity level")
-    env: str | None = Field(default=None, description="Related env var")
-    message: str = Field(description="Finding message")
+    id: str
+    severity: Severity
+    env: str | None = None
+    message: str
+
+
+_SEVERITY_ORDER = {Severity.INFO: 0, Severity.WARN: 1, Severity.FAIL: 2}
 
 
 class LintResult(BaseModel):
-    """Result of environment linting."""
+    """Result of environment linting.
 
-    model_config = {"frozen": True}
+    ``counts`` and ``overall`` are derived from ``findings`` on first access.
+    """
 
-    overall: str = Field(description="Overall status (PASS/WARN/FAIL)")
-    findings: list[Finding] = Field(default_factory=list, description="Findings")
-    counts: dict[str, int] = Field(
-        default_factory=dict, description="Count by severity"
-    )
+    model_config = FROZEN_MODEL_CONFIG | ConfigDict(defer_build=True, extra="ignore")
+
+    findings: tuple[Finding, ...] = Field(default=(), description="Findings")
+
+    @cached_property
+    def counts(self) -> Counter[Severity]:
+        """Get the number of findings per severity (0 for absent ones)."""
+        return Counter(f.severity for f in self.findings)
+
+    @computed_field(description="Overall status (PASS/WARN/FAIL)")  # type: ignore[prop-decorator]
+    @cached_property
+    def overall(self) -> str:
+        worst = max(self.counts, key=_SEVERITY_ORDER.__getitem__, default=Severity.INFO)
+        return "PASS" if worst is Severity.INFO else worst.value
 
 
 class EnvSurface(BaseModel):
     """Environment variable surface for an image."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     vars: dict[str, Any] = Field(
         default_factory=dict, description="All known variables"
@@ -175,32 +258,57 @@ class EnvSurface(BaseModel):
 class EnvDiff(BaseModel):
     """Diff between two env surfaces."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
-    added: list[str] = Field(default_factory=list, description="Added variables")
-    removed: list[str] = Field(default_factory=list, description="Removed variables")
+    added: frozenset[str] = Field(default=frozenset(), description="Added variables")
+    removed: frozenset[str] = Field(default=frozenset(), description="Removed variables")
     changed: dict[str, list[Any]] = Field(
         default_factory=dict, description="Changed values [old, new]"
     )
     risky_changed: int = Field(default=0, description="Number of risky changes")
 
+    @classmethod
+    def between(cls, source: EnvSurface, target: EnvSurface) -> EnvDiff:
+        """Diff two env surfaces using set operations on their variable names.
+
+        Args:
+            source: Baseline surface
+            target: New surface
+
+        Returns:
+            EnvDiff with added, removed, and changed variables
+        """
+        a, b = source.vars, target.vars
+        changed = {
+            k: [a.get(k), b.get(k)] for k in sorted(a.keys() | b.keys()) if a.get(k) != b.get(k)
+        }
+        return cls(
+            added=frozenset(b.keys() - a.keys()),
+            removed=frozenset(a.keys() - b.keys()),
+            changed=changed,
+        )
+
+    @field_serializer("added", "removed", when_used="json")
+    def _serialize_names(self, names: frozenset[str]) -> list[str]:
+        return sorted(names)
+
 
 class EnvDescribeVar(BaseModel):
     """Detailed description of an environment variable."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     name: str = Field(description="Variable name")
     effective: str | None = Field(default=None, description="Effective value")
     confidence: str = Field(default="LOW", description="Confidence level")
-    affects: list[dict[str, str]] = Field(
-        default_factory=list, description="Affected metrics"
+    affects: tuple[dict[str, str], ...] = Field(
+        default=(), description="Affected metrics"
     )
-    interactions: list[dict[str, str]] = Field(
-        default_factory=list, description="Variable interactions"
+    interactions: tuple[dict[str, str], ...] = Field(
+        default=(), description="Variable interactions"
     )
-    failure_modes: list[str] = Field(
-        default_factory=list, description="Known failure modes"
+    failure_modes: tuple[str, ...] = Field(
+        default=(), description="Known failure modes"
     )
     discovered: bool = Field(default=False, description="Whether discovered in image")
     in_registry: bool = Field(default=False, description="Whether in registry")
@@ -1,42 +1,137 @@
 """Behavioral fingerprinting data models."""
 
+import hashlib
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer, computed_field
 
-from nim_audit.models.common import AuditError
+from nim_audit.models.common import FROZEN_MODEL_CONFIG, AuditError, DataModel, utcnow
 
+RESPONSE_HASH_SIZE = 16
 
-class PromptResponse(BaseModel):
-    """A single prompt-response pair for fingerprinting."""
 
-    model_config = {"frozen": True}
+def _hex_to_bytes(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        # Older fingerprints may hold hash strings that are not hex
+        return value.encode()
 
-    prompt_id: str = Field(description="Identifier for this prompt")
-    prompt: str = Field(description="The input prompt")
-    response: str = Field(description="The model response")
-    tokens_in: int = Field(default=0, description="Input token count")
-    tokens_out: int = Field(default=0, description="Output token count")
-    latency_ms: float = Field(default=0.0, description="Response latency in milliseconds")
-    response_hash: str | None = Field(default=None, description="Hash of the response for comparison")
+
+# Raw digest in memory, hex string in JSON
+HexDigest = Annotated[
+    bytes,
+    BeforeValidator(_hex_to_bytes),
+    PlainSerializer(bytes.hex, when_used="json"),
+]
+
+
+def hash_response(text: str) -> bytes:
+    """Compute the digest used to compare responses across fingerprints.
+
+    Args:
+        text: Response text
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(text.encode(), digest_size=RESPONSE_HASH_SIZE).digest()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PromptResponse(DataModel):
+    """A single prompt-response pair for fingerprinting.
+
+    Attributes:
+        prompt_id: Identifier for this prompt
+        prompt: The input prompt
+        response: The model response
+        tokens_in: Input token count
+        tokens_out: Output token count
+        latency_ms: Response latency in milliseconds
+        response_hash: Digest of the response for comparison (hex in JSON)
+    """
+
+    prompt_id: str
+    prompt: str
+    response: str
+    tokens_in: int = 0
+    tokens_out: int = 0
+    latency_ms: float = 0.0
+    response_hash: HexDigest | None = None
+
+    def __post_init__(self) -> None:
+        # Accept hash strings as written by fingerprints saved before digests were bytes
+        if isinstance(self.response_hash, str):
+            object.__setattr__(self, "response_hash", _hex_to_bytes(self.response_hash))
+
+    def matches(self, other: "PromptResponse") -> bool:
+        """Check whether two responses have the same text.
+
+        Digests are compared when both are present and of the same kind;
+        otherwise, as for an older fingerprint holding a truncated SHA-256
+        hex digest, the response text itself is compared.
+
+        Args:
+            other: Response to compare against
+
+        Returns:
+            True if the responses are identical
+        """
+        a, b = self.response_hash, other.response_hash
+        if a is not None and b is not None and len(a) == len(b):
+            return a == b
+        return self.response == other.response
+
+    @classmethod
+    def from_text(
+        cls,
+        prompt_id: str,
+        prompt: str,
+        response: str,
+        **kwargs: Any,
+    ) -> "PromptResponse":
+        """Create a response, hashing its text for later comparison.
+
+        Args:
+            prompt_id: Identifier for this prompt
+            prompt: The input prompt
+            response: The model response
+            **kwargs: Remaining fields (token counts, latency)
+
+        Returns:
+            The prompt response with ``response_hash`` set
+        """
+        return cls(
+            prompt_id=prompt_id,
+            prompt=prompt,
+            response=response,
+            response_hash=hash_response(response),
+            **kwargs,
+        )
 
 
 class BehavioralSignature(BaseModel):
     """Behavioral signature of a NIM container."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     # Identity
     image_reference: str = Field(description="Image reference")
     fingerprint_id: str = Field(description="Unique fingerprint identifier")
     generated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utcnow,
         description="Generation timestamp",
     )
 
     # Responses
-    responses: list[PromptResponse] = Field(
-        default_factory=list,
+    responses: tuple[PromptResponse, ...] = Field(
+        default=(),
         description="Prompt-response pairs",
     )
 
@@ -54,32 +149,77 @@ class BehavioralSignature(BaseModel):
 
 
 class FingerprintComparison(BaseModel):
-    """Comparison between two behavioral fingerprints."""
+    """Comparison between two behavioral fingerprints.
 
-    model_config = {"frozen": True}
+    The comparison metrics are derived from ``source`` and ``target`` on
+    first access and cached; they are included when the model is dumped.
+    """
+
+    model_config = FROZEN_MODEL_CONFIG | ConfigDict(extra="ignore")
 
     source: BehavioralSignature = Field(description="Source fingerprint")
     target: BehavioralSignature = Field(description="Target fingerprint")
 
-    # Comparison results
-    identical_responses: int = Field(default=0, description="Number of identical responses")
-    different_responses: int = Field(default=0, description="Number of different responses")
-    similarity_score: float = Field(
-        default=0.0,
-        description="Overall similarity score (0.0 to 1.0)",
-    )
+    @cached_property
+    def _matched(self) -> tuple[int, tuple[dict[str, str], ...]]:
+        """Match responses by prompt_id: (identical count, per-prompt differences)."""
+        target_by_id = {r.prompt_id: r for r in self.target.responses}
+        identical = 0
+        diffs: list[dict[str, str]] = []
+        for source_resp in self.source.responses:
+            target_resp = target_by_id.pop(source_resp.prompt_id, None)
+            if target_resp is not None and source_resp.matches(target_resp):
+                identical += 1
+                continue
+            diffs.append(
+                {
+                    "prompt_id": source_resp.prompt_id,
+                    "source": source_resp.response[:100],
+                    "target": target_resp.response[:100] if target_resp else "MISSING",
+                }
+            )
+        for target_resp in target_by_id.values():
+            diffs.append(
+                {
+                    "prompt_id": target_resp.prompt_id,
+                    "source": "MISSING",
+                    "target": target_resp.response[:100],
+                }
+            )
+        return identical, tuple(diffs)
+
+    @computed_field(description="Number of identical responses")  # type: ignore[prop-decorator]
+    @cached_property
+    def identical_responses(self) -> int:
+        return self._matched[0]
 
-    # Detailed differences
-    response_diffs: list[dict[str, str]] = Field(
-        default_factory=list,
-        description="Detailed response differences",
+    @computed_field(description="Number of different responses")  # type: ignore[prop-decorator]
+    @cached_property
+    def different_responses(self) -> int:
+        return len(self._matched[1])
+
+    @computed_field(  # type: ignore[prop-decorator]
+        description="Overall similarity score (0.0 to 1.0)"
     )
+    @cached_property
+    def similarity_score(self) -> float:
+        total = self.identical_responses + self.different_responses
+        return self.identical_responses / total if total else 0.0
+
+    @computed_field(description="Detailed response differences")  # type: ignore[prop-decorator]
+    @cached_property
+    def response_diffs(self) -> tuple[dict[str, str], ...]:
+        return self._matched[1]
 
-    # Performance comparison
-    latency_change_percent: float = Field(
-        default=0.0,
-        description="Percentage change in average latency",
+    @computed_field(  # type: ignore[prop-decorator]
+        description="Percentage change in average latency"
     )
+    @cached_property
+    def latency_change_percent(self) -> float:
+        source_ms = self.source.avg_latency_ms
+        if source_ms <= 0:
+            return 0.0
+        return (self.target.avg_latency_ms - source_ms) / source_ms * 100
 
     @property
     def is_similar(self) -> bool:
@@ -90,7 +230,7 @@ class FingerprintComparison(BaseModel):
 class FingerprintResult(BaseModel):
     """Result of a fingerprint operation."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     success: bool = Field(description="Whether the operation succeeded")
     fingerprint: BehavioralSignature | None = Field(
@@ -101,7 +241,10 @@ class FingerprintResult(BaseModel):
         default=None,
         description="Comparison result if comparing fingerprints",
     )
-    errors: list[AuditError] = Field(default_factory=list, description="Errors that occurred")
+    errors: tuple[AuditError, ...] = Field(
+        default=(),
+        description="Errors that occurred",
+    )
 
     @classmethod
     def ok(
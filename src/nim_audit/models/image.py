@@ -1,18 +1,26 @@
 """Image-related data models."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from functools import cached_property
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 
+from nim_audit.models.common import FROZEN_MODEL_CONFIG, DataModel
 
-class ImageDigest(BaseModel):
-    """Container image digest information."""
 
-    model_config = {"frozen": True}
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageDigest(DataModel):
+    """Container image digest information.
 
-    algorithm: str = Field(default="sha256", description="Hash algorithm")
-    hash: str = Field(description="The digest hash value")
+    Attributes:
+        algorithm: Hash algorithm
+        hash: The digest hash value
+    """
+
+    algorithm: str = "sha256"
+    hash: str
 
     def __str__(self) -> str:
         return f"{self.algorithm}:{self.hash}"
@@ -26,27 +34,33 @@ class ImageDigest(BaseModel):
         return cls(hash=digest)
 
 
-class LayerInfo(BaseModel):
-    """Information about a container image layer."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LayerInfo(DataModel):
+    """Information about a container image layer.
 
-    model_config = {"frozen": True}
+    Attributes:
+        digest: Layer digest
+        size: Layer size in bytes
+        media_type: Layer media type
+        created_by: Command that created this layer
+    """
 
-    digest: ImageDigest = Field(description="Layer digest")
-    size: int = Field(description="Layer size in bytes")
-    media_type: str = Field(description="Layer media type")
-    created_by: str | None = Field(default=None, description="Command that created this layer")
+    digest: ImageDigest
+    size: int
+    media_type: str
+    created_by: str | None = None
 
 
 class ImageManifest(BaseModel):
     """Container image manifest information."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     schema_version: int = Field(description="Manifest schema version")
     media_type: str = Field(description="Manifest media type")
     digest: ImageDigest = Field(description="Manifest digest")
     config_digest: ImageDigest = Field(description="Config blob digest")
-    layers: list[LayerInfo] = Field(default_factory=list, description="Image layers")
+    layers: tuple[LayerInfo, ...] = Field(default=(), description="Image layers")
     annotations: dict[str, str] = Field(
         default_factory=dict,
         description="OCI annotations",
@@ -56,7 +70,7 @@ class ImageManifest(BaseModel):
 class ImageMetadata(BaseModel):
     """Comprehensive metadata about a NIM container image."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     # Identity
     reference: str = Field(description="Full image reference (registry/repo:tag)")
@@ -83,26 +97,28 @@ class ImageMetadata(BaseModel):
 
     # Environment
     env: dict[str, str] = Field(default_factory=dict, description="Default environment variables")
-    exposed_ports: list[int] = Field(default_factory=list, description="Exposed ports")
+    exposed_ports: tuple[int, ...] = Field(default=(), description="Exposed ports")
 
     # Entrypoint
-    entrypoint: list[str] = Field(default_factory=list, description="Container entrypoint")
-    cmd: list[str] = Field(default_factory=list, description="Container command")
+    entrypoint: tuple[str, ...] = Field(default=(), description="Container entrypoint")
+    cmd: tuple[str, ...] = Field(default=(), description="Container command")
 
-    # Raw config for extensibility
-    raw_config: dict[str, Any] = Field(
+    # Raw config for extensibility. Held by reference without validation:
+    # it is an opaque blob, and walking and copying it per image is wasted
+    raw_config: Annotated[dict[str, Any], SkipValidation] = Field(
         default_factory=dict,
         description="Raw container config for additional inspection",
     )
 
-    @property
+    # Derived values are cached on first access; the model is frozen
+    @cached_property
     def full_reference(self) -> str:
         """Get the full image reference with tag or digest."""
         if self.digest:
             return f"{self.reference}@{self.digest}"
         return self.reference
 
-    @property
+    @cached_property
     def total_size(self) -> int:
         """Calculate total image size from layers."""
         if self.manifest:
@@ -1,25 +1,26 @@
 """Policy and linting data models."""
 
-from enum import Enum
+from collections import Counter, defaultdict
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from nim_audit.models.common import AuditError
+from nim_audit.models.common import FROZEN_MODEL_CONFIG, AuditError, LabeledIntEnum
 
 
-class RuleSeverity(str, Enum):
-    """Severity of a lint rule."""
+class RuleSeverity(LabeledIntEnum):
+    """Severity of a lint rule, ordered from lowest to highest."""
 
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+    INFO = 0, "info"
+    WARNING = 1, "warning"
+    ERROR = 2, "error"
 
 
 class Rule(BaseModel):
     """A single policy rule."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     id: str = Field(description="Unique rule identifier")
     name: str = Field(description="Human-readable rule name")
@@ -40,44 +41,58 @@ class Rule(BaseModel):
 class Policy(BaseModel):
     """A collection of policy rules."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     name: str = Field(description="Policy name")
     version: str = Field(default="1.0.0", description="Policy version")
     description: str = Field(default="", description="Policy description")
-    rules: list[Rule] = Field(default_factory=list, description="Policy rules")
+    rules: tuple[Rule, ...] = Field(default=(), description="Policy rules")
 
     # Inheritance
-    extends: list[str] = Field(
-        default_factory=list,
+    extends: tuple[str, ...] = Field(
+        default=(),
         description="Parent policies to extend",
     )
 
     # Metadata
     author: str | None = Field(default=None, description="Policy author")
-    tags: list[str] = Field(default_factory=list, description="Policy tags")
+    tags: tuple[str, ...] = Field(default=(), description="Policy tags")
+
+    # Rule indexes built once at construction; the policy is frozen
+    _rule_index: dict[str, Rule] = PrivateAttr(default_factory=dict)
+    _enabled: tuple[Rule, ...] = PrivateAttr(default=())
+    _enabled_by_severity: dict[RuleSeverity, tuple[Rule, ...]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        rule_index: dict[str, Rule] = {}
+        by_severity: defaultdict[RuleSeverity, list[Rule]] = defaultdict(list)
+        for rule in self.rules:
+            # First definition wins, as with a front-to-back scan
+            rule_index.setdefault(rule.id, rule)
+            if rule.enabled:
+                by_severity[rule.severity].append(rule)
+        self._rule_index = rule_index
+        self._enabled = tuple(r for r in self.rules if r.enabled)
+        self._enabled_by_severity = {k: tuple(v) for k, v in by_severity.items()}
 
     def get_rule(self, rule_id: str) -> Rule | None:
         """Get a rule by ID."""
-        for rule in self.rules:
-            if rule.id == rule_id:
-                return rule
-        return None
+        return self._rule_index.get(rule_id)
 
     @property
-    def enabled_rules(self) -> list[Rule]:
+    def enabled_rules(self) -> tuple[Rule, ...]:
         """Get all enabled rules."""
-        return [r for r in self.rules if r.enabled]
+        return self._enabled
 
-    def rules_by_severity(self, severity: RuleSeverity) -> list[Rule]:
-        """Get rules by severity."""
-        return [r for r in self.rules if r.severity == severity and r.enabled]
+    def rules_by_severity(self, severity: RuleSeverity) -> tuple[Rule, ...]:
+        """Get enabled rules by severity."""
+        return self._enabled_by_severity.get(severity, ())
 
 
 class LintViolation(BaseModel):
     """A single lint violation."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     rule: Rule = Field(description="The violated rule")
     message: str = Field(description="Violation message")
@@ -94,35 +109,55 @@ class LintViolation(BaseModel):
 class LintResult(BaseModel):
     """Result of a lint operation."""
 
-    model_config = {"frozen": True}
+    model_config = FROZEN_MODEL_CONFIG
 
     success: bool = Field(description="Whether linting succeeded without errors")
     image_reference: str = Field(description="Image that was linted")
     policy: Policy = Field(description="Policy used for linting")
-    violations: list[LintViolation] = Field(
-        default_factory=list,
+    violations: tuple[LintViolation, ...] = Field(
+        default=(),
         description="All violations found",
     )
-    errors: list[AuditError] = Field(default_factory=list, description="Errors that occurred")
+    errors: tuple[AuditError, ...] = Field(
+        default=(),
+        description="Errors that occurred",
+    )
+
+    @cached_property
+    def _aggregate(
+        self,
+    ) -> tuple[Counter[RuleSeverity], dict[str, tuple[LintViolation, ...]]]:
+        # Severity counts and per-rule grouping, built in one pass
+        counts: Counter[RuleSeverity] = Counter()
+        grouped: defaultdict[str, list[LintViolation]] = defaultdict(list)
+        for v in self.violations:
+            counts[v.rule.severity] += 1
+            grouped[v.rule.id].append(v)
+        return counts, {k: tuple(g) for k, g in grouped.items()}
+
+    @property
+    def counts(self) -> Counter[RuleSeverity]:
+        """Number of violations at each severity."""
+        return self._aggregate[0]
 
     @property
     def passed(self) -> bool:
         """Check if lint passed (no error-level violations)."""
-        return not any(v.severity == RuleSeverity.ERROR for v in self.violations)
+        return not self.counts[RuleSeverity.ERROR]
 
     @property
     def error_count(self) -> int:
         """Count error-level violations."""
-        return sum(1 for v in self.violations if v.severity == RuleSeverity.ERROR)
+        return self.counts[RuleSeverity.ERROR]
 
     @property
     def warning_count(self) -> int:
         """Count warning-level violations."""
-        return sum(1 for v in self.violations if v.severity == RuleSeverity.WARNING)
+        return self.counts[RuleSeverity.WARNING]
 
-    def violations_by_rule(self, rule_id: str) -> list[LintViolation]:
+    def violations_by_rule(self, rule_id: str) -> tuple[LintViolation, ...]:
         """Get violations for a specific rule."""
-        return [v for v in self.violations if v.rule.id == rule_id]
+        return self._aggregate[1].get(rule_id, ())
 
     @classmethod
     def ok(
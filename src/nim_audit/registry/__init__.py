@@ -1,23 +1,29 @@
 """Container registry clients."""
 
 from nim_audit.registry.base import (
+    ImageReference,
     Registry,
     RegistryAuth,
     RegistryAuthError,
     RegistryError,
     RegistryNotFoundError,
+    parse_reference,
 )
 from nim_audit.registry.docker import DockerRegistry
 from nim_audit.registry.oci import OCIRegistry
 from nim_audit.registry.ngc import NGCRegistry
+from nim_audit.registry.shared import get_registry_client
 
 __all__ = [
+    "ImageReference",
     "Registry",
     "RegistryAuth",
     "RegistryAuthError",
     "RegistryError",
     "RegistryNotFoundError",
+    "parse_reference",
     "DockerRegistry",
     "OCIRegistry",
     "NGCRegistry",
+    "get_registry_client",
 ]
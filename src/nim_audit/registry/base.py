@@ -1,11 +1,25 @@
-"""Base registry protocol and types."""
+"""Base registry interface and types."""
 
-from typing import Protocol, runtime_checkable
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
 
 from pydantic import BaseModel, Field
 
 from nim_audit.models.image import ImageManifest, ImageMetadata
 
+# Labels holding NIM metadata, in ImageMetadata field order:
+# nim_version, model_name, model_version, quantization
+NIM_METADATA_LABELS = (
+    "com.nvidia.nim.version",
+    "com.nvidia.nim.model.name",
+    "com.nvidia.nim.model.version",
+    "com.nvidia.nim.model.quantization",
+)
+
 
 class RegistryAuth(BaseModel):
     """Authentication credentials for a container registry."""
@@ -23,16 +37,89 @@ class RegistryAuth(BaseModel):
         Looks for REGISTRY_USERNAME and REGISTRY_PASSWORD,
         or REGISTRY_TOKEN for token auth.
         """
-        import os
-
-        username = os.environ.get("REGISTRY_USERNAME")
-        password = os.environ.get("REGISTRY_PASSWORD")
-        token = os.environ.get("REGISTRY_TOKEN")
-
+        env = os.environ
+        token = env.get("REGISTRY_TOKEN")
+        # Values are plain strings from the environment; skip validation
         if token:
-            return cls(token=token)
+            return cls.model_construct(token=token)
+        username = env.get("REGISTRY_USERNAME")
+        password = env.get("REGISTRY_PASSWORD")
         if username and password:
-            return cls(username=username, password=password)
+            return cls.model_construct(username=username, password=password)
+        return None
+
+
+class ImageReference(NamedTuple):
+    """Components of a parsed image reference."""
+
+    registry: str | None
+    repository: str | None
+    tag: str | None
+    digest: str | None
+
+
+@lru_cache(maxsize=1024)
+def parse_reference(reference: str) -> ImageReference:
+    """Parse an image reference into components.
+
+    Results are cached, since batch operations parse the same references
+    repeatedly.
+
+    Args:
+        reference: Image reference string (e.g., "nvcr.io/nim/llama3:1.5.0")
+
+    Returns:
+        The registry, repository, tag and digest parts
+    """
+    registry: str | None = None
+    repository: str | None = None
+    tag: str | None = None
+    digest: str | None = None
+
+    # Handle digest
+    head, sep, tail = reference.rpartition("@")
+    if sep:
+        reference, digest = head, tail
+
+    # Handle tag; a numeric suffix or one containing "/" is a registry port
+    head, sep, tail = reference.rpartition(":")
+    if sep and "/" not in tail and not tail.isdigit():
+        reference, tag = head, tail
+
+    # Handle registry and repository
+    first, sep, rest = reference.partition("/")
+    if not sep:
+        repository = reference
+    elif "/" not in rest:
+        if "." in first or ":" in first or first == "localhost":
+            registry = first
+            repository = rest
+        else:
+            repository = reference
+    else:
+        registry = first
+        repository = rest
+
+    return ImageReference(registry, repository, tag, digest)
+
+
+@lru_cache(maxsize=1024)
+def parse_timestamp(timestamp: str | None) -> datetime | None:
+    """Parse an image config creation timestamp.
+
+    Args:
+        timestamp: RFC 3339 timestamp from the image config, if any
+
+    Returns:
+        The parsed datetime, or None if missing or malformed
+    """
+    if not timestamp:
+        return None
+
+    try:
+        # fromisoformat accepts "Z" and nanosecond fractions since 3.11
+        return datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
         return None
 
 
@@ -59,19 +146,18 @@ class RegistryNotFoundError(RegistryError):
         self.reference = reference
 
 
-@runtime_checkable
-class Registry(Protocol):
-    """Protocol for container registry clients.
+class Registry(ABC):
+    """Abstract base class for container registry clients.
 
     Registry clients are responsible for interacting with container
     registries to fetch manifests, metadata, and image layers.
 
     To implement a custom registry client:
-    1. Create a class that implements this protocol
+    1. Subclass Registry and implement its abstract methods
     2. Handle authentication appropriately for your registry
 
     Example:
-        class MyRegistry:
+        class MyRegistry(Registry):
             def __init__(self, base_url: str, auth: RegistryAuth | None = None):
                 self.base_url = base_url
                 self.auth = auth
@@ -87,11 +173,20 @@ class Registry(Protocol):
             def pull_layer(self, reference: str, digest: str, dest: Path) -> None:
                 # Download layer to destination
                 ...
+
+            def list_tags(self, repository: str) -> list[str]:
+                # List tags in the repository
+                ...
     """
 
+    @abstractmethod
     def get_manifest(self, reference: str) -> ImageManifest:
         """Get the manifest for an image.
 
+        Remote implementations should parse the response bytes once with
+        ``fastjson.loads`` and build ``LayerInfo`` values straight from the
+        parsed layer entries.
+
         Args:
             reference: Image reference (e.g., "nvcr.io/nim/llama3:1.5.0")
 
@@ -105,6 +200,7 @@ class Registry(Protocol):
         """
         ...
 
+    @abstractmethod
     def get_metadata(self, reference: str) -> ImageMetadata:
         """Get comprehensive metadata for an image.
 
@@ -121,7 +217,8 @@ class Registry(Protocol):
         """
         ...
 
-    def pull_layer(self, reference: str, digest: str, dest: "Path") -> None:
+    @abstractmethod
+    def pull_layer(self, reference: str, digest: str, dest: Path) -> None:
         """Download a layer blob to the specified destination.
 
         Args:
@@ -136,6 +233,7 @@ class Registry(Protocol):
         """
         ...
 
+    @abstractmethod
     def list_tags(self, repository: str) -> list[str]:
         """List all tags for a repository.
 
@@ -151,7 +249,3 @@ class Registry(Protocol):
             RegistryError: For other errors
         """
         ...
-
-
-# Import Path for type hints
-from pathlib import Path
@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
-import json
-import re
-from datetime import datetime
+import shutil
+import tarfile
 from pathlib import Path
 from typing import Any
 
 from nim_audit.models.image import ImageDigest, ImageManifest, ImageMetadata, LayerInfo
 from nim_audit.registry.base import (
+    NIM_METADATA_LABELS,
     Registry,
     RegistryAuth,
     RegistryAuthError,
     RegistryError,
     RegistryNotFoundError,
+    parse_reference,
+    parse_timestamp,
 )
+from nim_audit.utils.docker_client import get_docker_client
+from nim_audit.utils.streams import ChunkReader
 
 
-class DockerRegistry:
+class DockerRegistry(Registry):
     """Registry client for local Docker daemon.
 
     This client uses the Docker SDK to interact with the local
@@ -44,9 +48,7 @@ class DockerRegistry:
         """Get the Docker client, creating it if necessary."""
         if self._client is None:
             try:
-                import docker
-
-                self._client = docker.from_env()
+                self._client = get_docker_client()
             except ImportError:
                 raise RegistryError(
                     "Docker SDK not available. Install with: pip install docker",
@@ -73,33 +75,33 @@ class DockerRegistry:
             RegistryError: For other errors
         """
         try:
-            image = self.client.images.get(reference)
-            attrs = image.attrs
-
-            # Build layers from RootFS
-            layers = []
-            for layer_digest in attrs.get("RootFS", {}).get("Layers", []):
-                layers.append(
-                    LayerInfo(
-                        digest=ImageDigest.from_string(layer_digest),
-                        size=0,  # Size not available from this API
-                        media_type="application/vnd.docker.image.rootfs.diff.tar.gzip",
-                    )
-                )
-
-            return ImageManifest(
-                schema_version=2,
-                media_type="application/vnd.docker.distribution.manifest.v2+json",
-                digest=ImageDigest(hash=image.id.replace("sha256:", "")),
-                config_digest=ImageDigest(hash=image.id.replace("sha256:", "")),
-                layers=layers,
-            )
-
+            return self._build_manifest(self.client.images.get(reference))
         except Exception as e:
             if "not found" in str(e).lower() or "no such image" in str(e).lower():
                 raise RegistryNotFoundError(reference)
             raise RegistryError(f"Failed to get manifest: {e}")
 
+    @staticmethod
+    def _build_manifest(image: Any) -> ImageManifest:
+        """Build a manifest from an already-fetched docker-py image."""
+        layers = tuple(
+            LayerInfo(
+                digest=ImageDigest.from_string(layer_digest),
+                size=0,  # Size not available from this API
+                media_type="application/vnd.docker.image.rootfs.diff.tar.gzip",
+            )
+            for layer_digest in image.attrs.get("RootFS", {}).get("Layers", [])
+        )
+
+        # The local daemon returns well-typed JSON, so skip re-validation
+        return ImageManifest.model_construct(
+            schema_version=2,
+            media_type="application/vnd.docker.distribution.manifest.v2+json",
+            digest=ImageDigest(hash=image.id.removeprefix("sha256:")),
+            config_digest=ImageDigest(hash=image.id.removeprefix("sha256:")),
+            layers=layers,
+        )
+
     def get_metadata(self, reference: str) -> ImageMetadata:
         """Get comprehensive metadata for an image.
 
@@ -122,40 +124,36 @@ class DockerRegistry:
 
             # Parse environment variables
             env_list = config.get("Config", {}).get("Env", []) or []
-            env = {}
-            for item in env_list:
-                if "=" in item:
-                    key, value = item.split("=", 1)
-                    env[key] = value
+            env = dict(item.split("=", 1) for item in env_list if "=" in item)
 
             # Parse exposed ports
-            exposed_ports = []
             ports_config = config.get("Config", {}).get("ExposedPorts", {}) or {}
-            for port_spec in ports_config.keys():
-                port_match = re.match(r"(\d+)", port_spec)
-                if port_match:
-                    exposed_ports.append(int(port_match.group(1)))
+            # Specs look like "8000/tcp"
+            exposed_ports = tuple(
+                int(port) for spec in ports_config if (port := spec.partition("/")[0]).isdigit()
+            )
 
             # Parse creation timestamp
-            created = self._parse_timestamp(config.get("Created"))
+            created = parse_timestamp(config.get("Created"))
 
-            # Get manifest
-            manifest = self.get_manifest(reference)
+            # Build the manifest from the image already fetched above
+            manifest = self._build_manifest(image)
 
             # Parse reference
-            parsed = self._parse_reference(reference)
+            parsed = parse_reference(reference)
 
             # Extract NIM-specific metadata from labels
-            nim_version = labels.get("com.nvidia.nim.version")
-            model_name = labels.get("com.nvidia.nim.model.name")
-            model_version = labels.get("com.nvidia.nim.model.version")
-            quantization = labels.get("com.nvidia.nim.model.quantization")
+            nim_version, model_name, model_version, quantization = map(
+                labels.get, NIM_METADATA_LABELS
+            )
 
-            return ImageMetadata(
+            # Trusted daemon data: fields are built above with the right
+            # types, so construct without running validation
+            return ImageMetadata.model_construct(
                 reference=reference,
-                repository=parsed.get("repository") or reference,
-                tag=parsed.get("tag"),
-                digest=ImageDigest(hash=image.id.replace("sha256:", "")),
+                repository=parsed.repository or reference,
+                tag=parsed.tag,
+                digest=ImageDigest(hash=image.id.removeprefix("sha256:")),
                 manifest=manifest,
                 labels=labels,
                 created=created,
@@ -167,8 +165,8 @@ class DockerRegistry:
                 quantization=quantization,
                 env=env,
                 exposed_ports=exposed_ports,
-                entrypoint=config.get("Config", {}).get("Entrypoint", []) or [],
-                cmd=config.get("Config", {}).get("Cmd", []) or [],
+                entrypoint=tuple(config.get("Config", {}).get("Entrypoint") or ()),
+                cmd=tuple(config.get("Config", {}).get("Cmd") or ()),
                 raw_config=config,
             )
 
@@ -198,39 +196,19 @@ class DockerRegistry:
         try:
             image = self.client.images.get(reference)
 
-            # Export image and extract the specific layer
-            # This is a simplified implementation
-            import tarfile
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(suffix=".tar", delete=False) as tmp:
-                tmp_path = tmp.name
-
-            try:
-                # Export the entire image
-                with open(tmp_path, "wb") as f:
-                    for chunk in image.save():
-                        f.write(chunk)
-
-                # Extract the specific layer
-                with tarfile.open(tmp_path, "r") as tar:
-                    # Find the layer file
-                    layer_file = None
-                    for member in tar.getmembers():
-                        if digest.replace("sha256:", "") in member.name and member.name.endswith(
-                            "/layer.tar"
-                        ):
-                            layer_file = member
-                            break
-
-                    if layer_file:
-                        extracted = tar.extractfile(layer_file)
+            # Stream the exported image tar and copy out the one layer we
+            # need, rather than spooling the whole image to a temp file
+            layer_id = digest.removeprefix("sha256:")
+            with tarfile.open(fileobj=ChunkReader(image.save()), mode="r|") as tar:
+                for member in tar:
+                    if layer_id in member.name and member.name.endswith("/layer.tar"):
+                        extracted = tar.extractfile(member)
                         if extracted:
-                            dest.write_bytes(extracted.read())
-                    else:
-                        raise RegistryNotFoundError(f"Layer {digest} not found in image")
-            finally:
-                Path(tmp_path).unlink(missing_ok=True)
+                            with dest.open("wb") as out:
+                                shutil.copyfileobj(extracted, out, length=1 << 20)
+                        break
+                else:
+                    raise RegistryNotFoundError(f"Layer {digest} not found in image")
 
         except RegistryNotFoundError:
             raise
@@ -249,16 +227,16 @@ class DockerRegistry:
             List of tag names
         """
         try:
-            images = self.client.images.list(name=repository)
-            tags = []
-            for image in images:
-                for tag in image.tags:
-                    if ":" in tag:
-                        _, tag_name = tag.rsplit(":", 1)
-                        tags.append(tag_name)
-                    else:
-                        tags.append(tag)
-            return sorted(set(tags))
+            # The low-level API returns the image summaries as plain dicts,
+            # skipping the per-image model objects images.list() builds
+            summaries = self.client.api.images(name=repository)
+            tags = {
+                tag.rsplit(":", 1)[1] if ":" in tag else tag
+                for summary in summaries
+                for tag in summary.get("RepoTags") or ()
+                if tag != "<none>:<none>"
+            }
+            return sorted(tags)
         except Exception as e:
             raise RegistryError(f"Failed to list tags: {e}")
 
@@ -302,68 +280,3 @@ class DockerRegistry:
             if "unauthorized" in err_str or "authentication" in err_str:
                 raise RegistryAuthError(f"Authentication failed for {reference}")
             raise RegistryError(f"Failed to pull image: {e}")
-
-    @staticmethod
-    def _parse_reference(reference: str) -> dict[str, str | None]:
-        """Parse an image reference into components."""
-        result: dict[str, str | None] = {
-            "registry": None,
-            "repository": None,
-            "tag": None,
-            "digest": None,
-        }
-
-        # Handle digest
-        if "@" in reference:
-            ref_part, digest = reference.rsplit("@", 1)
-            result["digest"] = digest
-            reference = ref_part
-
-        # Handle tag
-        if ":" in reference:
-            parts = reference.rsplit(":", 1)
-            if "/" not in parts[1] and not parts[1].isdigit():
-                reference = parts[0]
-                result["tag"] = parts[1]
-
-        # Handle registry and repository
-        parts = reference.split("/")
-        if len(parts) == 1:
-            result["repository"] = parts[0]
-        elif len(parts) == 2:
-            if "." in parts[0] or ":" in parts[0] or parts[0] == "localhost":
-                result["registry"] = parts[0]
-                result["repository"] = parts[1]
-            else:
-                result["repository"] = reference
-        else:
-            result["registry"] = parts[0]
-            result["repository"] = "/".join(parts[1:])
-
-        return result
-
-    @staticmethod
-    def _parse_timestamp(timestamp: str | None) -> datetime | None:
-        """Parse a Docker timestamp string."""
-        if not timestamp:
-            return None
-
-        try:
-            # Handle ISO format with timezone
-            timestamp = timestamp.replace("Z", "+00:00")
-            if "." in timestamp:
-                # Truncate fractional seconds to 6 digits
-                parts = timestamp.split(".")
-                frac_and_tz = parts[1]
-                tz_start = -1
-                for i, c in enumerate(frac_and_tz):
-                    if c in "+-":
-                        tz_start = i
-                        break
-                if tz_start > 0:
-                    frac = frac_and_tz[:tz_start][:6]
-                    tz = frac_and_tz[tz_start:]
-                    timestamp = f"{parts[0]}.{frac}{tz}"
-            return datetime.fromisoformat(timestamp)
-        except (ValueError, TypeError):
-            return None
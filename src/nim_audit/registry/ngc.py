@@ -89,30 +89,10 @@ class NGCRegistry(OCIRegistry):
             "ngc.tensorrt.version": labels.get("com.nvidia.tensorrt.version"),
         }
 
-        # Add NGC metadata to raw_config
-        raw_config = dict(metadata.raw_config)
-        raw_config["ngc_metadata"] = {k: v for k, v in ngc_labels.items() if v is not None}
-
-        # Return enhanced metadata
-        return ImageMetadata(
-            reference=metadata.reference,
-            repository=metadata.repository,
-            tag=metadata.tag,
-            digest=metadata.digest,
-            manifest=metadata.manifest,
-            labels=metadata.labels,
-            created=metadata.created,
-            architecture=metadata.architecture,
-            os=metadata.os,
-            nim_version=metadata.nim_version,
-            model_name=metadata.model_name,
-            model_version=metadata.model_version,
-            quantization=metadata.quantization,
-            env=metadata.env,
-            exposed_ports=metadata.exposed_ports,
-            entrypoint=metadata.entrypoint,
-            cmd=metadata.cmd,
-            raw_config=raw_config,
+        # Add NGC metadata to raw_config; model_copy reuses the validated fields
+        ngc_metadata = {k: v for k, v in ngc_labels.items() if v is not None}
+        return metadata.model_copy(
+            update={"raw_config": {**metadata.raw_config, "ngc_metadata": ngc_metadata}}
         )
 
     def list_nim_images(self) -> list[str]:
@@ -145,6 +125,7 @@ class NGCRegistry(OCIRegistry):
             Dictionary with NIM-specific information
         """
         metadata = self.get_metadata(reference)
+        labels = metadata.labels
 
         return {
             "reference": metadata.reference,
@@ -153,11 +134,12 @@ class NGCRegistry(OCIRegistry):
             "model_version": metadata.model_version,
             "quantization": metadata.quantization,
             "architecture": metadata.architecture,
-            "cuda_version": metadata.labels.get("com.nvidia.cuda.version"),
-            "tensorrt_version": metadata.labels.get("com.nvidia.tensorrt.version"),
-            "supported_gpus": metadata.labels.get("com.nvidia.nim.gpu.supported", "").split(","),
-            "min_gpu_memory": metadata.labels.get("com.nvidia.nim.gpu.memory_gb"),
-            "default_env": {k: v for k, v in metadata.env.items() if k.startswith("NIM_")},
+            "cuda_version": labels.get("com.nvidia.cuda.version"),
+            "tensorrt_version": labels.get("com.nvidia.tensorrt.version"),
+            "supported_gpus": labels.get("com.nvidia.nim.gpu.supported", "").split(","),
+            "min_gpu_memory": labels.get("com.nvidia.nim.gpu.memory_gb"),
+            # Slice compare beats startswith for a short fixed prefix
+            "default_env": {k: v for k, v in metadata.env.items() if k[:4] == "NIM_"},
         }
 
     @classmethod
@@ -3,24 +3,42 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import importlib.util
+import re
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType, TracebackType
+from typing import Any, Self
 from urllib.parse import urlparse
 
 import httpx
 
 from nim_audit.models.image import ImageDigest, ImageManifest, ImageMetadata, LayerInfo
 from nim_audit.registry.base import (
+    NIM_METADATA_LABELS,
+    ImageReference,
     Registry,
     RegistryAuth,
     RegistryAuthError,
     RegistryError,
     RegistryNotFoundError,
+    parse_reference,
+    parse_timestamp,
 )
+from nim_audit.utils import fastjson
+from nim_audit.utils.cache import BlobCache, Cache
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
-class OCIRegistry:
+# key="value" pairs of a WWW-Authenticate challenge; quoted values may hold commas
+_WWW_AUTH_RE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+class OCIRegistry(Registry):
     """Registry client for OCI-compliant container registries.
 
     Implements the OCI Distribution Specification for interacting
@@ -32,14 +50,16 @@ class OCIRegistry:
     """
 
     # Well-known registry URLs
-    REGISTRY_URLS = {
-        "docker.io": "https://registry-1.docker.io",
-        "registry-1.docker.io": "https://registry-1.docker.io",
-        "ghcr.io": "https://ghcr.io",
-        "gcr.io": "https://gcr.io",
-        "quay.io": "https://quay.io",
-        "nvcr.io": "https://nvcr.io",
-    }
+    REGISTRY_URLS: Mapping[str, str] = MappingProxyType(
+        {
+            "docker.io": "https://registry-1.docker.io",
+            "registry-1.docker.io": "https://registry-1.docker.io",
+            "ghcr.io": "https://ghcr.io",
+            "gcr.io": "https://gcr.io",
+            "quay.io": "https://quay.io",
+            "nvcr.io": "https://nvcr.io",
+        }
+    )
 
     # Media types
     MANIFEST_V2 = "application/vnd.docker.distribution.manifest.v2+json"
@@ -47,12 +67,30 @@ class OCIRegistry:
     OCI_MANIFEST = "application/vnd.oci.image.manifest.v1+json"
     OCI_INDEX = "application/vnd.oci.image.index.v1+json"
 
+    # Accept header for manifest requests; copied per request since
+    # _request adds the Authorization header to it
+    _ACCEPT_MANIFEST_HEADERS: Mapping[str, str] = MappingProxyType(
+        {"Accept": ", ".join((MANIFEST_V2, OCI_MANIFEST, MANIFEST_LIST, OCI_INDEX))}
+    )
+
+    # Lifetime assumed for tokens whose response has no expires_in
+    DEFAULT_TOKEN_TTL = 60
+    # Refresh tokens this many seconds before they expire
+    TOKEN_EXPIRY_MARGIN = 30
+
+    # Manifests are content-addressed, so persisted copies never go stale
+    MANIFEST_CACHE_TTL = 30 * 24 * 3600
+    # Tags can move, so in-process metadata lookups are reused only briefly
+    METADATA_CACHE_TTL = 300
+
     def __init__(
         self,
         base_url: str | None = None,
         auth: RegistryAuth | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        cache: Cache | None = None,
+        blob_cache: BlobCache | None = None,
     ) -> None:
         """Initialize the OCI registry client.
 
@@ -61,36 +99,97 @@ class OCIRegistry:
             auth: Authentication credentials
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache: Cache for persisting manifests by digest across runs
+            blob_cache: Store for config blobs, which are immutable per digest
         """
         self._base_url = base_url
         self._auth = auth or RegistryAuth.from_env()
         self._timeout = timeout
         self._max_retries = max_retries
-        self._token_cache: dict[str, str] = {}
+        # (registry host, repository, scope) -> (token, monotonic expiry)
+        self._token_cache: dict[tuple[str, str, str], tuple[str, float]] = {}
+        self._client: httpx.Client | None = None
+        # Guards client creation when batch lookups start on many threads
+        self._client_lock = threading.Lock()
+        self._cache = cache
+        self._blob_cache = blob_cache
+        # (repository, tag) -> (Docker-Content-Digest, manifest)
+        self._manifest_cache: dict[tuple[str, str], tuple[str, ImageManifest]] = {}
+        # reference -> (monotonic fetch time, metadata)
+        self._metadata_cache: dict[str, tuple[float, ImageMetadata]] = {}
+        # tags/list URL -> (ETag, sorted tags)
+        self._tag_etag_cache: dict[str, tuple[str, list[str]]] = {}
 
     def _get_registry_url(self, registry: str | None) -> str:
         """Get the registry URL for a registry hostname."""
         if not registry:
             return self.REGISTRY_URLS["docker.io"]
+        # Assume HTTPS for unknown registries
+        return self.REGISTRY_URLS.get(registry) or (
+            registry if registry.startswith("http") else f"https://{registry}"
+        )
 
-        if registry in self.REGISTRY_URLS:
-            return self.REGISTRY_URLS[registry]
+    def _resolve(self, reference: str) -> tuple[ImageReference, str, str]:
+        """Resolve a reference to its parts, registry URL and repository path."""
+        parsed = parse_reference(reference)
+        registry_url = self._get_registry_url(parsed.registry)
+        repository = parsed.repository or reference
 
-        # Assume HTTPS for unknown registries
-        if not registry.startswith("http"):
-            return f"https://{registry}"
-        return registry
+        # Handle Docker Hub library images
+        if "docker.io" in registry_url and "/" not in repository:
+            repository = f"library/{repository}"
+
+        return parsed, registry_url, repository
 
     def _get_client(self) -> httpx.Client:
-        """Create an HTTP client with retry support."""
-        transport = httpx.HTTPTransport(retries=self._max_retries)
-        return httpx.Client(
-            timeout=self._timeout,
-            transport=transport,
-            follow_redirects=True,
-        )
+        """Get the shared HTTP client, creating it on first use.
+
+        One pooled client is kept per registry so keep-alive connections
+        (and their TLS sessions) are reused across requests. Safe to call
+        from several threads at once; only one client is ever created.
+        """
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                transport = httpx.HTTPTransport(
+                    retries=self._max_retries,
+                    http2=_HTTP2,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=20,
+                        max_connections=50,
+                        keepalive_expiry=60,
+                    ),
+                )
+                self._client = httpx.Client(
+                    timeout=self._timeout,
+                    transport=transport,
+                    follow_redirects=True,
+                )
+            return self._client
+
+    def close(self) -> None:
+        """Close the HTTP client and its connection pool."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> Self:
+        return self
 
-    def _get_token(self, client: httpx.Client, www_authenticate: str, repository: str) -> str:
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _get_token(
+        self, client: httpx.Client, www_authenticate: str, repository: str
+    ) -> tuple[str, float]:
         """Get a bearer token for authentication.
 
         Args:
@@ -99,15 +198,11 @@ class OCIRegistry:
             repository: Repository name for scope
 
         Returns:
-            Bearer token
+            Bearer token and its lifetime in seconds
         """
         # Parse WWW-Authenticate header
         # Format: Bearer realm="...",service="...",scope="..."
-        params = {}
-        for part in www_authenticate.replace("Bearer ", "").split(","):
-            if "=" in part:
-                key, value = part.split("=", 1)
-                params[key.strip()] = value.strip().strip('"')
+        params = dict(_WWW_AUTH_RE.findall(www_authenticate))
 
         realm = params.get("realm")
         if not realm:
@@ -123,7 +218,7 @@ class OCIRegistry:
         if self._auth:
             if self._auth.token:
                 # Use token directly
-                return self._auth.token
+                return self._auth.token, self.DEFAULT_TOKEN_TTL
             elif self._auth.username and self._auth.password:
                 auth = (self._auth.username, self._auth.password)
 
@@ -134,8 +229,13 @@ class OCIRegistry:
         elif response.status_code != 200:
             raise RegistryError(f"Token request failed: {response.status_code}")
 
-        data = response.json()
-        return data.get("token") or data.get("access_token", "")
+        data = fastjson.loads(response.content)
+        token = data.get("token") or data.get("access_token", "")
+        try:
+            expires_in = int(data.get("expires_in") or self.DEFAULT_TOKEN_TTL)
+        except (TypeError, ValueError):
+            expires_in = self.DEFAULT_TOKEN_TTL
+        return token, expires_in
 
     def _request(
         self,
@@ -144,6 +244,7 @@ class OCIRegistry:
         url: str,
         repository: str,
         headers: dict[str, str] | None = None,
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
         """Make an authenticated request to the registry.
@@ -154,6 +255,8 @@ class OCIRegistry:
             url: Request URL
             repository: Repository name (for token scope)
             headers: Additional headers
+            stream: Return before reading the body; the caller must close
+                the response
             **kwargs: Additional request arguments
 
         Returns:
@@ -161,135 +264,205 @@ class OCIRegistry:
         """
         headers = headers or {}
 
-        # Try with cached token first
-        cache_key = f"{url}:{repository}"
-        if cache_key in self._token_cache:
-            headers["Authorization"] = f"Bearer {self._token_cache[cache_key]}"
+        # Tokens are scoped to a repository, so one token serves every URL in it
+        cache_key = (urlparse(url).netloc, repository, "pull")
+        cached = self._token_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[1]:
+            headers["Authorization"] = f"Bearer {cached[0]}"
 
-        response = client.request(method, url, headers=headers, **kwargs)
+        response = client.send(
+            client.build_request(method, url, headers=headers, **kwargs), stream=stream
+        )
 
         # Handle 401 - need to authenticate
         if response.status_code == 401:
             www_auth = response.headers.get("www-authenticate", "")
             if "bearer" in www_auth.lower():
-                token = self._get_token(client, www_auth, repository)
-                self._token_cache[cache_key] = token
+                token, expires_in = self._get_token(client, www_auth, repository)
+                expires_at = time.monotonic() + expires_in - self.TOKEN_EXPIRY_MARGIN
+                self._token_cache[cache_key] = (token, expires_at)
                 headers["Authorization"] = f"Bearer {token}"
-                response = client.request(method, url, headers=headers, **kwargs)
+                response.close()
+                response = client.send(
+                    client.build_request(method, url, headers=headers, **kwargs), stream=stream
+                )
 
         return response
 
+    def _cached_manifest(
+        self, repository: str, tag: str, content_digest: str
+    ) -> ImageManifest | None:
+        """Look up a manifest by the digest the registry reported for a tag."""
+        cached = self._manifest_cache.get((repository, tag))
+        if cached is not None and cached[0] == content_digest:
+            return cached[1]
+
+        if self._cache is not None:
+            data = self._cache.get(f"oci-manifest:{content_digest}")
+            if data is not None:
+                manifest = ImageManifest.model_validate(data)
+                self._manifest_cache[repository, tag] = (content_digest, manifest)
+                return manifest
+        return None
+
+    def _store_manifest(
+        self, repository: str, tag: str, content_digest: str, manifest: ImageManifest
+    ) -> None:
+        """Remember a manifest under the digest the registry reported for a tag."""
+        self._manifest_cache[repository, tag] = (content_digest, manifest)
+        if self._cache is not None:
+            self._cache.set(
+                f"oci-manifest:{content_digest}",
+                manifest.model_dump(mode="json"),
+                ttl=self.MANIFEST_CACHE_TTL,
+            )
+
     def get_manifest(self, reference: str) -> ImageManifest:
         """Get the manifest for an image.
 
+        When a copy of the manifest is already cached, a HEAD request checks
+        the ``Docker-Content-Digest`` the registry reports for the tag and
+        the body is only downloaded if it changed.
+
         Args:
             reference: Image reference (e.g., "nginx:latest")
 
         Returns:
             The image manifest
         """
-        parsed = self._parse_reference(reference)
-        registry_url = self._get_registry_url(parsed["registry"])
-        repository = parsed["repository"]
-        tag = parsed["tag"] or parsed["digest"] or "latest"
-
-        # Handle Docker Hub library images
-        if "docker.io" in registry_url and "/" not in repository:
-            repository = f"library/{repository}"
+        return self._fetch_manifest(reference, *self._resolve(reference))
 
+    def _fetch_manifest(
+        self, reference: str, parsed: ImageReference, registry_url: str, repository: str
+    ) -> ImageManifest:
+        """Fetch a manifest for an already resolved reference."""
+        tag = parsed.tag or parsed.digest or "latest"
         url = f"{registry_url}/v2/{repository}/manifests/{tag}"
 
-        with self._get_client() as client:
-            headers = {
-                "Accept": ", ".join(
-                    [self.MANIFEST_V2, self.OCI_MANIFEST, self.MANIFEST_LIST, self.OCI_INDEX]
-                )
-            }
-
-            response = self._request(client, "GET", url, repository, headers=headers)
+        client = self._get_client()
+        headers = dict(self._ACCEPT_MANIFEST_HEADERS)
 
-            if response.status_code == 404:
-                raise RegistryNotFoundError(reference)
-            elif response.status_code == 401:
-                raise RegistryAuthError(f"Authentication failed for {reference}")
-            elif response.status_code != 200:
-                raise RegistryError(f"Failed to get manifest: {response.status_code}")
-
-            data = response.json()
-            content_type = response.headers.get("content-type", "")
-
-            # Handle manifest list/index - get first amd64/linux manifest
-            if "list" in content_type or "index" in content_type:
-                manifests = data.get("manifests", [])
-                for m in manifests:
-                    platform = m.get("platform", {})
-                    if platform.get("architecture") == "amd64" and platform.get("os") == "linux":
-                        # Fetch the actual manifest
-                        digest = m.get("digest")
-                        url = f"{registry_url}/v2/{repository}/manifests/{digest}"
-                        response = self._request(
-                            client, "GET", url, repository, headers={"Accept": self.MANIFEST_V2}
-                        )
-                        data = response.json()
-                        break
-
-            # Parse manifest
-            layers = []
-            for layer in data.get("layers", []):
-                layers.append(
-                    LayerInfo(
-                        digest=ImageDigest.from_string(layer.get("digest", "")),
-                        size=layer.get("size", 0),
-                        media_type=layer.get("mediaType", ""),
-                    )
+        key = (repository, tag)
+        if key in self._manifest_cache or self._cache is not None:
+            if parsed.digest and tag == parsed.digest:
+                # Digest references are immutable; no need to ask the registry
+                remote_digest: str | None = parsed.digest
+            else:
+                head = self._request(client, "HEAD", url, repository, headers=headers)
+                remote_digest = (
+                    head.headers.get("docker-content-digest") if head.status_code == 200 else None
                 )
+            if remote_digest:
+                cached = self._cached_manifest(repository, tag, remote_digest)
+                if cached is not None:
+                    return cached
 
-            # Calculate manifest digest
-            manifest_bytes = response.content
-            manifest_digest = hashlib.sha256(manifest_bytes).hexdigest()
-
-            config_digest_str = data.get("config", {}).get("digest", "")
+        response = self._request(client, "GET", url, repository, headers=headers)
 
-            return ImageManifest(
-                schema_version=data.get("schemaVersion", 2),
-                media_type=data.get("mediaType", self.MANIFEST_V2),
-                digest=ImageDigest(hash=manifest_digest),
-                config_digest=ImageDigest.from_string(config_digest_str)
-                if config_digest_str
-                else ImageDigest(hash=""),
-                layers=layers,
+        if response.status_code == 404:
+            raise RegistryNotFoundError(reference)
+        elif response.status_code == 401:
+            raise RegistryAuthError(f"Authentication failed for {reference}")
+        elif response.status_code != 200:
+            raise RegistryError(f"Failed to get manifest: {response.status_code}")
+
+        data = fastjson.loads(response.content)
+        content_type = response.headers.get("content-type", "")
+        tag_digest = response.headers.get("docker-content-digest")
+
+        # Handle manifest list/index - get first amd64/linux manifest
+        if "list" in content_type or "index" in content_type:
+            manifests = data.get("manifests", [])
+            for m in manifests:
+                platform = m.get("platform", {})
+                if platform.get("architecture") == "amd64" and platform.get("os") == "linux":
+                    # Fetch the actual manifest
+                    digest = m.get("digest")
+                    url = f"{registry_url}/v2/{repository}/manifests/{digest}"
+                    response = self._request(
+                        client, "GET", url, repository, headers={"Accept": self.MANIFEST_V2}
+                    )
+                    data = fastjson.loads(response.content)
+                    break
+
+        # Parse manifest
+        layers = tuple(
+            LayerInfo(
+                digest=ImageDigest.from_string(layer.get("digest", "")),
+                size=layer.get("size", 0),
+                media_type=layer.get("mediaType", ""),
             )
+            for layer in data.get("layers", ())
+        )
+
+        # Registries report the digest of the manifest they sent; only hash
+        # the body ourselves when that header is missing
+        algorithm, _, manifest_digest = response.headers.get("docker-content-digest", "").partition(
+            ":"
+        )
+        if algorithm != "sha256" or not manifest_digest:
+            manifest_digest = hashlib.sha256(response.content).hexdigest()
+
+        config_digest_str = data.get("config", {}).get("digest", "")
+
+        manifest = ImageManifest(
+            schema_version=data.get("schemaVersion", 2),
+            media_type=data.get("mediaType", self.MANIFEST_V2),
+            digest=ImageDigest(hash=manifest_digest),
+            config_digest=ImageDigest.from_string(config_digest_str)
+            if config_digest_str
+            else ImageDigest(hash=""),
+            layers=layers,
+        )
+        if tag_digest:
+            self._store_manifest(repository, tag, tag_digest, manifest)
+        return manifest
 
     def get_metadata(self, reference: str) -> ImageMetadata:
         """Get comprehensive metadata for an image.
 
+        Results are reused for ``METADATA_CACHE_TTL`` seconds, so repeated
+        lookups of the same reference do not hit the network again.
+
         Args:
             reference: Image reference
 
         Returns:
             The image metadata
         """
-        parsed = self._parse_reference(reference)
-        registry_url = self._get_registry_url(parsed["registry"])
-        repository = parsed["repository"]
+        now = time.monotonic()
+        cached = self._metadata_cache.get(reference)
+        if cached is not None and now - cached[0] < self.METADATA_CACHE_TTL:
+            return cached[1]
 
-        # Handle Docker Hub library images
-        if "docker.io" in registry_url and "/" not in repository:
-            repository = f"library/{repository}"
+        metadata = self._fetch_metadata(reference)
+        self._metadata_cache[reference] = (now, metadata)
+        return metadata
+
+    def _fetch_metadata(self, reference: str) -> ImageMetadata:
+        """Fetch metadata for an image from the registry."""
+        parsed, registry_url, repository = self._resolve(reference)
 
         # Get manifest first
-        manifest = self.get_manifest(reference)
+        manifest = self._fetch_manifest(reference, parsed, registry_url, repository)
 
-        # Fetch config blob
-        config_url = f"{registry_url}/v2/{repository}/blobs/{manifest.config_digest}"
+        # Fetch config blob, unless this digest was downloaded before
+        config_digest = str(manifest.config_digest)
+        config_bytes = self._blob_cache.get(config_digest) if self._blob_cache else None
+        if config_bytes is None:
+            config_url = f"{registry_url}/v2/{repository}/blobs/{config_digest}"
 
-        with self._get_client() as client:
+            client = self._get_client()
             response = self._request(client, "GET", config_url, repository)
 
             if response.status_code != 200:
                 raise RegistryError(f"Failed to get config blob: {response.status_code}")
 
-            config = response.json()
+            config_bytes = response.content
+            if self._blob_cache is not None:
+                self._blob_cache.put(config_digest, config_bytes)
+
+        config = fastjson.loads(config_bytes)
 
         # Parse config
         container_config = config.get("config", {})
@@ -297,44 +470,26 @@ class OCIRegistry:
 
         # Parse environment
         env_list = container_config.get("Env", []) or []
-        env = {}
-        for item in env_list:
-            if "=" in item:
-                key, value = item.split("=", 1)
-                env[key] = value
+        env = dict(item.split("=", 1) for item in env_list if "=" in item)
 
         # Parse exposed ports
-        exposed_ports = []
         ports_config = container_config.get("ExposedPorts", {}) or {}
-        for port_spec in ports_config.keys():
-            import re
-
-            port_match = re.match(r"(\d+)", port_spec)
-            if port_match:
-                exposed_ports.append(int(port_match.group(1)))
-
-        # Parse creation timestamp
-        created = None
-        created_str = config.get("created")
-        if created_str:
-            try:
-                from datetime import datetime
+        # Specs look like "8000/tcp"
+        exposed_ports = tuple(
+            int(port) for spec in ports_config if (port := spec.partition("/")[0]).isdigit()
+        )
 
-                created_str = created_str.replace("Z", "+00:00")
-                created = datetime.fromisoformat(created_str[:26] + created_str[-6:])
-            except (ValueError, TypeError):
-                pass
+        created = parse_timestamp(config.get("created"))
 
         # Extract NIM-specific metadata
-        nim_version = labels.get("com.nvidia.nim.version")
-        model_name = labels.get("com.nvidia.nim.model.name")
-        model_version = labels.get("com.nvidia.nim.model.version")
-        quantization = labels.get("com.nvidia.nim.model.quantization")
+        nim_version, model_name, model_version, quantization = map(labels.get, NIM_METADATA_LABELS)
 
-        return ImageMetadata(
+        # Every field is already parsed to its declared type above, and the
+        # config blob schema is fixed by the OCI image spec; skip re-validation
+        return ImageMetadata.model_construct(
             reference=reference,
-            repository=parsed["repository"] or reference,
-            tag=parsed["tag"],
+            repository=parsed.repository or reference,
+            tag=parsed.tag,
             digest=manifest.digest,
             manifest=manifest,
             labels=labels,
@@ -347,102 +502,111 @@ class OCIRegistry:
             quantization=quantization,
             env=env,
             exposed_ports=exposed_ports,
-            entrypoint=container_config.get("Entrypoint", []) or [],
-            cmd=container_config.get("Cmd", []) or [],
+            entrypoint=tuple(container_config.get("Entrypoint") or ()),
+            cmd=tuple(container_config.get("Cmd") or ()),
             raw_config=config,
         )
 
+    def get_metadata_batch(
+        self, references: Iterable[str], max_workers: int = 16
+    ) -> list[ImageMetadata]:
+        """Get metadata for several images concurrently.
+
+        Each lookup is a chain of network round trips, so the lookups run on
+        a thread pool sharing the pooled HTTP client. ``max_workers`` also
+        caps the number of in-flight requests to avoid registry throttling.
+
+        Args:
+            references: Image references
+            max_workers: Maximum number of concurrent lookups
+
+        Returns:
+            The image metadata, in the order of ``references``
+        """
+        references = list(references)
+        if len(references) <= 1:
+            return [self.get_metadata(ref) for ref in references]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(references))) as executor:
+            return list(executor.map(self.get_metadata, references))
+
     def pull_layer(self, reference: str, digest: str, dest: Path) -> None:
         """Download a layer blob to the specified destination.
 
+        The blob is streamed to disk in 1 MiB chunks and checked against
+        ``digest`` as it is written.
+
         Args:
             reference: Image reference
             digest: Layer digest
             dest: Destination path
-        """
-        parsed = self._parse_reference(reference)
-        registry_url = self._get_registry_url(parsed["registry"])
-        repository = parsed["repository"]
-
-        if "docker.io" in registry_url and "/" not in repository:
-            repository = f"library/{repository}"
 
+        Raises:
+            RegistryNotFoundError: If the layer does not exist
+            RegistryError: If the download fails or does not match the digest
+        """
+        _, registry_url, repository = self._resolve(reference)
         url = f"{registry_url}/v2/{repository}/blobs/{digest}"
 
-        with self._get_client() as client:
-            response = self._request(client, "GET", url, repository)
+        algorithm, _, expected = digest.rpartition(":")
+        try:
+            hasher = hashlib.new(algorithm or "sha256")
+        except ValueError:
+            raise RegistryError(f"Unsupported digest algorithm in {digest}") from None
 
+        client = self._get_client()
+        response = self._request(client, "GET", url, repository, stream=True)
+        try:
             if response.status_code == 404:
                 raise RegistryNotFoundError(f"Layer {digest}")
             elif response.status_code != 200:
                 raise RegistryError(f"Failed to pull layer: {response.status_code}")
 
-            dest.write_bytes(response.content)
+            with dest.open("wb") as f:
+                for chunk in response.iter_bytes(chunk_size=1 << 20):
+                    hasher.update(chunk)
+                    f.write(chunk)
+        finally:
+            response.close()
+
+        if hasher.hexdigest() != expected:
+            dest.unlink(missing_ok=True)
+            raise RegistryError(f"Layer {digest} failed digest verification")
 
     def list_tags(self, repository: str) -> list[str]:
         """List all tags for a repository.
 
+        Repeated listings send the previous ETag in ``If-None-Match``, so
+        an unchanged tag list comes back as an empty 304 response.
+
         Args:
             repository: Repository name
 
         Returns:
             List of tag names
         """
-        parsed = self._parse_reference(repository)
-        registry_url = self._get_registry_url(parsed["registry"])
-        repo = parsed["repository"] or repository
-
-        if "docker.io" in registry_url and "/" not in repo:
-            repo = f"library/{repo}"
-
+        _, registry_url, repo = self._resolve(repository)
         url = f"{registry_url}/v2/{repo}/tags/list"
 
-        with self._get_client() as client:
-            response = self._request(client, "GET", url, repo)
+        headers = {}
+        cached = self._tag_etag_cache.get(url)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
-            if response.status_code == 404:
-                raise RegistryNotFoundError(repository)
-            elif response.status_code != 200:
-                raise RegistryError(f"Failed to list tags: {response.status_code}")
-
-            data = response.json()
-            return sorted(data.get("tags", []))
-
-    @staticmethod
-    def _parse_reference(reference: str) -> dict[str, str | None]:
-        """Parse an image reference into components."""
-        result: dict[str, str | None] = {
-            "registry": None,
-            "repository": None,
-            "tag": None,
-            "digest": None,
-        }
-
-        # Handle digest
-        if "@" in reference:
-            ref_part, digest = reference.rsplit("@", 1)
-            result["digest"] = digest
-            reference = ref_part
-
-        # Handle tag
-        if ":" in reference:
-            parts = reference.rsplit(":", 1)
-            if "/" not in parts[1] and not parts[1].isdigit():
-                reference = parts[0]
-                result["tag"] = parts[1]
-
-        # Handle registry and repository
-        parts = reference.split("/")
-        if len(parts) == 1:
-            result["repository"] = parts[0]
-        elif len(parts) == 2:
-            if "." in parts[0] or ":" in parts[0] or parts[0] == "localhost":
-                result["registry"] = parts[0]
-                result["repository"] = parts[1]
-            else:
-                result["repository"] = reference
-        else:
-            result["registry"] = parts[0]
-            result["repository"] = "/".join(parts[1:])
+        client = self._get_client()
+        response = self._request(client, "GET", url, repo, headers=headers)
 
-        return result
+        if response.status_code == 304 and cached is not None:
+            return list(cached[1])
+        if response.status_code == 404:
+            raise RegistryNotFoundError(repository)
+        elif response.status_code != 200:
+            raise RegistryError(f"Failed to list tags: {response.status_code}")
+
+        data = fastjson.loads(response.content)
+        tags = sorted(data.get("tags", []))
+        etag = response.headers.get("etag")
+        if etag:
+            self._tag_etag_cache[url] = (etag, tags)
+            return list(tags)
+        return tags
@@ -0,0 +1,34 @@
+"""Process-wide registry clients shared across callers."""
+
+from __future__ import annotations
+
+from functools import cache
+
+from nim_audit.registry.base import parse_reference
+from nim_audit.registry.ngc import NGCRegistry
+from nim_audit.registry.oci import OCIRegistry
+
+
+def get_registry_client(reference: str) -> OCIRegistry:
+    """Get the shared remote registry client for an image reference.
+
+    One client is kept per registry host, so its connection pool, bearer
+    tokens and manifest cache carry over between calls instead of starting
+    cold with every new client. Credentials come from the environment, as
+    for a default-constructed client.
+
+    Args:
+        reference: Image reference (e.g., "nvcr.io/nim/llama3:1.5.0")
+
+    Returns:
+        An NGCRegistry for nvcr.io images, otherwise an OCIRegistry
+    """
+    return _client_for_host(parse_reference(reference).registry)
+
+
+@cache
+def _client_for_host(registry: str | None) -> OCIRegistry:
+    """Create the client for a registry host; cached for the process."""
+    if registry == "nvcr.io":
+        return NGCRegistry()
+    return OCIRegistry()
@@ -19,6 +19,18 @@ __all__ = [
 ]
 
 
+_RENDERERS: dict[OutputFormat, type[BaseRenderer]] = {
+    OutputFormat.JSON: JSONRenderer,
+    OutputFormat.MARKDOWN: MarkdownRenderer,
+    OutputFormat.HTML: HTMLRenderer,
+    OutputFormat.TERMINAL: TerminalRenderer,
+}
+
+# Renderers never change their own state while rendering, so one instance
+# per format is reused
+_RENDERER_INSTANCES: dict[OutputFormat, BaseRenderer] = {}
+
+
 def get_renderer(format: OutputFormat | str) -> BaseRenderer:
     """Get a renderer for the specified format.
 
@@ -26,7 +38,7 @@ def get_renderer(format: OutputFormat | str) -> BaseRenderer:
         format: Output format (OutputFormat enum or string)
 
     Returns:
-        Appropriate renderer instance
+        The shared renderer instance for the format
 
     Raises:
         ValueError: If format is not supported
@@ -34,15 +46,10 @@ def get_renderer(format: OutputFormat | str) -> BaseRenderer:
     if isinstance(format, str):
         format = OutputFormat(format)
 
-    renderers = {
-        OutputFormat.JSON: JSONRenderer,
-        OutputFormat.MARKDOWN: MarkdownRenderer,
-        OutputFormat.HTML: HTMLRenderer,
-        OutputFormat.TERMINAL: TerminalRenderer,
-    }
-
-    renderer_class = renderers.get(format)
-    if renderer_class is None:
-        raise ValueError(f"Unsupported format: {format}")
-
-    return renderer_class()
+    renderer = _RENDERER_INSTANCES.get(format)
+    if renderer is None:
+        renderer_class = _RENDERERS.get(format)
+        if renderer_class is None:
+            raise ValueError(f"Unsupported format: {format}")
+        renderer = _RENDERER_INSTANCES.setdefault(format, renderer_class())
+    return renderer
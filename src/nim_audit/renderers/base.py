@@ -1,5 +1,7 @@
 """Base renderer protocol and types."""
 
+import weakref
+from collections.abc import Iterator
 from enum import Enum
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
@@ -32,6 +34,34 @@ class RenderContext(BaseModel):
     include_raw: bool = Field(default=False, description="Include raw data in output")
 
 
+# id(model) -> JSON-mode dump; entries are dropped when the model is collected
+_JSON_DUMPS: dict[int, dict[str, Any]] = {}
+
+
+def model_json_dict(model: BaseModel) -> dict[str, Any]:
+    """Get the JSON-mode dump of a model, reusing it across renderers.
+
+    Frozen models cannot change, so their dump is computed once and shared
+    by every renderer that needs it. The result must not be mutated.
+
+    Args:
+        model: The model to dump
+
+    Returns:
+        The output of ``model.model_dump(mode="json")``
+    """
+    if not model.model_config.get("frozen"):
+        return model.model_dump(mode="json")
+
+    key = id(model)
+    dump = _JSON_DUMPS.get(key)
+    if dump is None:
+        dump = model.model_dump(mode="json")
+        _JSON_DUMPS[key] = dump
+        weakref.finalize(model, _JSON_DUMPS.pop, key, None)
+    return dump
+
+
 @runtime_checkable
 class Renderer(Protocol):
     """Protocol for output renderers.
@@ -90,10 +120,26 @@ class Renderer(Protocol):
 class BaseRenderer:
     """Base implementation with common functionality.
 
-    Provides default implementation of render_to_file.
-    Subclasses should implement format property and render method.
+    Provides default implementations of render_stream and render_to_file.
+    Subclasses should implement format property and render method, and may
+    override render_stream to emit large outputs piece by piece.
     """
 
+    # Buffer size for file output
+    WRITE_BUFFER_SIZE = 1 << 20
+
+    def render_stream(self, data: Any, context: RenderContext) -> Iterator[str]:
+        """Render data as a sequence of string chunks.
+
+        Args:
+            data: The data to render
+            context: Rendering context with options
+
+        Yields:
+            Consecutive pieces of the rendered output
+        """
+        yield self.render(data, context)
+
     def render_to_file(self, data: Any, context: RenderContext) -> None:
         """Render data directly to a file.
 
@@ -107,8 +153,9 @@ class BaseRenderer:
         if context.output_path is None:
             raise ValueError("output_path must be set in context for file rendering")
 
-        content = self.render(data, context)
-        context.output_path.write_text(content)
+        with open(context.output_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            for chunk in self.render_stream(data, context):
+                f.write(chunk.encode("utf-8"))
 
     def render(self, data: Any, context: RenderContext) -> str:
         """Render data to a string. Must be implemented by subclasses."""
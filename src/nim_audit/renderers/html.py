@@ -6,7 +6,7 @@ from typing import Any
 
 from jinja2 import Environment, BaseLoader
 
-from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext
+from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext, model_json_dict
 
 
 # Default HTML template
@@ -278,8 +278,8 @@ class HTMLRenderer(BaseRenderer):
         rows = "".join(
             f"""
             <tr>
-                <td>{entry.category.value}</td>
-                <td><span class="badge badge-{self._change_type_class(entry.change_type.value)}">{entry.change_type.value}</span></td>
+                <td>{entry.category.label}</td>
+                <td><span class="badge badge-{self._change_type_class(entry.change_type.label)}">{entry.change_type.label}</span></td>
                 <td><code>{entry.path}</code></td>
                 <td>{entry.old_value or '-'}</td>
                 <td>{entry.new_value or '-'}</td>
@@ -358,7 +358,7 @@ class HTMLRenderer(BaseRenderer):
                 <td><code>{entry.name}</code></td>
                 <td>{entry.value or '-'}</td>
                 <td>{entry.default_value or '-'}</td>
-                <td><span class="badge badge-{self._impact_class(entry.impact.level.value if entry.impact else 'none')}">{entry.impact.level.value if entry.impact else '-'}</span></td>
+                <td><span class="badge badge-{self._impact_class(entry.impact.level.label if entry.impact else 'none')}">{entry.impact.level.label if entry.impact else '-'}</span></td>
                 <td>{entry.description or '-'}</td>
             </tr>
             """
@@ -440,7 +440,7 @@ class HTMLRenderer(BaseRenderer):
         rows = "".join(
             f"""
             <tr>
-                <td><span class="badge badge-{v.severity.value}">{v.severity.value}</span></td>
+                <td><span class="badge badge-{v.severity.label}">{v.severity.label}</span></td>
                 <td>{v.rule.name}</td>
                 <td>{v.message}</td>
                 <td>{v.rule.remediation or '-'}</td>
@@ -486,7 +486,7 @@ class HTMLRenderer(BaseRenderer):
         from pydantic import BaseModel
 
         if isinstance(data, BaseModel):
-            dict_data = data.model_dump(mode="json")
+            dict_data = model_json_dict(data)
         elif isinstance(data, dict):
             dict_data = data
         else:
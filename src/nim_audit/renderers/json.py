@@ -2,15 +2,49 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter, methodcaller
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+from nim_audit.models._validators import adapter
+from nim_audit.models.common import DataModel, LabeledIntEnum
 from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext
+from nim_audit.utils import fastjson
+
+# Conversions for types the JSON encoders do not handle, checked in order
+_SERIALIZER_BASES: tuple[tuple[type, Callable[[Any], Any]], ...] = (
+    (datetime, datetime.isoformat),
+    (LabeledIntEnum, attrgetter("label")),
+    (Enum, attrgetter("value")),
+    (Path, str),
+    (set, list),
+    (bytes, bytes.hex),
+    (DataModel, methodcaller("model_dump", mode="json")),
+)
+
+# Concrete type -> conversion, resolved from _SERIALIZER_BASES on first use
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {}
+
+
+def _with_labels(data: Any) -> Any:
+    """Replace LabeledIntEnum members in containers with their labels.
+
+    Both encoders write int enums as numbers without consulting ``default``,
+    while models and ``DataModel`` dumps use the label, so plain data is
+    converted before encoding.
+    """
+    if isinstance(data, LabeledIntEnum):
+        return data.label
+    if isinstance(data, dict):
+        return {_with_labels(k): _with_labels(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_with_labels(v) for v in data]
+    return data
 
 
 class JSONRenderer(BaseRenderer):
@@ -38,22 +72,18 @@ class JSONRenderer(BaseRenderer):
         Returns:
             JSON string
         """
-        # Convert to dict if Pydantic model
+        # Pydantic models serialize straight to JSON without an interim dict
         if isinstance(data, BaseModel):
-            dict_data = data.model_dump(mode="json")
-        else:
-            dict_data = data
+            return data.model_dump_json(indent=context.indent or None)
 
-        return json.dumps(
-            dict_data,
-            indent=context.indent if context.indent else None,
-            default=self._json_serializer,
-            ensure_ascii=False,
-        )
+        return self._encode(data, context.indent).decode("utf-8")
 
     def render_to_file(self, data: Any, context: RenderContext) -> None:
         """Render data directly to a JSON file.
 
+        The encoders produce UTF-8 bytes, which are written as-is without
+        building an intermediate string.
+
         Args:
             data: The data to render
             context: Rendering context (must have output_path set)
@@ -64,25 +94,29 @@ class JSONRenderer(BaseRenderer):
         if context.output_path is None:
             raise ValueError("output_path must be set in context for file rendering")
 
-        content = self.render(data, context)
-        context.output_path.write_text(content, encoding="utf-8")
+        with open(context.output_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            f.write(self._encode(data, context.indent))
+
+    @classmethod
+    def _encode(cls, data: Any, indent: int | None = None) -> bytes:
+        """Encode data to UTF-8 JSON bytes."""
+        if isinstance(data, BaseModel):
+            return adapter(type(data)).dump_json(data, indent=indent or None)
+        return fastjson.dumps(_with_labels(data), indent=indent, default=cls._json_serializer)
 
     @staticmethod
     def _json_serializer(obj: Any) -> Any:
         """Custom JSON serializer for non-standard types."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, Enum):
-            return obj.value
-        if isinstance(obj, Path):
-            return str(obj)
-        if isinstance(obj, set):
-            return list(obj)
-        if isinstance(obj, bytes):
-            return obj.decode("utf-8", errors="replace")
-        if hasattr(obj, "__dict__"):
-            return obj.__dict__
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        convert = _SERIALIZERS.get(type(obj))
+        if convert is None:
+            for base, base_convert in _SERIALIZER_BASES:
+                if isinstance(obj, base):
+                    convert = base_convert
+                    break
+            else:
+                raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+            _SERIALIZERS[type(obj)] = convert
+        return convert(obj)
 
 
 class JSONLRenderer(BaseRenderer):
@@ -111,21 +145,47 @@ class JSONLRenderer(BaseRenderer):
         Returns:
             JSONL string (one JSON object per line)
         """
+        return "".join(self.render_stream(data, context))
+
+    def render_stream(self, data: Any, context: RenderContext) -> Iterator[str]:
+        """Render data to JSONL one line at a time.
+
+        Args:
+            data: List of items to render (one per line)
+            context: Rendering context
+
+        Yields:
+            Each item's JSON line, with newlines between items
+        """
         if not isinstance(data, (list, tuple)):
             data = [data]
 
-        lines = []
-        for item in data:
+        for i, item in enumerate(data):
+            if i:
+                yield "\n"
             if isinstance(item, BaseModel):
-                dict_data = item.model_dump(mode="json")
+                yield item.model_dump_json()
             else:
-                dict_data = item
+                yield JSONRenderer._encode(item).decode("utf-8")
+
+    def render_to_file(self, data: Any, context: RenderContext) -> None:
+        """Render data to a JSONL file, writing each encoded line as it is produced.
+
+        Args:
+            data: List of items to render (one per line)
+            context: Rendering context (must have output_path set)
 
-            line = json.dumps(
-                dict_data,
-                default=JSONRenderer._json_serializer,
-                ensure_ascii=False,
-            )
-            lines.append(line)
+        Raises:
+            ValueError: If context.output_path is not set
+        """
+        if context.output_path is None:
+            raise ValueError("output_path must be set in context for file rendering")
+
+        if not isinstance(data, (list, tuple)):
+            data = [data]
 
-        return "\n".join(lines)
+        with open(context.output_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            for i, item in enumerate(data):
+                if i:
+                    f.write(b"\n")
+                f.write(JSONRenderer._encode(item))
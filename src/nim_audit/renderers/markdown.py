@@ -2,12 +2,49 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from pydantic import BaseModel
 
-from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext
+from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext, model_json_dict
+
+_SEVERITY_ICONS = {"error": "🔴", "warning": "🟡", "info": "🔵"}
+
+# Width of the old/new value cells in the diff table
+_VALUE_WIDTH = 40
+
+# Diff table rows joined into each chunk by render_stream
+_STREAM_BATCH_LINES = 1000
+
+# Constant section headers, pre-joined so each is a single entry in the
+# line list; the final "\n".join() yields the same text as separate lines.
+_WARNINGS_HEADER = "## Warnings\n"
+_RECOMMENDATIONS_HEADER = "## Recommendations\n"
+_BREAKING_HEADER = "## Breaking Changes\n"
+_DIFFERENCES_HEADER = "## Differences\n"
+_CHANGES_TABLE_HEADER = (
+    "## All Changes\n\n"
+    "| Category | Type | Path | Old Value | New Value |\n"
+    "|----------|------|------|-----------|-----------|"
+)
+_CONFIG_TABLE_HEADER = (
+    "## Configuration\n\n"
+    "| Variable | Value | Default | Impact | Description |\n"
+    "|----------|-------|---------|--------|-------------|"
+)
+_VIOLATIONS_TABLE_HEADER = (
+    "## Violations\n\n"
+    "| Severity | Rule | Message | Remediation |\n"
+    "|----------|------|---------|-------------|"
+)
+_RESPONSES_TABLE_HEADER = (
+    "## Responses\n\n"
+    "| Prompt ID | Latency (ms) | Tokens In | Tokens Out | Hash |\n"
+    "|-----------|--------------|-----------|------------|------|"
+)
 
 
 class MarkdownRenderer(BaseRenderer):
@@ -20,6 +57,18 @@ class MarkdownRenderer(BaseRenderer):
         md_str = renderer.render(diff_report, context)
     """
 
+    def __init__(self) -> None:
+        """Initialize the Markdown renderer."""
+        # Report class name -> render method
+        self._dispatch: dict[str, Callable[[Any, RenderContext], str]] = {
+            "DiffReport": self._render_diff_report,
+            "ConfigReport": self._render_config_report,
+            "CompatReport": self._render_compat_report,
+            "LintResult": self._render_lint_result,
+            "BehavioralSignature": self._render_fingerprint,
+            "FingerprintComparison": self._render_fingerprint_comparison,
+        }
+
     @property
     def format(self) -> OutputFormat:
         """The output format this renderer produces."""
@@ -35,29 +84,41 @@ class MarkdownRenderer(BaseRenderer):
         Returns:
             Markdown string
         """
-        # Check data type and render appropriately
-        if hasattr(data, "__class__"):
-            class_name = data.__class__.__name__
-
-            if class_name == "DiffReport":
-                return self._render_diff_report(data, context)
-            elif class_name == "ConfigReport":
-                return self._render_config_report(data, context)
-            elif class_name == "CompatReport":
-                return self._render_compat_report(data, context)
-            elif class_name == "LintResult":
-                return self._render_lint_result(data, context)
-            elif class_name == "BehavioralSignature":
-                return self._render_fingerprint(data, context)
-            elif class_name == "FingerprintComparison":
-                return self._render_fingerprint_comparison(data, context)
-
-        # Generic rendering
-        return self._render_generic(data, context)
+        render = self._dispatch.get(data.__class__.__name__, self._render_generic)
+        return render(data, context)
+
+    def render_stream(self, data: Any, context: RenderContext) -> Iterator[str]:
+        """Render data to Markdown in chunks.
+
+        Diff reports are emitted a batch of lines at a time, so writing one
+        with many entries to a file never holds the whole document in memory.
+        Other reports are small and are rendered in one piece.
+
+        Args:
+            data: The data to render
+            context: Rendering context
+
+        Yields:
+            Consecutive pieces of the Markdown document
+        """
+        if data.__class__.__name__ != "DiffReport":
+            yield self.render(data, context)
+            return
+
+        lines = self._diff_report_lines(data, context)
+        sep = ""
+        while batch := list(islice(lines, _STREAM_BATCH_LINES)):
+            yield sep
+            yield "\n".join(batch)
+            sep = "\n"
 
     def _render_diff_report(self, report: Any, context: RenderContext) -> str:
         """Render a diff report to Markdown."""
-        lines = [
+        return "\n".join(self._diff_report_lines(report, context))
+
+    def _diff_report_lines(self, report: Any, context: RenderContext) -> Iterator[str]:
+        """Generate the lines of a diff report in Markdown."""
+        yield from (
             "# NIM Diff Report",
             "",
             f"**Generated:** {report.generated_at.isoformat()}",
@@ -75,52 +136,38 @@ class MarkdownRenderer(BaseRenderer):
             f"- Modified: {report.modified_count}",
             f"- Breaking Changes: **{len(report.breaking_changes)}**",
             "",
-        ]
+        )
 
         # Breaking changes
         if report.breaking_changes:
-            lines.extend(
-                [
-                    "## Breaking Changes",
-                    "",
-                ]
-            )
+            yield _BREAKING_HEADER
             for bc in report.breaking_changes:
-                lines.extend(
-                    [
-                        f"### {bc.title}",
-                        "",
-                        bc.description,
-                        "",
-                        f"**Impact:** {bc.impact}",
-                        "",
-                    ]
+                yield from (
+                    f"### {bc.title}",
+                    "",
+                    bc.description,
+                    "",
+                    f"**Impact:** {bc.impact}",
+                    "",
                 )
                 if bc.migration:
-                    lines.append(f"**Migration:** {bc.migration}")
-                    lines.append("")
+                    yield f"**Migration:** {bc.migration}"
+                    yield ""
 
         # All changes table
         if report.entries:
-            lines.extend(
-                [
-                    "## All Changes",
-                    "",
-                    "| Category | Type | Path | Old Value | New Value |",
-                    "|----------|------|------|-----------|-----------|",
-                ]
-            )
+            yield _CHANGES_TABLE_HEADER
 
+            # Escaping never shortens text, so only the cell's prefix needs it
+            escape = self._escape_md
             for entry in report.entries:
-                old = self._escape_md(entry.old_value or "-")[:40]
-                new = self._escape_md(entry.new_value or "-")[:40]
-                lines.append(
-                    f"| {entry.category.value} | {entry.change_type.value} | "
+                old = escape((entry.old_value or "-")[:_VALUE_WIDTH])[:_VALUE_WIDTH]
+                new = escape((entry.new_value or "-")[:_VALUE_WIDTH])[:_VALUE_WIDTH]
+                yield (
+                    f"| {entry.category.label} | {entry.change_type.label} | "
                     f"`{entry.path}` | {old} | {new} |"
                 )
 
-        return "\n".join(lines)
-
     def _render_config_report(self, report: Any, context: RenderContext) -> str:
         """Render a config report to Markdown."""
         lines = [
@@ -132,25 +179,18 @@ class MarkdownRenderer(BaseRenderer):
 
         # Warnings
         if report.warnings:
-            lines.extend(["## Warnings", ""])
+            lines.append(_WARNINGS_HEADER)
             for warning in report.warnings:
                 lines.append(f"- ⚠️ {warning}")
             lines.append("")
 
         # Configuration table
         if report.entries:
-            lines.extend(
-                [
-                    "## Configuration",
-                    "",
-                    "| Variable | Value | Default | Impact | Description |",
-                    "|----------|-------|---------|--------|-------------|",
-                ]
-            )
+            lines.append(_CONFIG_TABLE_HEADER)
 
             for entry in report.entries:
                 if entry.is_set or context.verbose:
-                    impact = entry.impact.level.value if entry.impact else "-"
+                    impact = entry.impact.level.label if entry.impact else "-"
                     desc = (entry.description or "")[:30]
                     value = entry.value or "-"
                     default = entry.default_value or "-"
@@ -163,7 +203,7 @@ class MarkdownRenderer(BaseRenderer):
 
         # Recommendations
         if report.recommendations:
-            lines.extend(["## Recommendations", ""])
+            lines.append(_RECOMMENDATIONS_HEADER)
             for rec in report.recommendations:
                 lines.append(f"- {rec}")
             lines.append("")
@@ -219,14 +259,14 @@ class MarkdownRenderer(BaseRenderer):
 
         # Warnings
         if report.warnings:
-            lines.extend(["## Warnings", ""])
+            lines.append(_WARNINGS_HEADER)
             for warning in report.warnings:
                 lines.append(f"- ⚠️ {warning}")
             lines.append("")
 
         # Recommendations
         if report.recommendations:
-            lines.extend(["## Recommendations", ""])
+            lines.append(_RECOMMENDATIONS_HEADER)
             for rec in report.recommendations:
                 lines.append(f"- {rec}")
             lines.append("")
@@ -254,22 +294,13 @@ class MarkdownRenderer(BaseRenderer):
 
         # Violations
         if result.violations:
-            lines.extend(
-                [
-                    "## Violations",
-                    "",
-                    "| Severity | Rule | Message | Remediation |",
-                    "|----------|------|---------|-------------|",
-                ]
-            )
+            lines.append(_VIOLATIONS_TABLE_HEADER)
 
             for v in result.violations:
-                severity_icon = {"error": "🔴", "warning": "🟡", "info": "🔵"}.get(
-                    v.severity.value, ""
-                )
+                severity_icon = _SEVERITY_ICONS.get(v.severity.label, "")
                 remediation = (v.rule.remediation or "-")[:40]
                 lines.append(
-                    f"| {severity_icon} {v.severity.value} | {v.rule.name} | "
+                    f"| {severity_icon} {v.severity.label} | {v.rule.name} | "
                     f"{v.message} | {remediation} |"
                 )
 
@@ -296,19 +327,13 @@ class MarkdownRenderer(BaseRenderer):
         ]
 
         if fingerprint.responses:
-            lines.extend(
-                [
-                    "## Responses",
-                    "",
-                    "| Prompt ID | Latency (ms) | Tokens In | Tokens Out | Hash |",
-                    "|-----------|--------------|-----------|------------|------|",
-                ]
-            )
+            lines.append(_RESPONSES_TABLE_HEADER)
 
             for resp in fingerprint.responses:
+                response_hash = resp.response_hash.hex() if resp.response_hash else "-"
                 lines.append(
                     f"| {resp.prompt_id} | {resp.latency_ms:.1f} | "
-                    f"{resp.tokens_in} | {resp.tokens_out} | `{resp.response_hash or '-'}` |"
+                    f"{resp.tokens_in} | {resp.tokens_out} | `{response_hash}` |"
                 )
 
             lines.append("")
@@ -336,12 +361,7 @@ class MarkdownRenderer(BaseRenderer):
         ]
 
         if comparison.response_diffs:
-            lines.extend(
-                [
-                    "## Differences",
-                    "",
-                ]
-            )
+            lines.append(_DIFFERENCES_HEADER)
 
             for diff in comparison.response_diffs[:10]:
                 lines.extend(
@@ -360,7 +380,7 @@ class MarkdownRenderer(BaseRenderer):
     def _render_generic(self, data: Any, context: RenderContext) -> str:
         """Render generic data to Markdown."""
         if isinstance(data, BaseModel):
-            dict_data = data.model_dump(mode="json")
+            dict_data = model_json_dict(data)
         elif isinstance(data, dict):
             dict_data = data
         else:
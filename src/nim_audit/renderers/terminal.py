@@ -2,14 +2,37 @@
 
 from __future__ import annotations
 
+import io
+from collections.abc import Callable
 from typing import Any
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
-from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext
+from nim_audit.renderers.base import BaseRenderer, OutputFormat, RenderContext, model_json_dict
+
+# Cell styles for table rows, built once rather than parsed from markup per row
+_WHITE = Style.parse("white")
+_DIM = Style.parse("dim")
+_CHANGE_TYPE_STYLES = {
+    "added": Style.parse("green"),
+    "removed": Style.parse("red"),
+    "modified": Style.parse("yellow"),
+}
+_IMPACT_STYLES = {
+    "critical": Style.parse("bold red"),
+    "high": Style.parse("red"),
+    "medium": Style.parse("yellow"),
+    "low": Style.parse("green"),
+}
+_SEVERITY_STYLES = {
+    "error": Style.parse("red"),
+    "warning": Style.parse("yellow"),
+    "info": Style.parse("blue"),
+}
 
 
 class TerminalRenderer(BaseRenderer):
@@ -30,6 +53,15 @@ class TerminalRenderer(BaseRenderer):
             console: Rich console to use. Creates a new one if None.
         """
         self._console = console or Console()
+        # Report class name -> render method
+        self._dispatch: dict[str, Callable[[Any, RenderContext], None]] = {
+            "DiffReport": self._render_diff_report,
+            "ConfigReport": self._render_config_report,
+            "CompatReport": self._render_compat_report,
+            "LintResult": self._render_lint_result,
+            "BehavioralSignature": self._render_fingerprint,
+            "FingerprintComparison": self._render_fingerprint_comparison,
+        }
 
     @property
     def format(self) -> OutputFormat:
@@ -49,26 +81,10 @@ class TerminalRenderer(BaseRenderer):
         Returns:
             Empty string (output is printed to console)
         """
-        # Check data type and render appropriately
-        if hasattr(data, "__class__"):
-            class_name = data.__class__.__name__
-
-            if class_name == "DiffReport":
-                self._render_diff_report(data, context)
-            elif class_name == "ConfigReport":
-                self._render_config_report(data, context)
-            elif class_name == "CompatReport":
-                self._render_compat_report(data, context)
-            elif class_name == "LintResult":
-                self._render_lint_result(data, context)
-            elif class_name == "BehavioralSignature":
-                self._render_fingerprint(data, context)
-            elif class_name == "FingerprintComparison":
-                self._render_fingerprint_comparison(data, context)
-            else:
-                self._render_generic(data, context)
-        else:
-            self._render_generic(data, context)
+        # Buffer the report's prints and write them to the terminal at once
+        render = self._dispatch.get(type(data).__name__, self._render_generic)
+        with self._console:
+            render(data, context)
 
         return ""
 
@@ -84,18 +100,16 @@ class TerminalRenderer(BaseRenderer):
         if context.output_path is None:
             raise ValueError("output_path must be set in context for file rendering")
 
-        # Create a console that captures output
-        file_console = Console(record=True, force_terminal=True)
-        original_console = self._console
-        self._console = file_console
+        # Record into a console whose own output is discarded, so the report
+        # is only written to the file. A separate renderer draws into it, so
+        # this instance's console is never swapped out from under a concurrent
+        # render() on the shared renderer.
+        file_console = Console(file=io.StringIO(), record=True, force_terminal=True)
+        type(self)(file_console).render(data, context)
 
-        try:
-            self.render(data, context)
-            # Export with ANSI codes for color support
-            output = file_console.export_text(styles=True)
-            context.output_path.write_text(output)
-        finally:
-            self._console = original_console
+        # Export with ANSI codes for color support
+        output = file_console.export_text(styles=True)
+        context.output_path.write_text(output)
 
     def _render_diff_report(self, report: Any, context: RenderContext) -> None:
         """Render a diff report."""
@@ -142,15 +156,10 @@ class TerminalRenderer(BaseRenderer):
             table.add_column("New Value", max_width=30)
 
             for entry in report.entries:
-                type_style = {
-                    "added": "green",
-                    "removed": "red",
-                    "modified": "yellow",
-                }.get(entry.change_type.value, "white")
-
+                change_type = entry.change_type.label
                 table.add_row(
-                    entry.category.value,
-                    f"[{type_style}]{entry.change_type.value}[/{type_style}]",
+                    entry.category.label,
+                    Text.styled(change_type, _CHANGE_TYPE_STYLES.get(change_type, _WHITE)),
                     entry.path,
                     entry.old_value or "-",
                     entry.new_value or "-",
@@ -187,15 +196,10 @@ class TerminalRenderer(BaseRenderer):
             table.add_column("Impact")
 
             for entry in entries:
-                impact_str = ""
+                impact = Text()
                 if entry.impact:
-                    style = {
-                        "critical": "bold red",
-                        "high": "red",
-                        "medium": "yellow",
-                        "low": "green",
-                    }.get(entry.impact.level.value, "dim")
-                    impact_str = f"[{style}]{entry.impact.level.value}[/{style}]"
+                    level = entry.impact.level.label
+                    impact = Text.styled(level, _IMPACT_STYLES.get(level, _DIM))
 
                 name = entry.name
                 if entry.is_deprecated:
@@ -205,7 +209,7 @@ class TerminalRenderer(BaseRenderer):
                     name,
                     entry.value or "[dim]-[/dim]",
                     entry.default_value or "[dim]-[/dim]",
-                    impact_str,
+                    impact,
                 )
 
             self._console.print(table)
@@ -289,14 +293,9 @@ class TerminalRenderer(BaseRenderer):
             table.add_column("Message")
 
             for v in result.violations:
-                severity_style = {
-                    "error": "red",
-                    "warning": "yellow",
-                    "info": "blue",
-                }.get(v.severity.value, "white")
-
+                severity = v.severity.label
                 table.add_row(
-                    f"[{severity_style}]{v.severity.value.upper()}[/{severity_style}]",
+                    Text.styled(severity.upper(), _SEVERITY_STYLES.get(severity, _WHITE)),
                     v.rule.name,
                     v.message,
                 )
@@ -345,7 +344,7 @@ class TerminalRenderer(BaseRenderer):
         from pydantic import BaseModel
 
         if isinstance(data, BaseModel):
-            dict_data = data.model_dump(mode="json")
+            dict_data = model_json_dict(data)
         elif isinstance(data, dict):
             dict_data = data
         else:
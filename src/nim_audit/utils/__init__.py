@@ -1,6 +1,12 @@
 """Utility functions for nim-audit."""
 
-from nim_audit.utils.hashing import compute_hash, hash_dict, hash_file, short_hash
+from nim_audit.utils.hashing import (
+    compute_hash,
+    hash_dict,
+    hash_file,
+    short_hash,
+    short_hash_file,
+)
 from nim_audit.utils.logging import configure_logging, get_logger, get_logger_with_context
 from nim_audit.utils.errors import (
     NimAuditError,
@@ -16,7 +22,7 @@ from nim_audit.utils.errors import (
     safe_get,
 )
 from nim_audit.utils.expression import SafeExpressionEvaluator, safe_eval
-from nim_audit.utils.cache import Cache, get_cache
+from nim_audit.utils.cache import BlobCache, Cache, get_cache
 from nim_audit.utils.config import (
     NimAuditConfig,
     CacheConfig,
@@ -41,6 +47,7 @@ __all__ = [
     "hash_dict",
     "hash_file",
     "short_hash",
+    "short_hash_file",
     # Logging
     "configure_logging",
     "get_logger",
@@ -61,6 +68,7 @@ __all__ = [
     "SafeExpressionEvaluator",
     "safe_eval",
     # Cache
+    "BlobCache",
     "Cache",
     "get_cache",
     # Config
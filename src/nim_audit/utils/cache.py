@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import tempfile
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Callable, TypeVar
 
+from nim_audit.utils import fastjson
+
 T = TypeVar("T")
 
 
@@ -37,6 +42,7 @@ class Cache:
         cache_dir: Path | str | None = None,
         default_ttl: int = 3600,
         enabled: bool = True,
+        max_memory_entries: int = 1024,
     ) -> None:
         """Initialize the cache.
 
@@ -44,13 +50,16 @@ class Cache:
             cache_dir: Directory for cache files. Defaults to ~/.cache/nim-audit
             default_ttl: Default time-to-live in seconds
             enabled: Whether caching is enabled
+            max_memory_entries: Most entries kept in memory; the least
+                recently used are dropped first (files are kept)
         """
         if cache_dir is None:
             cache_dir = Path.home() / ".cache" / "nim-audit"
         self._cache_dir = Path(cache_dir)
         self._default_ttl = default_ttl
         self._enabled = enabled
-        self._memory_cache: dict[str, tuple[Any, float]] = {}
+        self._max_memory_entries = max_memory_entries
+        self._memory_cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
 
         # Create cache directory if it doesn't exist
         if self._enabled:
@@ -89,6 +98,7 @@ class Cache:
         if key in self._memory_cache:
             value, expires_at = self._memory_cache[key]
             if time.time() < expires_at:
+                self._memory_cache.move_to_end(key)
                 return value
             else:
                 del self._memory_cache[key]
@@ -97,11 +107,11 @@ class Cache:
         cache_file = self._key_to_path(key)
         if cache_file.exists():
             try:
-                data = json.loads(cache_file.read_text())
+                data = fastjson.load_file(cache_file)
                 if time.time() < data.get("expires_at", 0):
                     value = data["value"]
                     # Store in memory cache for faster access
-                    self._memory_cache[key] = (value, data["expires_at"])
+                    self._remember(key, value, data["expires_at"])
                     return value
                 else:
                     # Expired - delete the file
@@ -128,7 +138,7 @@ class Cache:
         expires_at = time.time() + ttl
 
         # Store in memory cache
-        self._memory_cache[key] = (value, expires_at)
+        self._remember(key, value, expires_at)
 
         # Store in file cache
         cache_file = self._key_to_path(key)
@@ -139,10 +149,18 @@ class Cache:
                 "expires_at": expires_at,
                 "created_at": time.time(),
             }
-            cache_file.write_text(json.dumps(data, default=str))
+            cache_file.write_bytes(fastjson.dumps(data, default=str))
         except (OSError, TypeError):
             pass
 
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        """Store an entry in the memory cache, evicting the least recently used."""
+        memory = self._memory_cache
+        memory[key] = (value, expires_at)
+        memory.move_to_end(key)
+        if len(memory) > self._max_memory_entries:
+            memory.popitem(last=False)
+
     def delete(self, key: str) -> None:
         """Delete a value from the cache.
 
@@ -231,6 +249,84 @@ class Cache:
         }
 
 
+class BlobCache:
+    """Content-addressed on-disk store for immutable registry blobs.
+
+    Blobs are stored as raw bytes under their digest, so entries never
+    expire: a digest always names the same content. Writes are verified
+    against the digest and made atomic with ``os.replace``.
+
+    Example:
+        blobs = BlobCache()
+        data = blobs.get("sha256:abc...")
+        if data is None:
+            data = download()
+            blobs.put("sha256:abc...", data)
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None) -> None:
+        """Initialize the blob cache.
+
+        Args:
+            cache_dir: Directory for blobs. Defaults to ~/.cache/nim-audit/blobs
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "nim-audit" / "blobs"
+        self._cache_dir = Path(cache_dir)
+
+    def _digest_to_path(self, digest: str) -> Path:
+        """Convert a digest to a file path, fanned out by hash prefix."""
+        algorithm, _, hex_hash = digest.rpartition(":")
+        return self._cache_dir / (algorithm or "sha256") / hex_hash[:2] / hex_hash
+
+    def get(self, digest: str) -> bytes | None:
+        """Get a blob by digest.
+
+        Args:
+            digest: Blob digest (e.g., "sha256:abc...")
+
+        Returns:
+            The blob bytes, or None if not cached
+        """
+        try:
+            return self._digest_to_path(digest).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, digest: str, data: bytes) -> bool:
+        """Store a blob under its digest.
+
+        Args:
+            digest: Blob digest (e.g., "sha256:abc...")
+            data: Blob bytes
+
+        Returns:
+            True if stored, False if the data does not match the digest
+            or could not be written
+        """
+        algorithm, _, hex_hash = digest.rpartition(":")
+        try:
+            if hashlib.new(algorithm or "sha256", data).hexdigest() != hex_hash:
+                return False
+        except ValueError:
+            return False
+
+        path = self._digest_to_path(digest)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return False
+        return True
+
+
 # Global cache instance
 _default_cache: Cache | None = None
 
@@ -0,0 +1,28 @@
+"""Shared Docker SDK client."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+# Docker client shared across callers; from_env() performs a socket
+# handshake and API version negotiation that is wasteful to repeat.
+_DOCKER_CLIENT: Any = None
+_DOCKER_CLIENT_LOCK = threading.Lock()
+
+
+def get_docker_client() -> Any:
+    """Get the shared Docker client, creating it on first use.
+
+    Raises:
+        ImportError: If the Docker SDK is not installed
+        docker.errors.DockerException: If the daemon cannot be reached
+    """
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None:
+        with _DOCKER_CLIENT_LOCK:
+            if _DOCKER_CLIENT is None:
+                import docker
+
+                _DOCKER_CLIENT = docker.from_env()
+    return _DOCKER_CLIENT
@@ -0,0 +1,108 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson parses straight from bytes without a separate UTF-8 decode pass and
+encodes in C without per-object Python callbacks. When it is not available
+the stdlib json module is used instead.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+# Below this size a plain read is cheaper than setting up a mapping
+MMAP_THRESHOLD = 64 * 1024
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: Raw UTF-8 bytes (or a buffer over them) or a decoded string
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: int | None = None,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize a value to compact UTF-8 JSON.
+
+    orjson only supports two-space indentation, so other widths use the
+    stdlib encoder. Both produce the same separators and leave non-ASCII
+    characters unescaped. Dataclasses are handed to ``default`` by both, as
+    the stdlib encoder has no native support for them.
+
+    Args:
+        obj: Value to serialize
+        indent: Indentation width, or None/0 for a single line
+        default: Called for objects the encoder does not support natively
+
+    Returns:
+        The encoded document
+
+    Raises:
+        TypeError: If a value cannot be serialized
+    """
+    if orjson is not None and indent in (None, 0, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        # orjson.JSONEncodeError subclasses TypeError
+        return orjson.dumps(obj, default=default, option=option)
+    separators = (",", ": ") if indent else (",", ":")
+    return json.dumps(
+        obj, indent=indent or None, separators=separators, default=default, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def load_file(path: Path | str, size: int | None = None) -> Any:
+    """Parse a JSON file, memory-mapping it when it is large.
+
+    Args:
+        path: Path to the JSON file
+        size: File size if already known, to skip an extra stat
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return loads(view)
+            finally:
+                view.release()
@@ -39,6 +39,40 @@ def hash_file(path: Path | str, algorithm: str = "sha256", chunk_size: int = 819
     return hasher.hexdigest()
 
 
+def short_hash_file(
+    path: Path | str,
+    length: int = 8,
+    algorithm: str = "sha256",
+    chunk_size: int = 8192,
+) -> str:
+    """Compute a short identifier hash of a file.
+
+    BLAKE2 algorithms produce a digest of the requested length natively;
+    other algorithms have their raw digest truncated before hex encoding,
+    so no full-length hex string is built.
+
+    Args:
+        path: Path to the file
+        length: Digest length in bytes (the hex string is twice as long)
+        algorithm: Hash algorithm to use
+        chunk_size: Size of chunks to read
+
+    Returns:
+        Hex digest of the truncated file hash
+    """
+    hasher: hashlib._Hash | hashlib.blake2b | hashlib.blake2s
+    if algorithm == "blake2b":
+        hasher = hashlib.blake2b(digest_size=length)
+    elif algorithm == "blake2s":
+        hasher = hashlib.blake2s(digest_size=length)
+    else:
+        hasher = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.digest()[:length].hex()
+
+
 def hash_dict(data: dict[str, Any], algorithm: str = "sha256") -> str:
     """Compute hash of a dictionary.
 
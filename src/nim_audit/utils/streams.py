@@ -0,0 +1,39 @@
+"""Stream helpers for reading Docker API byte streams."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable
+from typing import Any
+
+
+class ChunkReader(io.RawIOBase):
+    """Minimal file-like adapter over an iterable of byte chunks.
+
+    Lets ``tarfile.open(fileobj=..., mode="r|")`` consume the chunk
+    generators returned by ``image.save()`` or ``container.get_archive()``
+    without first writing them to disk.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        # Unread part of the current chunk is self._chunk[self._pos:]; reads
+        # advance the offset instead of re-slicing (and copying) the rest.
+        self._chunk = memoryview(b"")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while self._pos >= len(self._chunk):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+            self._pos = 0
+        pos = self._pos
+        size = min(len(b), len(self._chunk) - pos)
+        b[:size] = self._chunk[pos : pos + size]
+        self._pos = pos + size
+        return size
@@ -1,11 +1,12 @@
 """Unit tests for the Cache module."""
 
+import hashlib
 import json
 import time
 
 import pytest
 
-from nim_audit.utils.cache import Cache, get_cache
+from nim_audit.utils.cache import BlobCache, Cache, get_cache
 
 
 class TestCache:
@@ -100,6 +101,18 @@ class TestCache:
         assert result == "value1"
         assert "key1" in cache._memory_cache
 
+    def test_cache_memory_layer_bounded_lru(self, tmp_path):
+        """Test that the memory cache evicts the least recently used entry."""
+        cache = Cache(cache_dir=tmp_path, max_memory_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert list(cache._memory_cache) == ["a", "c"]
+        # Evicted entries are still served from disk
+        assert cache.get("b") == 2
+
     def test_cache_file_persistence(self, tmp_path):
         """Test that values are persisted to file."""
         cache_dir = tmp_path / "cache"
@@ -228,3 +241,27 @@ class TestCache:
         cache1 = get_cache()
         cache2 = get_cache()
         assert cache1 is cache2
+
+
+class TestBlobCache:
+    """Tests for BlobCache class."""
+
+    def test_put_get_roundtrip(self, tmp_path):
+        """Test that stored blobs are read back by digest."""
+        blobs = BlobCache(cache_dir=tmp_path)
+        data = b'{"architecture": "amd64"}'
+        digest = f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+        assert blobs.get(digest) is None
+        assert blobs.put(digest, data)
+        assert blobs.get(digest) == data
+        assert (tmp_path / "sha256" / digest[7:9] / digest[7:]).is_file()
+
+    def test_put_rejects_mismatched_digest(self, tmp_path):
+        """Test that data not matching its digest is not stored."""
+        blobs = BlobCache(cache_dir=tmp_path)
+        digest = "sha256:" + "0" * 64
+
+        assert not blobs.put(digest, b"corrupt")
+        assert blobs.get(digest) is None
+        assert not blobs.put("md0:abc", b"data")
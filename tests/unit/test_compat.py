@@ -4,6 +4,12 @@ import pytest
 
 from nim_audit.core.compat import CompatChecker
 from nim_audit.core.image import NIMImage
+from nim_audit.models.compat import (
+    ISSUE_DRIVER,
+    ISSUE_MEMORY,
+    CompatReport,
+    GPURequirements,
+)
 from nim_audit.models.image import ImageMetadata, ImageDigest
 
 
@@ -99,8 +105,25 @@ class TestCompatChecker:
 
         assert result.success
         assert result.report is not None
-        # Should be a list (possibly empty)
-        assert isinstance(result.report.compatibility_issues, list)
+        # Should be a tuple (possibly empty)
+        assert isinstance(result.report.compatibility_issues, tuple)
+        assert bool(result.report.issue_mask) == bool(result.report.compatibility_issues)
+
+    def test_compatibility_issues_from_flags(self):
+        """Test failed checks map to issue bits and messages in check order."""
+        report = CompatReport(
+            image_reference="test:1.0",
+            requirements=GPURequirements(),
+            compatible=False,
+            memory_compatible=False,
+            driver_compatible=False,
+        )
+
+        assert report.issue_mask == ISSUE_MEMORY | ISSUE_DRIVER
+        assert report.compatibility_issues == (
+            "GPU memory below minimum requirement",
+            "NVIDIA driver version below minimum requirement",
+        )
 
 
 class TestGPUMatrix:
@@ -126,6 +149,16 @@ class TestGPUMatrix:
             assert "compute_capability" in info
             assert "memory_gb" in info
 
+    def test_gpu_matrix_is_read_only(self):
+        """Test that the shared GPU matrix cannot be mutated."""
+        from nim_audit.knowledge.gpu_matrix import get_gpu_matrix
+
+        matrix = get_gpu_matrix()
+        assert get_gpu_matrix() is matrix
+
+        with pytest.raises(TypeError):
+            matrix["H100"]["memory_gb"] = 0
+
     def test_recommended_gpus_for_model_size(self):
         """Test GPU recommendations by model size."""
         from nim_audit.knowledge.gpu_matrix import get_recommended_gpus_for_model_size
@@ -102,6 +102,16 @@ class TestConfigAnalyzer:
         assert len(errors) > 0
         assert any("NIM_LOG_LEVEL" in e for e in errors)
 
+    def test_validate_pattern_mismatch(self, sample_nim_image: NIMImage):
+        """Test validation rejects values that only partially match the pattern."""
+        analyzer = ConfigAnalyzer()
+
+        errors = analyzer.validate(
+            sample_nim_image,
+            env={"NIM_MAX_BATCH_SIZE": "32abc"},
+        )
+        assert any("NIM_MAX_BATCH_SIZE" in e for e in errors)
+
     def test_load_env_file(self, sample_env_file: str):
         """Test loading env file."""
         analyzer = ConfigAnalyzer()
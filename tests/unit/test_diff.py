@@ -1,10 +1,12 @@
 """Unit tests for the DiffEngine."""
 
+from datetime import UTC, datetime
+
 import pytest
 
 from nim_audit.core.diff import DiffEngine
 from nim_audit.core.image import NIMImage
-from nim_audit.models.diff import ChangeCategory, ChangeType, Severity
+from nim_audit.models.diff import ChangeCategory, ChangeType, DiffReport, Severity
 
 
 class TestDiffEngine:
@@ -151,3 +153,98 @@ class TestDiffEngine:
 
         warning_entries = result.report.entries_by_severity(Severity.WARNING)
         assert all(e.severity == Severity.WARNING for e in warning_entries)
+
+    def test_entry_indexes_cover_all_entries(
+        self, sample_nim_image: NIMImage, sample_nim_image_v2: NIMImage
+    ):
+        """Test category buckets partition the entries and are reused."""
+        engine = DiffEngine()
+        result = engine.diff(sample_nim_image, sample_nim_image_v2)
+
+        assert result.report is not None
+        report = result.report
+        bucketed = sum(len(report.entries_by_category(c)) for c in ChangeCategory)
+        assert bucketed == len(report.entries)
+        assert report.entries_by_category(ChangeCategory.API) == ()
+        assert report.entries_by_severity(Severity.INFO) is report.entries_by_severity(
+            Severity.INFO
+        )
+
+    def test_report_json_keeps_string_enums(
+        self, sample_nim_image: NIMImage, sample_nim_image_v2: NIMImage
+    ):
+        """Test integer-backed enums still dump and load as their string labels."""
+        engine = DiffEngine()
+        result = engine.diff(sample_nim_image, sample_nim_image_v2)
+
+        assert result.report is not None
+        dumped = result.report.model_dump(mode="json")
+        entry = dumped["entries"][0]
+        assert entry["category"] in {c.label for c in ChangeCategory}
+        assert entry["severity"] in {"info", "warning", "breaking"}
+
+        restored = type(result.report).model_validate(dumped)
+        assert restored.entries == result.report.entries
+
+    def test_build_uses_shared_timestamp(
+        self, sample_nim_image: NIMImage, sample_nim_image_v2: NIMImage
+    ):
+        """Test DiffReport.build derives counts and honours a passed timestamp."""
+        engine = DiffEngine()
+        result = engine.diff(sample_nim_image, sample_nim_image_v2)
+        assert result.report is not None
+
+        now = datetime(2024, 3, 1, tzinfo=UTC)
+        report = DiffReport.build(
+            sample_nim_image.metadata,
+            sample_nim_image_v2.metadata,
+            result.report.entries,
+            now=now,
+        )
+
+        assert report.generated_at is now
+        assert report.total_changes == result.report.total_changes
+        assert report.added_count == result.report.added_count
+        assert result.report.generated_at.tzinfo is not None
+
+    def test_msgspec_round_trip(
+        self, sample_nim_image: NIMImage, sample_nim_image_v2: NIMImage
+    ):
+        """Test the opt-in msgspec encoding round-trips a report."""
+        pytest.importorskip("msgspec")
+        from nim_audit.models._msgspec import decode_diff_report, encode_diff_report
+
+        engine = DiffEngine()
+        result = engine.diff(sample_nim_image, sample_nim_image_v2)
+        assert result.report is not None
+
+        restored = decode_diff_report(encode_diff_report(result.report))
+
+        assert restored.entries == result.report.entries
+        assert restored.breaking_changes == result.report.breaking_changes
+        assert restored.total_changes == result.report.total_changes
+
+
+class TestSeverity:
+    """Tests for the change severity enum."""
+
+    def test_parses_legacy_string(self):
+        """Test the former string values are still accepted."""
+        assert Severity("breaking") is Severity.BREAKING
+        assert ChangeType("added") is ChangeType.ADDED
+
+    def test_parse(self):
+        """Test parse accepts values and labels and rejects anything else."""
+        assert ChangeCategory.parse("api") is ChangeCategory.API
+        assert Severity.parse(int(Severity.BREAKING)) is Severity.BREAKING
+        with pytest.raises(ValueError):
+            ChangeCategory.parse("nope")
+
+    def test_ordering(self):
+        """Test severities compare by seriousness."""
+        assert Severity.INFO < Severity.WARNING < Severity.BREAKING
+
+    def test_str_is_label(self):
+        """Test str() and f-strings render the label."""
+        assert str(Severity.WARNING) == "warning"
+        assert f"{ChangeCategory.API}" == "api"
@@ -0,0 +1,67 @@
+"""Unit tests for the fastjson helpers."""
+
+import json
+
+import pytest
+
+from nim_audit.utils import fastjson
+
+
+class TestLoads:
+    """Tests for fastjson.loads."""
+
+    def test_loads_bytes(self):
+        """Test parsing raw bytes."""
+        assert fastjson.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_loads_memoryview(self):
+        """Test parsing a buffer over bytes."""
+        assert fastjson.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+    def test_loads_stdlib_fallback(self, monkeypatch):
+        """Test parsing without orjson installed."""
+        monkeypatch.setattr(fastjson, "orjson", None)
+        assert fastjson.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+    def test_loads_invalid_raises_json_error(self):
+        """Test that invalid documents raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            fastjson.loads(b"{not json")
+
+
+class TestDumps:
+    """Tests for fastjson.dumps."""
+
+    DATA = {"name": "café", "ports": [8000], 1: None}
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_dumps_matches_stdlib_fallback(self, monkeypatch, indent):
+        """Test that orjson and stdlib output are identical."""
+        fast = fastjson.dumps(self.DATA, indent=indent)
+        monkeypatch.setattr(fastjson, "orjson", None)
+        assert fastjson.dumps(self.DATA, indent=indent) == fast
+        assert json.loads(fast) == {"name": "café", "ports": [8000], "1": None}
+
+    def test_dumps_default_and_type_error(self):
+        """Test the default hook and that unsupported values raise TypeError."""
+        assert fastjson.dumps({"s": {3}}, default=sorted) == b'{"s":[3]}'
+        with pytest.raises(TypeError):
+            fastjson.dumps(object())
+
+
+class TestLoadFile:
+    """Tests for fastjson.load_file."""
+
+    def test_load_small_file(self, tmp_path):
+        """Test loading a file below the mmap threshold."""
+        path = tmp_path / "small.json"
+        path.write_text('{"vocab": {"a": 0}}')
+        assert fastjson.load_file(path) == {"vocab": {"a": 0}}
+
+    def test_load_large_file(self, tmp_path):
+        """Test loading a file large enough to be memory-mapped."""
+        data = {"vocab": {f"token_{i}": i for i in range(10000)}}
+        path = tmp_path / "large.json"
+        path.write_text(json.dumps(data))
+        assert path.stat().st_size >= fastjson.MMAP_THRESHOLD
+        assert fastjson.load_file(path) == data
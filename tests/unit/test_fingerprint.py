@@ -1,9 +1,12 @@
 """Unit tests for the BehavioralFingerprinter."""
 
+import hashlib
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from nim_audit.core.fingerprint import BehavioralFingerprinter
 from nim_audit.core.image import NIMImage
@@ -215,6 +218,11 @@ class TestBehavioralFingerprinter:
         assert comparison.identical_responses == 1
         assert comparison.different_responses == 1
         assert comparison.similarity_score == 0.5
+        assert comparison.response_diffs[0]["target"] == "MISSING"
+
+        dumped = comparison.model_dump(mode="json")
+        assert dumped["similarity_score"] == 0.5
+        assert dumped["response_diffs"] == [dict(comparison.response_diffs[0])]
 
     def test_save_and_load_fingerprint(self, tmp_path):
         """Test saving and loading fingerprint."""
@@ -249,3 +257,62 @@ class TestBehavioralFingerprinter:
         assert loaded.image_reference == fp.image_reference
         assert len(loaded.responses) == 1
         assert loaded.responses[0].prompt_id == "test"
+        assert loaded.responses[0].response_hash == fp.responses[0].response_hash
+
+    def test_signature_rejects_unknown_fields(self):
+        """Test loading a signature with unexpected keys fails loudly."""
+        with pytest.raises(ValidationError):
+            BehavioralSignature.model_validate(
+                {"image_reference": "test:1.0", "fingerprint_id": "fp", "bogus": 1}
+            )
+
+    def test_prompt_response_from_text_hashes_response(self):
+        """Test from_text stores a 16-byte digest of the response."""
+        a = PromptResponse.from_text("p", "Hello!", "Hi there!", latency_ms=5.0)
+        b = PromptResponse.from_text("p", "Hello!", "Hi there!")
+        c = PromptResponse.from_text("p", "Hello!", "Hello!")
+
+        assert a.response_hash is not None
+        assert len(a.response_hash) == 16
+        assert a.response_hash == b.response_hash
+        assert a.response_hash != c.response_hash
+        assert a.model_dump(mode="json")["response_hash"] == a.response_hash.hex()
+
+    def test_compare_with_baseline_format_fingerprint(self, tmp_path):
+        """Test that fingerprints saved with SHA-256 hex hashes compare by response."""
+        baseline = {
+            "image_reference": "test:1.0",
+            "fingerprint_id": "old-fp",
+            "generated_at": "2024-01-01T12:00:00",
+            "responses": [
+                {
+                    "prompt_id": "greeting",
+                    "prompt": "Hello!",
+                    "response": "Hi there!",
+                    "response_hash": hashlib.sha256(b"Hi there!").hexdigest()[:16],
+                },
+                {
+                    "prompt_id": "math",
+                    "prompt": "2+2?",
+                    "response": "4",
+                    "response_hash": "not-a-hex-hash",
+                },
+            ],
+        }
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps(baseline))
+
+        fingerprinter = BehavioralFingerprinter()
+        old = fingerprinter.load_fingerprint(str(path))
+        new = BehavioralSignature(
+            image_reference="test:1.1",
+            fingerprint_id="new-fp",
+            responses=[
+                PromptResponse.from_text("greeting", "Hello!", "Hi there!"),
+                PromptResponse.from_text("math", "2+2?", "4"),
+            ],
+        )
+
+        comparison = fingerprinter.compare(old, new)
+
+        assert comparison.similarity_score == 1.0
@@ -0,0 +1,27 @@
+"""Unit tests for the hashing utilities."""
+
+import hashlib
+
+import pytest
+
+from nim_audit.utils.hashing import short_hash_file
+
+
+class TestShortHashFile:
+    """Tests for short_hash_file."""
+
+    @pytest.mark.parametrize(
+        ("algorithm", "expected"),
+        [
+            ("blake2b", hashlib.blake2b(b"tokenizer", digest_size=8).hexdigest()),
+            ("blake2s", hashlib.blake2s(b"tokenizer", digest_size=8).hexdigest()),
+            ("sha256", hashlib.sha256(b"tokenizer").hexdigest()[:16]),
+            ("md5", hashlib.md5(b"tokenizer").hexdigest()[:16]),
+        ],
+    )
+    def test_short_digest(self, tmp_path, algorithm, expected):
+        """Test that each algorithm yields a digest of the requested length."""
+        path = tmp_path / "tokenizer.json"
+        path.write_bytes(b"tokenizer")
+
+        assert short_hash_file(path, length=8, algorithm=algorithm) == expected
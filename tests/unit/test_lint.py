@@ -176,6 +176,22 @@ class TestPolicyLinter:
         assert len(policy.enabled_rules) == 1
         assert policy.enabled_rules[0].id == "r1"
 
+    def test_rule_indexes(self):
+        """Test rule lookup by id and enabled rules by severity."""
+        policy = Policy(
+            name="test",
+            rules=[
+                Rule(id="r1", name="a", description="", condition="True", severity=RuleSeverity.ERROR),
+                Rule(id="r2", name="b", description="", condition="True", enabled=False),
+                Rule(id="r1", name="dup", description="", condition="True"),
+            ],
+        )
+
+        assert policy.get_rule("r1").name == "a"
+        assert policy.get_rule("missing") is None
+        assert [r.name for r in policy.rules_by_severity(RuleSeverity.ERROR)] == ["a"]
+        assert [r.name for r in policy.rules_by_severity(RuleSeverity.WARNING)] == ["dup"]
+
     def test_rule_evaluation_with_labels(self, sample_nim_image: NIMImage):
         """Test rule evaluation accessing labels."""
         linter = PolicyLinter()
@@ -192,3 +208,23 @@ class TestPolicyLinter:
 
         assert result.success
         assert result.passed
+
+
+class TestRuleSeverity:
+    """Tests for the rule severity enum."""
+
+    def test_parses_label(self):
+        """Test severities are still read from their YAML strings."""
+        assert RuleSeverity("error") is RuleSeverity.ERROR
+
+    def test_ordering(self):
+        """Test severities compare from lowest to highest."""
+        assert RuleSeverity.INFO < RuleSeverity.WARNING < RuleSeverity.ERROR
+
+    def test_json_uses_label(self):
+        """Test rules dump and load severity as its string label."""
+        rule = Rule(id="r", name="r", description="", condition="True", severity=RuleSeverity.ERROR)
+        dumped = rule.model_dump(mode="json")
+
+        assert dumped["severity"] == "error"
+        assert Rule.model_validate(dumped).severity is RuleSeverity.ERROR
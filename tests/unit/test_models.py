@@ -0,0 +1,17 @@
+"""Unit tests for the models package."""
+
+import nim_audit.models as models
+
+
+class TestModelsPackage:
+    """Tests for the lazy models package exports."""
+
+    def test_all_matches_lazy_exports(self):
+        """Test that __all__ lists exactly the lazily exported names."""
+        assert len(models.__all__) == len(set(models.__all__))
+        assert set(models.__all__) == set(models._LAZY)
+
+    def test_exports_resolve(self):
+        """Test that every exported name resolves to its defining attribute."""
+        for name in models.__all__:
+            assert getattr(models, name) is not None
@@ -0,0 +1,344 @@
+"""Tests for the registry clients."""
+
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+
+from nim_audit.core.image import NIMImage
+from nim_audit.models.image import ImageMetadata
+from nim_audit.registry import (
+    ImageReference,
+    NGCRegistry,
+    OCIRegistry,
+    RegistryAuth,
+    RegistryError,
+    get_registry_client,
+    parse_reference,
+)
+from nim_audit.registry.base import parse_timestamp
+from nim_audit.utils.cache import BlobCache, Cache
+
+
+class TestOCIRegistry:
+    """Tests for OCIRegistry."""
+
+    def test_client_reused_until_closed(self) -> None:
+        """Test that one pooled client serves every request."""
+        registry = OCIRegistry(auth=RegistryAuth())
+        client = registry._get_client()
+        assert registry._get_client() is client
+
+        registry.close()
+        assert client.is_closed
+        assert registry._get_client() is not client
+        registry.close()
+
+    def test_client_created_once_across_threads(self) -> None:
+        """Test that concurrent first calls share a single client."""
+        registry = OCIRegistry(auth=RegistryAuth())
+        barrier = threading.Barrier(8)
+
+        def get_client() -> httpx.Client:
+            barrier.wait()
+            return registry._get_client()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: get_client(), range(8)))
+
+        assert all(client is clients[0] for client in clients)
+        registry.close()
+
+    def test_context_manager_closes_client(self) -> None:
+        """Test that leaving the with block closes the client."""
+        with OCIRegistry(auth=RegistryAuth()) as registry:
+            client = registry._get_client()
+        assert client.is_closed
+
+    def test_get_metadata_batch_keeps_order(self) -> None:
+        """Test that batch lookups return results in reference order."""
+
+        class StubRegistry(OCIRegistry):
+            def get_metadata(self, reference: str) -> ImageMetadata:
+                return ImageMetadata(reference=reference, repository=reference)
+
+        registry = StubRegistry(auth=RegistryAuth())
+        refs = [f"nim/model-{i}:1.0" for i in range(20)]
+
+        results = registry.get_metadata_batch(refs, max_workers=4)
+
+        assert [m.reference for m in results] == refs
+        assert registry.get_metadata_batch([]) == []
+
+    def test_manifest_revalidated_with_head(self, tmp_path: Path) -> None:
+        """Test that an unchanged manifest is served from cache after a HEAD."""
+        body = json.dumps(
+            {
+                "schemaVersion": 2,
+                "mediaType": OCIRegistry.MANIFEST_V2,
+                "config": {"digest": "sha256:" + "c" * 64},
+                "layers": [{"digest": "sha256:" + "a" * 64, "size": 10, "mediaType": "tar"}],
+            }
+        ).encode()
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.method)
+            headers = {
+                "content-type": OCIRegistry.MANIFEST_V2,
+                "docker-content-digest": "sha256:" + "d" * 64,
+            }
+            content = b"" if request.method == "HEAD" else body
+            return httpx.Response(200, headers=headers, content=content)
+
+        cache = Cache(cache_dir=tmp_path)
+        registry = OCIRegistry(auth=RegistryAuth(), cache=cache)
+        registry._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        first = registry.get_manifest("ghcr.io/nim/model:1.0")
+        second = registry.get_manifest("ghcr.io/nim/model:1.0")
+        assert second is first
+        assert first.digest.hash == "d" * 64
+        assert requests == ["HEAD", "GET", "HEAD"]
+
+        # A new client starts cold but finds the manifest in the persistent cache
+        fresh = OCIRegistry(auth=RegistryAuth(), cache=cache)
+        fresh._client = httpx.Client(transport=httpx.MockTransport(handler))
+        assert fresh.get_manifest("ghcr.io/nim/model:1.0") == first
+        assert requests[3:] == ["HEAD"]
+
+    def test_token_reused_across_repository_urls(self) -> None:
+        """Test that a token fetched for one URL is sent to others in the repo."""
+        token_requests = 0
+        unauthorized: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal token_requests
+            if request.url.host == "auth.example.com":
+                token_requests += 1
+                return httpx.Response(200, json={"token": "t0k3n", "expires_in": 300})
+            if request.headers.get("authorization") != "Bearer t0k3n":
+                unauthorized.append(request.url.path)
+                challenge = 'Bearer realm="https://auth.example.com/token",service="reg"'
+                return httpx.Response(401, headers={"www-authenticate": challenge})
+            return httpx.Response(200, json={"tags": ["1.0"]})
+
+        registry = OCIRegistry(auth=RegistryAuth())
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        url = "https://reg.example.com/v2/nim/model"
+
+        registry._request(client, "GET", f"{url}/tags/list", "nim/model")
+        response = registry._request(client, "GET", f"{url}/blobs/sha256:abc", "nim/model")
+
+        assert response.status_code == 200
+        assert token_requests == 1
+        assert unauthorized == ["/v2/nim/model/tags/list"]
+
+    def test_pull_layer_streams_and_verifies(self, tmp_path: Path) -> None:
+        """Test that layers are written to disk and checked against the digest."""
+        blob = b"layer-bytes" * 1000
+        digest = f"sha256:{hashlib.sha256(blob).hexdigest()}"
+        registry = OCIRegistry(auth=RegistryAuth())
+        registry._client = httpx.Client(
+            transport=httpx.MockTransport(lambda _request: httpx.Response(200, content=blob))
+        )
+
+        dest = tmp_path / "layer.tar"
+        registry.pull_layer("ghcr.io/nim/model:1.0", digest, dest)
+        assert dest.read_bytes() == blob
+
+        bad = tmp_path / "bad.tar"
+        with pytest.raises(RegistryError):
+            registry.pull_layer("ghcr.io/nim/model:1.0", "sha256:" + "0" * 64, bad)
+        assert not bad.exists()
+
+    def test_pull_layer_rejects_unknown_algorithm(self, tmp_path: Path) -> None:
+        """Test that an unknown digest algorithm raises RegistryError before fetching."""
+        registry = OCIRegistry(auth=RegistryAuth())
+        registry._client = httpx.Client(
+            transport=httpx.MockTransport(lambda _request: pytest.fail("request sent"))
+        )
+
+        with pytest.raises(RegistryError, match="Unsupported digest algorithm"):
+            registry.pull_layer("ghcr.io/nim/model:1.0", "md6:abc", tmp_path / "layer.tar")
+
+    def test_get_token_parses_quoted_challenge(self) -> None:
+        """Test that commas inside quoted challenge values are kept."""
+        seen: list[httpx.URL] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url)
+            return httpx.Response(200, json={"access_token": "abc"})
+
+        registry = OCIRegistry(auth=RegistryAuth())
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        challenge = (
+            'Bearer realm="https://auth.example.com/token",'
+            'service="reg,example",scope="repository:nim/model:pull,push"'
+        )
+
+        token, expires_in = registry._get_token(client, challenge, "nim/model")
+
+        assert (token, expires_in) == ("abc", OCIRegistry.DEFAULT_TOKEN_TTL)
+        assert seen[0].host == "auth.example.com"
+        assert seen[0].params["service"] == "reg,example"
+
+    @pytest.mark.parametrize(
+        ("expires_in", "expected"),
+        [
+            ("300", 300),
+            ("soon", OCIRegistry.DEFAULT_TOKEN_TTL),
+            (None, OCIRegistry.DEFAULT_TOKEN_TTL),
+        ],
+    )
+    def test_get_token_coerces_expires_in(self, expires_in: object, expected: int) -> None:
+        """Test that string or invalid expires_in values become integer lifetimes."""
+        registry = OCIRegistry(auth=RegistryAuth())
+        client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda _request: httpx.Response(200, json={"token": "t", "expires_in": expires_in})
+            )
+        )
+
+        _, lifetime = registry._get_token(client, 'Bearer realm="https://auth.example.com"', "nim")
+
+        assert lifetime == expected
+
+    def test_config_blob_served_from_blob_cache(self, tmp_path: Path) -> None:
+        """Test that a config blob is downloaded once per digest."""
+        config = json.dumps({"architecture": "amd64", "config": {"Env": ["A=1"]}}).encode()
+        config_digest = f"sha256:{hashlib.sha256(config).hexdigest()}"
+        manifest = json.dumps({"config": {"digest": config_digest}, "layers": []}).encode()
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if "/blobs/" in request.url.path:
+                return httpx.Response(200, content=config)
+            return httpx.Response(200, content=manifest)
+
+        blobs = BlobCache(cache_dir=tmp_path)
+        for _ in range(2):
+            registry = OCIRegistry(auth=RegistryAuth(), blob_cache=blobs)
+            registry._client = httpx.Client(transport=httpx.MockTransport(handler))
+            metadata = registry.get_metadata("ghcr.io/nim/model:1.0")
+            assert metadata.env == {"A": "1"}
+            # Without a Docker-Content-Digest header the body is hashed
+            assert metadata.digest.hash == hashlib.sha256(manifest).hexdigest()
+
+        assert [p for p in paths if "/blobs/" in p] == [f"/v2/nim/model/blobs/{config_digest}"]
+
+    def test_metadata_reused_within_ttl(self) -> None:
+        """Test that repeated metadata lookups do not refetch the image."""
+        requests: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if "/blobs/" in request.url.path:
+                return httpx.Response(200, json={"config": {"Labels": {"a": "b"}}})
+            return httpx.Response(200, json={"config": {"digest": "sha256:" + "c" * 64}})
+
+        registry = OCIRegistry(auth=RegistryAuth())
+        registry._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        first = registry.get_metadata("ghcr.io/nim/model:1.0")
+        assert registry.get_metadata("ghcr.io/nim/model:1.0") is first
+        assert len(requests) == 2
+
+        registry._metadata_cache["ghcr.io/nim/model:1.0"] = (-1e9, first)
+        assert registry.get_metadata("ghcr.io/nim/model:1.0") is not first
+        assert len(requests) == 4
+
+    def test_list_tags_revalidated_with_etag(self) -> None:
+        """Test that an unchanged tag list is served from cache on 304."""
+        seen: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"etag": '"v1"'}, json={"tags": ["2.0", "1.0"]})
+
+        registry = OCIRegistry(auth=RegistryAuth())
+        registry._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert registry.list_tags("ghcr.io/nim/model") == ["1.0", "2.0"]
+        assert registry.list_tags("ghcr.io/nim/model") == ["1.0", "2.0"]
+        assert seen == [None, '"v1"']
+
+
+class TestGetRegistryClient:
+    """Tests for get_registry_client."""
+
+    def test_one_client_per_host(self) -> None:
+        """Test that references on the same host share a client."""
+        first = get_registry_client("ghcr.io/nim/model:1.0")
+        assert get_registry_client("ghcr.io/other/model:2.0") is first
+        assert get_registry_client("quay.io/nim/model:1.0") is not first
+
+    def test_ngc_host_uses_ngc_client(self) -> None:
+        """Test that nvcr.io references get the NGC client."""
+        assert isinstance(get_registry_client("nvcr.io/nim/llama3:1.5.0"), NGCRegistry)
+
+    def test_nim_image_loaded_through_shared_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that NIMImage.from_registry fetches through the shared client."""
+        reference = "ghcr.io/nim/shared:1.0"
+        metadata = ImageMetadata(reference=reference, repository="nim/shared", tag="1.0")
+        client = get_registry_client(reference)
+        monkeypatch.setattr(
+            client, "get_metadata", lambda ref: metadata if ref == reference else None
+        )
+
+        assert NIMImage.from_registry(reference).metadata is metadata
+
+    def test_nim_image_registry_errors_become_value_errors(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that registry failures keep from_registry's ValueError contract."""
+        reference = "ghcr.io/nim/missing:1.0"
+
+        def fail(_reference: str) -> ImageMetadata:
+            raise RegistryError("not found")
+
+        monkeypatch.setattr(get_registry_client(reference), "get_metadata", fail)
+
+        with pytest.raises(ValueError, match="not found"):
+            NIMImage.from_registry(reference)
+
+
+class TestParseReference:
+    """Tests for parse_reference."""
+
+    @pytest.mark.parametrize(
+        ("reference", "expected"),
+        [
+            ("nginx", ImageReference(None, "nginx", None, None)),
+            ("nvcr.io/nim/llama3:1.5.0", ImageReference("nvcr.io", "nim/llama3", "1.5.0", None)),
+            ("library/nginx:latest", ImageReference(None, "library/nginx", "latest", None)),
+            ("localhost:5000/model", ImageReference("localhost:5000", "model", None, None)),
+            ("org/team/repo@sha256:ab", ImageReference("org", "team/repo", None, "sha256:ab")),
+        ],
+    )
+    def test_parse(self, reference: str, expected: ImageReference) -> None:
+        """Test splitting references into their components."""
+        assert parse_reference.__wrapped__(reference) == expected
+
+
+class TestParseTimestamp:
+    """Tests for parse_timestamp."""
+
+    def test_parses_nanosecond_utc(self) -> None:
+        """Test that Docker-style nanosecond "Z" timestamps parse."""
+        parsed = parse_timestamp("2024-01-02T03:04:05.123456789Z")
+        assert parsed is not None
+        assert (parsed.year, parsed.second, parsed.utcoffset()) == (2024, 5, timedelta(0))
+
+    @pytest.mark.parametrize("timestamp", [None, "", "not-a-date"])
+    def test_missing_or_malformed(self, timestamp: str | None) -> None:
+        """Test that missing or malformed timestamps give None."""
+        assert parse_timestamp(timestamp) is None
@@ -0,0 +1,251 @@
+"""Tests for output renderers."""
+
+import gc
+import io
+import json
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from nim_audit.models.diff import ChangeCategory, ChangeType, DiffEntry, DiffReport, Severity
+from nim_audit.models.fingerprint import PromptResponse
+from nim_audit.models.image import ImageDigest, ImageMetadata
+from nim_audit.renderers import (
+    JSONLRenderer,
+    JSONRenderer,
+    MarkdownRenderer,
+    OutputFormat,
+    RenderContext,
+    TerminalRenderer,
+    get_renderer,
+)
+from nim_audit.renderers.base import _JSON_DUMPS, model_json_dict
+
+
+class TestRenderToFile:
+    """Tests for BaseRenderer.render_to_file."""
+
+    def test_json_written_as_utf8(self, tmp_path):
+        """Test that file output matches render() and is UTF-8 encoded."""
+        path = tmp_path / "report.json"
+        context = RenderContext(output_path=path)
+        data = {"model": "llama3", "note": "café"}
+
+        JSONRenderer().render_to_file(data, context)
+
+        assert path.read_bytes().decode("utf-8") == JSONRenderer().render(data, context)
+
+    def test_jsonl_streamed_per_row(self, tmp_path):
+        """Test that JSONL output is produced one row at a time."""
+        path = tmp_path / "report.jsonl"
+        context = RenderContext(output_path=path)
+        rows = [{"i": i} for i in range(3)]
+        renderer = JSONLRenderer()
+
+        assert list(renderer.render_stream(rows, context)) == [
+            '{"i":0}',
+            "\n",
+            '{"i":1}',
+            "\n",
+            '{"i":2}',
+        ]
+
+        renderer.render_to_file(rows, context)
+        assert path.read_text(encoding="utf-8") == renderer.render(rows, context)
+
+
+class TestJSONRenderer:
+    """Tests for JSONRenderer."""
+
+    def test_model_rendered_like_its_json_dump(self):
+        """Test that models render the same as their JSON-mode dict."""
+        metadata = ImageMetadata(
+            reference="nvcr.io/nim/llama3:1.5.0", repository="nim/llama3", labels={"a": "é"}
+        )
+        for indent in (0, 2, 4):
+            context = RenderContext(indent=indent)
+            expected = JSONRenderer().render(metadata.model_dump(mode="json"), context)
+            assert JSONRenderer().render(metadata, context) == expected
+
+    def test_model_written_to_file_like_render(self, tmp_path):
+        """Test that file output of a model matches render()."""
+        metadata = ImageMetadata(
+            reference="nvcr.io/nim/llama3:1.5.0", repository="nim/llama3", labels={"a": "é"}
+        )
+        path = tmp_path / "metadata.json"
+        context = RenderContext(output_path=path, indent=2)
+
+        JSONRenderer().render_to_file(metadata, context)
+
+        assert path.read_text(encoding="utf-8") == JSONRenderer().render(metadata, context)
+
+    def test_serializer_handles_only_known_types(self):
+        """Test that leaf dataclasses are dumped and other objects are rejected."""
+        digest = ImageDigest(algorithm="sha256", hash="a" * 64)
+        context = RenderContext(indent=4)
+
+        rendered = JSONRenderer().render({"digest": digest}, context)
+        assert json.loads(rendered) == {"digest": digest.model_dump(mode="json")}
+
+        data = {"path": Path("/models"), "format": OutputFormat.JSON, "ids": {1}, "raw": b"ok"}
+        assert json.loads(JSONRenderer().render(data, context)) == {
+            "path": "/models",
+            "format": "json",
+            "ids": [1],
+            "raw": "6f6b",
+        }
+
+    def test_plain_payload_matches_model_json_dumps(self):
+        """Test that leaf dataclasses and labeled enums in plain data render as in models."""
+        entry = DiffEntry(
+            category=ChangeCategory.ENVIRONMENT,
+            change_type=ChangeType.MODIFIED,
+            path="env/NIM_ARGS",
+            old_value="a",
+            new_value="b",
+            severity=Severity.WARNING,
+            description="changed",
+        )
+        response = PromptResponse.from_text("greeting", "Hello!", "Hi there!")
+        data = {"entries": [entry], "response": response, "severity": Severity.INFO}
+        expected = {
+            "entries": [entry.model_dump(mode="json")],
+            "response": response.model_dump(mode="json"),
+            "severity": "info",
+        }
+
+        for indent in (0, 2, 4):
+            context = RenderContext(indent=indent)
+            assert json.loads(JSONRenderer().render(data, context)) == expected
+        line = JSONLRenderer().render([entry], RenderContext())
+        assert json.loads(line) == expected["entries"][0]
+
+        class Opaque:
+            def __init__(self):
+                self.secret = "x"
+
+        with pytest.raises(TypeError):
+            JSONRenderer().render({"value": Opaque()}, context)
+
+
+class TestMarkdownRenderer:
+    """Tests for MarkdownRenderer."""
+
+    def test_diff_cells_escaped_and_truncated(self):
+        """Test that long diff values are escaped, then cut to the cell width."""
+        image = ImageMetadata(reference="nvcr.io/nim/llama3:1.5.0", repository="nim/llama3")
+        value = "a|b\n" * 30
+        entry = DiffEntry(
+            category=ChangeCategory.ENVIRONMENT,
+            change_type=ChangeType.MODIFIED,
+            path="env/NIM_ARGS",
+            old_value=value,
+            new_value=None,
+            severity=Severity.INFO,
+            description="changed",
+        )
+        report = DiffReport.build(image, image, [entry])
+
+        output = MarkdownRenderer().render(report, RenderContext())
+
+        expected_old = value.replace("|", "\\|").replace("\n", " ")[:40]
+        assert f"| `env/NIM_ARGS` | {expected_old} | - |" in output
+
+    def test_diff_report_streamed_in_batches(self, tmp_path):
+        """Test that large diff reports are written in chunks matching render()."""
+        image = ImageMetadata(reference="nvcr.io/nim/llama3:1.5.0", repository="nim/llama3")
+        entries = [
+            DiffEntry(
+                category=ChangeCategory.ENVIRONMENT,
+                change_type=ChangeType.ADDED,
+                path=f"env/VAR_{i}",
+                old_value=None,
+                new_value=str(i),
+                severity=Severity.INFO,
+                description="added",
+            )
+            for i in range(2500)
+        ]
+        report = DiffReport.build(image, image, entries)
+        path = tmp_path / "report.md"
+        context = RenderContext(output_path=path)
+        renderer = MarkdownRenderer()
+
+        chunks = list(renderer.render_stream(report, context))
+        renderer.render_to_file(report, context)
+
+        expected = renderer.render(report, context)
+        assert len(chunks) > 2
+        assert "".join(chunks) == expected
+        assert path.read_text(encoding="utf-8") == expected
+
+
+class TestTerminalRenderer:
+    """Tests for TerminalRenderer."""
+
+    def test_report_written_in_one_batch(self):
+        """Test that a report's prints reach the terminal as a single write."""
+        writes: list[str] = []
+
+        class RecordingFile(io.StringIO):
+            def write(self, s):
+                writes.append(s)
+                return super().write(s)
+
+        stream = RecordingFile()
+        image = ImageMetadata(reference="nvcr.io/nim/llama3:1.5.0", repository="nim/llama3")
+        report = DiffReport.build(image, image, [])
+
+        TerminalRenderer(Console(file=stream, width=80)).render(report, RenderContext())
+
+        assert len(writes) == 1
+        assert "NIM Diff Report" in stream.getvalue()
+
+    def test_file_output_not_echoed(self, tmp_path, capsys):
+        """Test that rendering to a file prints nothing to the terminal."""
+        path = tmp_path / "report.txt"
+
+        TerminalRenderer().render_to_file({"model": "llama3"}, RenderContext(output_path=path))
+
+        assert "llama3" in path.read_text()
+        assert capsys.readouterr().out == ""
+
+    def test_file_output_leaves_console_untouched(self, tmp_path):
+        """Test that render_to_file never swaps the shared renderer's console."""
+        stream = io.StringIO()
+        console = Console(file=stream, width=80)
+        renderer = TerminalRenderer(console)
+
+        renderer.render_to_file({"model": "llama3"}, RenderContext(output_path=tmp_path / "r.txt"))
+
+        assert renderer._console is console
+        assert stream.getvalue() == ""
+
+
+class TestModelJsonDict:
+    """Tests for model_json_dict."""
+
+    def test_dump_shared_until_model_collected(self):
+        """Test that a frozen model is dumped once and evicted when freed."""
+        metadata = ImageMetadata(reference="nvcr.io/nim/llama3:1.5.0", repository="nim/llama3")
+        dump = model_json_dict(metadata)
+
+        assert dump == metadata.model_dump(mode="json")
+        assert model_json_dict(metadata) is dump
+
+        key = id(metadata)
+        del metadata
+        gc.collect()
+        assert key not in _JSON_DUMPS
+
+
+class TestGetRenderer:
+    """Tests for get_renderer."""
+
+    def test_instance_reused_per_format(self):
+        """Test that each format maps to one shared renderer."""
+        renderer = get_renderer("json")
+        assert isinstance(renderer, JSONRenderer)
+        assert get_renderer(OutputFormat.JSON) is renderer
+        assert get_renderer("html") is not renderer
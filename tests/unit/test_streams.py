@@ -0,0 +1,38 @@
+"""Unit tests for the stream helpers."""
+
+import io
+import tarfile
+
+from nim_audit.utils.streams import ChunkReader
+
+
+def _tar_bytes(files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buf.getvalue()
+
+
+class TestChunkReader:
+    """Tests for ChunkReader."""
+
+    def test_reads_across_chunks(self):
+        """Test reads return each chunk in turn, skipping empty ones."""
+        reader = ChunkReader([b"ab", b"", b"cde"])
+        assert reader.read(1) == b"a"
+        assert reader.read(3) == b"b"
+        assert reader.read() == b"cde"
+        assert reader.read() == b""
+
+    def test_streams_tar_members(self):
+        """Test tarfile can read a chunked archive in stream mode."""
+        data = _tar_bytes({"abc/layer.tar": b"layer", "manifest.json": b"{}"})
+        chunks = [data[i : i + 100] for i in range(0, len(data), 100)]
+
+        with tarfile.open(fileobj=ChunkReader(chunks), mode="r|") as tar:
+            contents = {m.name: tar.extractfile(m).read() for m in tar}
+
+        assert contents == {"abc/layer.tar": b"layer", "manifest.json": b"{}"}
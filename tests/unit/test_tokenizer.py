@@ -0,0 +1,106 @@
+"""Unit tests for the TokenizerExtractor."""
+
+import json
+import struct
+
+import pytest
+
+from nim_audit.extractors.tokenizer import TokenizerExtractor, _count_sp_pieces
+
+
+def _sp_piece(piece: str, score: float = 0.0) -> bytes:
+    """Encode a minimal SentencePiece submessage as ModelProto field 1."""
+    body = b"\x0a" + bytes([len(piece)]) + piece.encode() + b"\x15" + struct.pack("<f", score)
+    return b"\x0a" + bytes([len(body)]) + body
+
+
+class TestCountSentencePiecePieces:
+    """Tests for the sentencepiece wire-format reader."""
+
+    def test_counts_pieces(self):
+        """Test that each field-1 submessage is counted."""
+        buf = b"".join(_sp_piece(p) for p in ("<unk>", "<s>", "</s>", "a", "b"))
+        # Trailing trainer_spec (field 2) must not be counted
+        buf += b"\x12\x02\x08\x01"
+        assert _count_sp_pieces(buf) == 5
+
+    def test_empty_message(self):
+        """Test that an empty model has no pieces."""
+        assert _count_sp_pieces(b"") == 0
+
+    def test_truncated_message_raises(self):
+        """Test that truncated data is rejected."""
+        with pytest.raises(ValueError):
+            _count_sp_pieces(_sp_piece("hello")[:-2])
+
+
+class TestTokenizerExtractor:
+    """Tests for filesystem-based tokenizer extraction."""
+
+    @pytest.fixture
+    def container_fs(self, tmp_path):
+        """Create a fake container filesystem with tokenizer files."""
+        model_dir = tmp_path / "opt" / "nim" / "models" / "llama"
+        model_dir.mkdir(parents=True)
+        (model_dir / "tokenizer_config.json").write_text(
+            json.dumps({"tokenizer_class": "LlamaTokenizer", "bos_token": "<s>"})
+        )
+        (model_dir / "tokenizer.json").write_text(
+            json.dumps(
+                {
+                    "model": {"vocab": {"a": 0, "b": 1, "c": 2}},
+                    "added_tokens": [{"content": "<s>", "id": 1}, "ignored"],
+                }
+            )
+        )
+        (model_dir / "README.md").write_text("not a tokenizer file")
+        return tmp_path
+
+    def test_extract_from_fs(self, container_fs):
+        """Test extracting tokenizer info from a filesystem."""
+        result = TokenizerExtractor().extract("nvcr.io/nim/llama3:1.5.0", container_fs)
+
+        assert result.success
+        assert result.data["tokenizer_type"] == "LlamaTokenizer"
+        assert result.data["bos_token"] == "<s>"
+        assert result.data["vocab_size"] == 3
+        assert result.data["special_tokens"] == {"<s>": 1}
+        names = sorted(f["path"].rsplit("/", 1)[-1] for f in result.data["tokenizer_files"])
+        assert names == ["tokenizer.json", "tokenizer_config.json"]
+        assert all("hash" not in f for f in result.data["tokenizer_files"])
+
+    def test_extract_with_hashes(self, container_fs):
+        """Test that hashes are included when requested."""
+        result = TokenizerExtractor(compute_hashes=True).extract("nim/llama3", container_fs)
+
+        assert all(len(f["hash"]) == 16 for f in result.data["tokenizer_files"])
+
+    def test_extract_sentencepiece_model(self, tmp_path):
+        """Test that vocab size is read from tokenizer.model."""
+        model_dir = tmp_path / "models"
+        model_dir.mkdir()
+        (model_dir / "tokenizer.model").write_bytes(
+            b"".join(_sp_piece(p) for p in ("<unk>", "<s>", "</s>"))
+        )
+
+        result = TokenizerExtractor().extract("nim/llama3", tmp_path)
+
+        assert result.data["vocab_size"] == 3
+
+    def test_extract_symlinked_files(self, tmp_path):
+        """Test that symlinked tokenizer files, as in a HF cache snapshot, are found."""
+        repo = tmp_path / "models" / "hub" / "models--meta--llama"
+        blobs = repo / "blobs"
+        snapshot = repo / "snapshots" / "abc123"
+        blobs.mkdir(parents=True)
+        snapshot.mkdir(parents=True)
+        blob = blobs / "0f1e2d"
+        blob.write_text(json.dumps({"tokenizer_class": "LlamaTokenizer"}))
+        (snapshot / "tokenizer_config.json").symlink_to(blob)
+
+        result = TokenizerExtractor().extract("nim/llama3", tmp_path)
+
+        assert result.data["tokenizer_type"] == "LlamaTokenizer"
+        [file_info] = result.data["tokenizer_files"]
+        assert file_info["path"] == str(snapshot / "tokenizer_config.json")
+        assert file_info["size"] == blob.stat().st_size